@@ -1,11 +1,20 @@
 """Application factory for the creatives utilization dashboard."""
 from __future__ import annotations
 
+import gzip
 import time
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; Flask's stdlib-json provider is used otherwise
+    orjson = None
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -17,10 +26,64 @@ STATIC_DIR = BASE_DIR.parent / "static"
 # cached modules.
 ASSET_VERSION = str(int(time.time()))
 
+# API responses smaller than this are not worth the gzip CPU or header bytes.
+_GZIP_MIN_BYTES = 1024
+_GZIP_LEVEL = 5
+
+
+@cache
+def load_environment() -> None:
+    """Load ``.env`` into ``os.environ`` once per process.
+
+    The WSGI entry-point, the app factory and ``config`` all need the
+    environment loaded; memoizing means the file is only parsed once.
+    """
+    load_dotenv()
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with ``orjson`` when it can.
+
+    Output matches the default provider (sorted keys, dates as HTTP dates via
+    the same ``default`` hook); anything orjson rejects, and calls with extra
+    ``json.dumps`` options such as the debug-mode indent, fall back to it.
+    """
+
+    _OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if orjson is not None
+        else 0
+    )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # ``response()`` asks for compact separators, which is orjson's only format.
+        if kwargs.get("separators", (",", ":")) == (",", ":") and kwargs.keys() <= {"separators"}:
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._OPTIONS).decode("utf-8")
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Compact responses go straight from orjson's bytes to the body,
+        # skipping the decode / f-string / re-encode round trip the base
+        # class does on what can be a multi-megabyte dashboard payload.
+        if not ((self.compact is None and self._app.debug) or self.compact is False):
+            obj = self._prepare_response_obj(args, kwargs)
+            try:
+                body = orjson.dumps(
+                    obj, default=self.default, option=self._OPTIONS | orjson.OPT_APPEND_NEWLINE
+                )
+            except TypeError:
+                pass
+            else:
+                return self._app.response_class(body, mimetype=self.mimetype)
+        return super().response(*args, **kwargs)
+
 
 def create_app(config_object: str | None = None) -> Flask:
     """Create and configure the Flask application."""
-    load_dotenv()
+    load_environment()
 
     app = Flask(
         __name__,
@@ -28,6 +91,8 @@ def create_app(config_object: str | None = None) -> Flask:
         static_folder=str(STATIC_DIR),
         static_url_path="/static",
     )
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     if config_object:
         app.config.from_object(config_object)
@@ -44,6 +109,7 @@ def create_app(config_object: str | None = None) -> Flask:
 
     register_blueprints(app)
     register_error_handlers(app)
+    register_response_compression(app)
 
     return app
 
@@ -73,6 +139,38 @@ def register_error_handlers(app: Flask) -> None:
         )
 
 
+def register_response_compression(app: Flask) -> None:
+    """Gzip JSON API responses for clients that accept it.
+
+    Dashboard payloads repeat the same market/pool/BU strings per creative
+    and shrink several-fold compressed.
+    """
+
+    @app.after_request
+    def _gzip_api_response(response):
+        if (
+            not request.path.startswith("/api/")
+            or response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.mimetype != "application/json"
+            or "Content-Encoding" in response.headers
+            or "gzip" not in request.headers.get("Accept-Encoding", "").lower()
+        ):
+            return response
+        data = response.get_data()
+        if len(data) < _GZIP_MIN_BYTES:
+            return response
+        response.set_data(gzip.compress(data, compresslevel=_GZIP_LEVEL))
+        response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+        # The compressed body differs byte-wise from the identity one.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
 def register_blueprints(app: Flask) -> None:
     """Register all Flask blueprints for modular routing."""
     from .routes.auth import auth_bp
@@ -5,10 +5,12 @@ import os
 import re
 from dataclasses import dataclass
 
-from dotenv import load_dotenv
+from . import load_environment
 
 
-load_dotenv()
+load_environment()
+
+_EMAIL_WHITELIST_SPLIT_RE = re.compile(r"[,\s;]+")
 
 
 def _get_env(key: str, *, required: bool = True, default: str | None = None) -> str | None:
@@ -19,12 +21,12 @@ def _get_env(key: str, *, required: bool = True, default: str | None = None) ->
     return value
 
 
-def _parse_email_whitelist(raw: str | None) -> set[str]:
+def _parse_email_whitelist(raw: str | None) -> frozenset[str]:
     """Parse a comma/space-delimited whitelist string into normalized emails."""
     if not raw:
-        return set()
-    tokens = re.split(r"[,\s;]+", raw.strip())
-    return {token.strip().lower() for token in tokens if token.strip()}
+        return frozenset()
+    tokens = _EMAIL_WHITELIST_SPLIT_RE.split(raw.strip())
+    return frozenset(token.lower() for token in tokens if token)
 
 
 @dataclass(frozen=True)
@@ -37,6 +39,8 @@ class OdooSettings:
     api_key: str
     chunk_size: int
     timeout: float
+    transport: str = "xmlrpc"
+    max_records: int = 50000
 
 
 class Config:
@@ -54,7 +58,15 @@ class Config:
         raise RuntimeError("Missing required environment variable: ODOO_API_KEY (or legacy ODOO_PASSWORD)")
     ODOO_CHUNK_SIZE = int(os.getenv("ODOO_CHUNK_SIZE", "200"))
     ODOO_TIMEOUT_SECONDS = float(os.getenv("ODOO_TIMEOUT_SECONDS", "10"))
-    DASHBOARD_PASSWORD = _get_env("DASHBOARD_PASSWORD", required=False, default=None)
+    # Wire protocol for Odoo RPC: "xmlrpc" (default) or "jsonrpc" (/jsonrpc,
+    # much cheaper to decode for large search_read payloads).
+    ODOO_TRANSPORT = (os.getenv("ODOO_TRANSPORT") or "xmlrpc").strip().lower()
+    if ODOO_TRANSPORT not in ("xmlrpc", "jsonrpc"):
+        raise RuntimeError(f"Unsupported ODOO_TRANSPORT: {ODOO_TRANSPORT} (expected xmlrpc or jsonrpc)")
+    # Upper bound on records a single search_read_all may load (0 disables).
+    ODOO_MAX_RECORDS = int(os.getenv("ODOO_MAX_RECORDS", "50000"))
+    # Seconds a fetched creatives roster is reused across requests.
+    CREATIVES_ROSTER_TTL_SECONDS = float(os.getenv("CREATIVES_ROSTER_TTL", "60"))
     DASHBOARD_ALLOWED_EMAILS = _parse_email_whitelist(os.getenv("DASHBOARD_ALLOWED_EMAILS", ""))
     # Comma-separated hr.department names (case-insensitive) allowed to see Creatives Market filter
     DASHBOARD_MARKET_FILTER_DEPARTMENT = (os.getenv("DASHBOARD_MARKET_FILTER_DEPARTMENT") or "Operations,AI").strip()
@@ -92,4 +104,6 @@ class Config:
             api_key=cls.ODOO_API_KEY,
             chunk_size=cls.ODOO_CHUNK_SIZE,
             timeout=cls.ODOO_TIMEOUT_SECONDS,
+            transport=cls.ODOO_TRANSPORT,
+            max_records=cls.ODOO_MAX_RECORDS,
         )
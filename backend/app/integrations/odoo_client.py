@@ -1,19 +1,44 @@
-"""Odoo XML-RPC client with chunked retrieval helpers."""
+"""Odoo XML-RPC / JSON-RPC client with chunked retrieval helpers."""
 from __future__ import annotations
 
+import hashlib
+import itertools
+import json
+import os
 import socket
 import threading
+import time
 import xmlrpc.client
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from ..config import OdooSettings
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
 
 class OdooUnavailableError(RuntimeError):
     """Raised when the Odoo backend cannot be reached."""
 
 
+class OdooResultTooLargeError(OdooUnavailableError):
+    """Raised when a bulk read would exceed ``OdooSettings.max_records``.
+
+    Subclasses OdooUnavailableError so routes that already degrade on an
+    unreachable Odoo treat a runaway query the same way.
+    """
+
+
 # The XML-RPC uid is the Odoo user's database id: it never expires and every
 # execute_kw call re-verifies credentials server-side. Caching it per
 # (url, db, username, api_key) lets short-lived clients (one per worker
@@ -21,10 +46,68 @@ class OdooUnavailableError(RuntimeError):
 _UID_CACHE: Dict[Tuple[str, str, str, str], int] = {}
 _UID_CACHE_LOCK = threading.Lock()
 
+# Recently verified user logins, so bursts of session re-checks do not each
+# pay Odoo's deliberately slow authenticate. Only successes are cached (a
+# revoked password must fail on the next check after the TTL), and entries
+# are keyed by a blake2b hash with a per-process random key, so neither
+# passwords nor offline-crackable digests are kept in memory.
+_VERIFIED_LOGINS: Dict[bytes, Tuple[float, int]] = {}
+_VERIFIED_LOGINS_LOCK = threading.Lock()
+_VERIFIED_LOGINS_TTL_SECONDS = 60.0
+_VERIFIED_LOGINS_MAX_ENTRIES = 1024
+_VERIFIED_LOGINS_KEY = os.urandom(32)
+
+# Object endpoints that rejected ``system.multicall``. Stock Odoo dispatches
+# /xmlrpc/2/object straight to execute/execute_kw, so the probe fails there;
+# remembering it keeps later batches from paying a wasted round-trip.
+_MULTICALL_UNSUPPORTED: Set[str] = set()
+
+# One ``execute_kw`` call: (model, method, args, kwargs).
+OdooCall = Tuple[str, str, List[Any], Dict[str, Any]]
+
+# Long-lived pool for fanning out independent calls (e.g. the pages of a
+# search_read_all). XML-RPC transports are not thread-safe, so each worker
+# thread keeps its own client; reusing it across batches also keeps its
+# HTTP connection warm.
+_PAGE_POOL = ThreadPoolExecutor(max_workers=6, thread_name_prefix="odoo-pages")
+_THREAD_STATE = threading.local()
+
+
+# The stdlib parser is fed 1 KiB at a time, i.e. tens of thousands of
+# Python-level read/feed calls for a large search_read page. Feeding expat
+# big blocks keeps the per-call overhead out of the decode loop.
+_RESPONSE_READ_SIZE = 64 * 1024
+
+
+class _BlockParseMixin:
+    """Parse XML-RPC responses in large blocks instead of 1 KiB reads."""
+
+    def parse_response(self, response):  # type: ignore[no-untyped-def]
+        if hasattr(response, "getheader") and response.getheader("Content-Encoding", "") == "gzip":
+            stream = xmlrpc.client.GzipDecodedResponse(response)
+        else:
+            stream = response
+
+        parser, unmarshaller = self.getparser()
+        while True:
+            data = stream.read(_RESPONSE_READ_SIZE)
+            if not data:
+                break
+            parser.feed(data)
+
+        if stream is not response:
+            stream.close()
+        parser.close()
+        return unmarshaller.close()
+
 
-class _TimeoutTransport(xmlrpc.client.Transport):
+class _TimeoutTransport(_BlockParseMixin, xmlrpc.client.Transport):
     """HTTP transport with per-connection timeouts."""
 
+    # Ask Odoo to gzip responses: search_read payloads are repetitive XML and
+    # shrink several-fold on the wire. Decompression is handled by xmlrpc.
+    accept_gzip_encoding = True
+
     def __init__(self, timeout: float):
         super().__init__()
         self._timeout = timeout
@@ -39,9 +122,11 @@ class _TimeoutTransport(xmlrpc.client.Transport):
         return connection
 
 
-class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
+class _TimeoutSafeTransport(_BlockParseMixin, xmlrpc.client.SafeTransport):
     """HTTPS transport with per-connection timeouts."""
 
+    accept_gzip_encoding = True
+
     def __init__(self, timeout: float):
         super().__init__()
         self._timeout = timeout
@@ -55,6 +140,53 @@ class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
         return connection
 
 
+def _marshal_params(values: Tuple[Any, ...]) -> str:
+    """XML-RPC ``<param>`` elements for ``values`` (without the ``<params>`` wrapper)."""
+    marshalled = xmlrpc.client.Marshaller("utf-8", allow_none=True).dumps(values)
+    return marshalled[len("<params>\n"):-len("</params>\n")]
+
+
+class _ExecuteKwMethod:
+    """``execute_kw`` over XML-RPC with the credential prefix marshalled once.
+
+    Every integration-account call starts with the same ``(db, uid,
+    password)`` triple; its XML is cached and only the model/method/args/kwargs
+    tail is marshalled per call. Calls made with an end user's credentials go
+    through ``uncached`` so their password is never kept on the (pooled,
+    long-lived) client. The request body is byte-for-byte what ``ServerProxy``
+    would send.
+    """
+
+    _HEAD = "<?xml version='1.0'?>\n<methodCall>\n<methodName>execute_kw</methodName>\n<params>\n"
+    _TAIL = "</params>\n</methodCall>\n"
+
+    def __init__(self, url: str, transport: xmlrpc.client.Transport):
+        parsed = urlparse(url)
+        self._host = parsed.netloc
+        self._handler = parsed.path or "/RPC2"
+        self._transport = transport
+        self._prefix_key: Optional[Tuple[Any, ...]] = None
+        self._prefix = ""
+
+    def __call__(self, db: str, uid: int, password: str, *rest: Any) -> Any:
+        key = (db, uid, password)
+        if key != self._prefix_key:
+            self._prefix = _marshal_params(key)
+            self._prefix_key = key
+        return self._send(self._prefix + _marshal_params(rest))
+
+    def uncached(self, db: str, uid: int, password: str, *rest: Any) -> Any:
+        """Same call, marshalled in full without touching the cached prefix."""
+        return self._send(_marshal_params((db, uid, password) + rest))
+
+    def _send(self, params: str) -> Any:
+        body = (self._HEAD + params + self._TAIL).encode("utf-8", "xmlcharrefreplace")
+        response = self._transport.request(self._host, self._handler, body)
+        if len(response) == 1:
+            response = response[0]
+        return response
+
+
 def _transport_for_url(url: str, timeout: float) -> xmlrpc.client.Transport:
     """Select an appropriate transport implementation for the given URL."""
     scheme = urlparse(url).scheme.lower()
@@ -63,8 +195,94 @@ def _transport_for_url(url: str, timeout: float) -> xmlrpc.client.Transport:
     return _TimeoutTransport(timeout)
 
 
+# Page sizes learned by search_read_chunked per query shape (server, model,
+# fields and the domain's field/operator leaves): a page that comes back fast
+# is doubled, a slow one halved, so wide records stay clear of the RPC timeout
+# while narrow ones amortize the per-call round-trip. Later calls for the same
+# shape start from the learned size unless they pass an explicit chunk_size.
+_LEARNED_CHUNK_SIZES: Dict[Tuple[Any, ...], int] = {}
+_CHUNK_SIZE_MIN = 50
+_CHUNK_SIZE_MAX = 5000
+_CHUNK_FAST_SECONDS = 0.3
+_CHUNK_SLOW_SECONDS = 2.0
+
+# Context sent with bulk reads unless a caller opts out (``lean=False``):
+# binary fields come back as sizes instead of base64 payloads, and the ORM
+# skips prefetching columns nobody asked for while resolving relations.
+_LEAN_READ_CONTEXT: Dict[str, Any] = {"bin_size": True, "prefetch_fields": False}
+
+
+def _tuned_chunk_size(size: int, elapsed: float) -> int:
+    """Next page size after a full page of ``size`` records took ``elapsed`` seconds."""
+    if elapsed < _CHUNK_FAST_SECONDS:
+        return min(size * 2, _CHUNK_SIZE_MAX)
+    if elapsed > _CHUNK_SLOW_SECONDS:
+        return max(size // 2, _CHUNK_SIZE_MIN)
+    return size
+
+
+def _domain_shape(domain: List[Any]) -> Tuple[Any, ...]:
+    """The domain's operators and (field, operator) leaves, without their values."""
+    return tuple(
+        (leaf[0], leaf[1]) if isinstance(leaf, (list, tuple)) and len(leaf) == 3 else leaf
+        for leaf in domain
+    )
+
+
+def _as_list(values: Optional[Iterable[Any]]) -> List[Any]:
+    """Forward lists untouched; only materialize other iterables (or ``None``)."""
+    if isinstance(values, list):
+        return values
+    return list(values or [])
+
+
+def _verified_login_key(settings: OdooSettings, username: str, password: str) -> bytes:
+    # Deliberately not memoized: a cache would hold the raw password as a key.
+    material = "\0".join((settings.url, settings.db, username, password)).encode("utf-8")
+    return hashlib.blake2b(material, key=_VERIFIED_LOGINS_KEY, digest_size=16).digest()
+
+
+@lru_cache(maxsize=64)
+def _with_stable_order(spec: Optional[str]) -> str:
+    """Ensure the search order is stable across paginated requests.
+
+    Pure function of a handful of distinct order strings, so it is memoized.
+    """
+    if not spec or not spec.strip():
+        return "id asc"
+
+    segments = [segment.strip() for segment in spec.split(",") if segment.strip()]
+    normalized = {segment.split(None, 1)[0].lower() for segment in segments}
+    if "id" not in normalized:
+        segments.append("id asc")
+    return ", ".join(segments)
+
+
+def _thread_client(settings: OdooSettings) -> "OdooClient":
+    """Return this worker thread's client for ``settings``, creating it on first use."""
+    client: Optional[OdooClient] = getattr(_THREAD_STATE, "client", None)
+    if client is None or client.settings != settings:
+        client = OdooClient(settings)
+        _THREAD_STATE.client = client
+    return client
+
+
+def _execute_on_thread_client(settings: OdooSettings, call: OdooCall) -> Any:
+    model, method, args, kwargs = call
+    return _thread_client(settings).execute_kw(model, method, args, kwargs)
+
+
 class OdooClient:
-    """Lightweight wrapper around Odoo's XML-RPC API."""
+    """Lightweight wrapper around Odoo's XML-RPC API.
+
+    Constructing an ``OdooClient`` with ``settings.transport == "jsonrpc"``
+    returns a :class:`JsonOdooClient`, so call sites stay transport-agnostic.
+    """
+
+    def __new__(cls, settings: OdooSettings):
+        if cls is OdooClient and settings.transport == "jsonrpc":
+            cls = JsonOdooClient
+        return super().__new__(cls)
 
     def __init__(self, settings: OdooSettings):
         self.settings = settings
@@ -72,10 +290,16 @@ class OdooClient:
         self._timeout = float(settings.timeout)
         common_url = f"{base_url}/xmlrpc/2/common"
         object_url = f"{base_url}/xmlrpc/2/object"
-        common_transport = _transport_for_url(common_url, self._timeout)
-        object_transport = _transport_for_url(object_url, self._timeout)
-        self._common = xmlrpc.client.ServerProxy(common_url, allow_none=True, transport=common_transport)
-        self._models = xmlrpc.client.ServerProxy(object_url, allow_none=True, transport=object_transport)
+        # Both endpoints live on the same host, so one transport serves them:
+        # xmlrpc keeps its HTTP/1.1 connection open between calls, and sharing
+        # it means a client pays a single TCP/TLS handshake instead of two.
+        transport = _transport_for_url(base_url, self._timeout)
+        self._common = xmlrpc.client.ServerProxy(common_url, allow_none=True, transport=transport)
+        self._models = xmlrpc.client.ServerProxy(object_url, allow_none=True, transport=transport)
+        # The hot path bypasses ServerProxy (which builds a method proxy per
+        # attribute access) and reuses the marshalled credential prefix.
+        self._execute_kw = _ExecuteKwMethod(object_url, transport)
+        self._object_url = object_url
         self._uid: Optional[int] = None
 
     def authenticate(self) -> int:
@@ -108,7 +332,7 @@ class OdooClient:
             self._uid = uid
         return self._uid
 
-    def verify_user_credentials(self, username: str, password: str) -> bool:
+    def verify_user_credentials(self, username: str, password: str) -> Optional[int]:
         """Verify user credentials against Odoo without caching the UID.
         
         This method is used to verify user login credentials without affecting
@@ -119,8 +343,14 @@ class OdooClient:
             password: Odoo password
             
         Returns:
-            True if credentials are valid, False otherwise
+            The user's Odoo uid if credentials are valid, None otherwise
         """
+        key = _verified_login_key(self.settings, username, password)
+        now = time.monotonic()
+        with _VERIFIED_LOGINS_LOCK:
+            cached = _VERIFIED_LOGINS.get(key)
+        if cached is not None and now - cached[0] < _VERIFIED_LOGINS_TTL_SECONDS:
+            return cached[1]
         try:
             uid = self._common.authenticate(
                 self.settings.db,
@@ -128,13 +358,19 @@ class OdooClient:
                 password,
                 {},
             )
-            return bool(uid)
+            if uid:
+                with _VERIFIED_LOGINS_LOCK:
+                    _VERIFIED_LOGINS.pop(key, None)
+                    _VERIFIED_LOGINS[key] = (now, uid)
+                    while len(_VERIFIED_LOGINS) > _VERIFIED_LOGINS_MAX_ENTRIES:
+                        _VERIFIED_LOGINS.pop(next(iter(_VERIFIED_LOGINS)))
+            return uid or None
         except (socket.timeout, OSError, xmlrpc.client.ProtocolError):
             # Network/connection errors - treat as invalid for security
-            return False
+            return None
         except Exception:
             # Any other error - treat as invalid
-            return False
+            return None
 
     def execute_kw_as_user(
         self,
@@ -149,7 +385,7 @@ class OdooClient:
         args = args or []
         kwargs = kwargs or {}
         try:
-            return self._models.execute_kw(
+            return self._execute_kw.uncached(
                 self.settings.db,
                 int(user_uid),
                 user_password,
@@ -169,35 +405,81 @@ class OdooClient:
         kwargs: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """Execute an arbitrary Odoo model method."""
-        args = args or []
-        kwargs = kwargs or {}
-        uid = self.authenticate()
+        uid = self._uid
+        if uid is None:
+            uid = self.authenticate()
         try:
-            return self._models.execute_kw(
+            return self._execute_kw(
                 self.settings.db,
                 uid,
                 self.settings.api_key,
                 model,
                 method,
-                args,
-                kwargs,
+                args or [],
+                kwargs or {},
             )
         except (socket.timeout, OSError, xmlrpc.client.ProtocolError) as exc:
             raise OdooUnavailableError("Odoo API request failed due to a connection error.") from exc
 
-    def search(self, model: str, domain: Iterable[Any], *, limit: Optional[int] = None) -> List[int]:
+    def multicall(self, calls: Sequence[OdooCall]) -> List[Any]:
+        """Run several ``execute_kw`` calls, batched into one round-trip when possible.
+
+        Results come back in call order. Servers without ``system.multicall``
+        get the calls issued concurrently on the shared page pool instead.
+        """
+        if not calls:
+            return []
+        if len(calls) == 1:
+            model, method, args, kwargs = calls[0]
+            return [self.execute_kw(model, method, args, kwargs)]
+        if self._object_url in _MULTICALL_UNSUPPORTED:
+            return self._execute_parallel(calls)
+
+        uid = self.authenticate()
+        batch = xmlrpc.client.MultiCall(self._models)
+        for model, method, args, kwargs in calls:
+            batch.execute_kw(self.settings.db, uid, self.settings.api_key, model, method, args, kwargs)
+        try:
+            results = batch()
+        except xmlrpc.client.Fault:
+            _MULTICALL_UNSUPPORTED.add(self._object_url)
+            return self._execute_parallel(calls)
+        except (socket.timeout, OSError, xmlrpc.client.ProtocolError) as exc:
+            raise OdooUnavailableError("Odoo API request failed due to a connection error.") from exc
+        # Iterating re-raises any per-call fault, matching execute_kw.
+        return list(results)
+
+    def _execute_parallel(self, calls: Sequence[OdooCall]) -> List[Any]:
+        """Issue independent calls side by side, one pooled client per worker thread."""
+        futures = [_PAGE_POOL.submit(_execute_on_thread_client, self.settings, call) for call in calls]
+        return [future.result() for future in futures]
+
+    def search_count(self, model: str, domain: Iterable[Any]) -> int:
+        """Count records matching a domain."""
+        return int(self.execute_kw(model, "search_count", [_as_list(domain)]))
+
+    def search(
+        self,
+        model: str,
+        domain: Iterable[Any],
+        *,
+        limit: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[int]:
         """Search for records matching a domain."""
         kwargs: Dict[str, Any] = {}
         if limit is not None:
             kwargs["limit"] = limit
-        return self.execute_kw(model, "search", [list(domain)], kwargs)
+        if order:
+            kwargs["order"] = order
+        return self.execute_kw(model, "search", [_as_list(domain)], kwargs)
 
     def read(self, model: str, ids: Iterable[int], fields: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """Read specific fields for a set of ids."""
         kwargs: Dict[str, Any] = {}
         if fields is not None:
-            kwargs["fields"] = list(fields)
-        return self.execute_kw(model, "read", [list(ids)], kwargs)
+            kwargs["fields"] = _as_list(fields)
+        return self.execute_kw(model, "read", [_as_list(ids)], kwargs)
 
     def search_read_chunked(
         self,
@@ -207,39 +489,84 @@ class OdooClient:
         fields: Optional[Iterable[str]] = None,
         order: Optional[str] = None,
         chunk_size: Optional[int] = None,
+        lean: bool = True,
+        limit: Optional[int] = None,
     ) -> Iterator[List[Dict[str, Any]]]:
-        """Yield search_read results in chunks to handle large datasets."""
-        effective_domain = list(domain or [])
-        requested_fields = list(fields or [])
-        size = chunk_size or self.settings.chunk_size
+        """Yield search_read results in chunks to handle large datasets.
+
+        ``limit`` caps the total number of records yielded; when it fits in a
+        single page only one request is made.
+
+        When the order is by ``id`` alone (the default), pages are fetched by
+        keyset (``id > last seen id``) so each page is an index seek instead
+        of an ever-growing ``OFFSET`` scan; other orders fall back to offsets.
+        ``lean`` sends :data:`_LEAN_READ_CONTEXT` so the server does no work
+        for data the caller did not request. The page size adapts to the
+        observed latency (see :data:`_LEARNED_CHUNK_SIZES`) unless the caller
+        passes an explicit ``chunk_size``, which is used as-is.
+        """
+        effective_domain = _as_list(domain)
+        requested_fields = _as_list(fields)
+        shape: Optional[Tuple[Any, ...]] = None
+        if chunk_size:
+            size = chunk_size
+        else:
+            shape = (
+                self.settings.url,
+                self.settings.db,
+                model,
+                tuple(requested_fields),
+                _domain_shape(effective_domain),
+            )
+            size = _LEARNED_CHUNK_SIZES.get(shape) or self.settings.chunk_size
         offset = 0
-
-        def _with_stable_order(spec: Optional[str]) -> str:
-            """Ensure the search order is stable across paginated requests."""
-            if not spec or not spec.strip():
-                return "id asc"
-
-            segments = [segment.strip() for segment in spec.split(",") if segment.strip()]
-            normalized = {segment.split()[0].lower() for segment in segments}
-            if "id" not in normalized:
-                segments.append("id asc")
-            return ", ".join(segments)
-
         stable_order = _with_stable_order(order)
-
+        keyset = stable_order == "id asc"
+        # Only the offset / id bound changes between pages; the call args are built once.
+        args = [effective_domain]
+        kwargs: Dict[str, Any] = {"fields": requested_fields, "limit": size, "order": stable_order}
+        if lean:
+            kwargs["context"] = _LEAN_READ_CONTEXT
+
+        if limit is not None and limit <= size:
+            if limit > 0:
+                kwargs["limit"] = limit
+                batch = self.execute_kw(model, "search_read", args, kwargs)
+                if batch:
+                    yield batch
+            return
+
+        remaining = limit
         while True:
-            kwargs: Dict[str, Any] = {"fields": requested_fields, "limit": size, "offset": offset, "order": stable_order}
-            batch = self.execute_kw(model, "search_read", [effective_domain], kwargs)
+            page_limit = size if remaining is None else min(size, remaining)
+            kwargs["limit"] = page_limit
+            if not keyset:
+                kwargs["offset"] = offset
+            started = time.monotonic()
+            batch = self.execute_kw(model, "search_read", args, kwargs)
+            elapsed = time.monotonic() - started
             if not batch:
                 break
 
             yield batch
 
-            if len(batch) < size:
+            if len(batch) < page_limit:
                 break
-            offset += size
-
-    def search_read_all(
+            if remaining is not None:
+                remaining -= len(batch)
+                if remaining <= 0:
+                    break
+            if keyset:
+                args = [effective_domain + [("id", ">", batch[-1]["id"])]]
+            else:
+                offset += len(batch)
+            if shape is not None:
+                tuned = _tuned_chunk_size(size, elapsed)
+                if tuned != size:
+                    size = tuned
+                    _LEARNED_CHUNK_SIZES[shape] = size
+
+    def search_read_iter(
         self,
         model: str,
         domain: Optional[Iterable[Any]] = None,
@@ -247,17 +574,107 @@ class OdooClient:
         fields: Optional[Iterable[str]] = None,
         order: Optional[str] = None,
         chunk_size: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Collect all chunks into a single list."""
-        records: List[Dict[str, Any]] = []
+        lean: bool = True,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield matching records one at a time.
+
+        For single-pass consumers (filters, counters, lookups): at most one
+        page of records is resident, unlike :meth:`search_read_all`.
+        """
         for batch in self.search_read_chunked(
             model,
             domain=domain,
             fields=fields,
             order=order,
             chunk_size=chunk_size,
+            lean=lean,
+            limit=limit,
         ):
-            records.extend(batch)
+            yield from batch
+
+    def search_read_columns(
+        self,
+        model: str,
+        domain: Optional[Iterable[Any]] = None,
+        *,
+        fields: Sequence[str],
+        order: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        lean: bool = True,
+    ) -> Dict[str, List[Any]]:
+        """Collect matching records column-wise: ``{field: [value per record]}``.
+
+        Consumers that scan a few fields across many rows can ``zip`` the
+        columns instead of keeping one dict per record alive. ``id`` is always
+        included. Missing values are ``None``.
+        """
+        names = list(dict.fromkeys(["id", *fields]))
+        columns: Dict[str, List[Any]] = {name: [] for name in names}
+        appenders = [(name, columns[name].append) for name in names]
+        for batch in self.search_read_chunked(
+            model,
+            domain=domain,
+            fields=fields,
+            order=order,
+            chunk_size=chunk_size,
+            lean=lean,
+        ):
+            for record in batch:
+                get = record.get
+                for name, append in appenders:
+                    append(get(name))
+        return columns
+
+    def search_read_all(
+        self,
+        model: str,
+        domain: Optional[Iterable[Any]] = None,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        order: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        lean: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Collect every matching record, fetching all pages in one batch.
+
+        Loads are capped at ``settings.max_records`` (fetching one id past
+        the cap detects overflow without counting the whole table).
+        One ``search`` returns the ordered ids up front; the ids are split
+        into pages whose ``read`` calls (primary-key lookups, no ``OFFSET``)
+        are dispatched through :meth:`multicall` at once (batched or fetched
+        concurrently) instead of paging one round-trip at a time. ``read``
+        keeps the order of the ids it is given, so the result is ordered.
+        """
+        effective_domain = _as_list(domain)
+        requested_fields = _as_list(fields)
+        size = chunk_size or self.settings.chunk_size
+        stable_order = _with_stable_order(order)
+
+        max_records = self.settings.max_records
+        ids = self.search(
+            model,
+            effective_domain,
+            order=stable_order,
+            limit=max_records + 1 if max_records > 0 else None,
+        )
+        if not ids:
+            return []
+        if max_records > 0 and len(ids) > max_records:
+            raise OdooResultTooLargeError(
+                f"Refusing to fetch more than {max_records} {model} records; "
+                "narrow the domain or use search_read_chunked."
+            )
+        page_kwargs: Dict[str, Any] = {"fields": requested_fields}
+        if lean:
+            page_kwargs["context"] = _LEAN_READ_CONTEXT
+        calls: List[OdooCall] = [
+            (model, "read", [ids[start:start + size]], page_kwargs)
+            for start in range(0, len(ids), size)
+        ]
+        records: List[Dict[str, Any]] = []
+        for batch in self.multicall(calls):
+            records.extend(batch or [])
         return records
 
     def close(self) -> None:
@@ -272,4 +689,184 @@ class OdooClient:
                     continue
         self._common = None  # type: ignore[assignment]
         self._models = None  # type: ignore[assignment]
+        self._execute_kw = None  # type: ignore[assignment]
         self._uid = None
+
+
+# Guards lazy creation of the shared pools in OdooClientPool.for_app/for_settings.
+_APP_POOL_LOCK = threading.Lock()
+_SETTINGS_POOLS: Dict[OdooSettings, "OdooClientPool"] = {}
+
+
+class OdooClientPool:
+    """Idle clients kept for reuse across requests.
+
+    Each request checks out a client for its exclusive use (XML-RPC
+    transports are not thread-safe) and returns it when done, so its warm
+    HTTP connection and cached uid serve the next request instead of a new
+    TCP/TLS handshake. xmlrpc retries once if a kept-alive connection was
+    dropped by the server while idle.
+    """
+
+    def __init__(self, settings: OdooSettings, max_idle: int = 8):
+        self.settings = settings
+        self._max_idle = max_idle
+        self._idle: List[OdooClient] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_app(cls, app: Any) -> "OdooClientPool":
+        """The pool shared by every request of a Flask ``app``, created on first use."""
+        pool = app.extensions.get("odoo_client_pool")
+        if pool is None:
+            with _APP_POOL_LOCK:
+                pool = app.extensions.get("odoo_client_pool")
+                if pool is None:
+                    pool = cls._for_settings_locked(app.config["ODOO_SETTINGS"])
+                    app.extensions["odoo_client_pool"] = pool
+        return pool
+
+    @classmethod
+    def for_settings(cls, settings: OdooSettings) -> "OdooClientPool":
+        """The process-wide pool for ``settings``; usable outside an app context."""
+        pool = _SETTINGS_POOLS.get(settings)
+        if pool is None:
+            with _APP_POOL_LOCK:
+                pool = cls._for_settings_locked(settings)
+        return pool
+
+    @classmethod
+    def _for_settings_locked(cls, settings: OdooSettings) -> "OdooClientPool":
+        pool = _SETTINGS_POOLS.get(settings)
+        if pool is None:
+            pool = cls(settings)
+            _SETTINGS_POOLS[settings] = pool
+        return pool
+
+    def acquire(self) -> OdooClient:
+        """Check out an idle client, or create one if none is available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return OdooClient(self.settings)
+
+    def release(self, client: OdooClient) -> None:
+        """Return a client checked out with :meth:`acquire`; surplus clients are closed."""
+        if client.settings == self.settings:
+            with self._lock:
+                if len(self._idle) < self._max_idle:
+                    self._idle.append(client)
+                    return
+        client.close()
+
+    @contextmanager
+    def checkout(self) -> Iterator[OdooClient]:
+        """``with pool.checkout() as client:`` -- acquire, and release on exit."""
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _JsonRpcProxy:
+    """``ServerProxy`` look-alike for one service of Odoo's ``/jsonrpc`` endpoint.
+
+    Errors mirror xmlrpc so callers need no transport-specific handling:
+    server exceptions raise ``xmlrpc.client.Fault`` and HTTP failures raise
+    ``xmlrpc.client.ProtocolError`` (``requests`` connection errors are
+    already ``OSError`` subclasses).
+    """
+
+    _HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+    def __init__(self, session: requests.Session, url: str, service: str, timeout: float):
+        self._session = session
+        self._url = url
+        self._service = service
+        self._timeout = timeout
+        self._ids = itertools.count(1)
+
+    def __getattr__(self, method: str):
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def call(*args: Any) -> Any:
+            return self._call(method, list(args))
+
+        return call
+
+    def _call(self, method: str, args: List[Any]) -> Any:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"service": self._service, "method": method, "args": args},
+            "id": next(self._ids),
+        }
+        response = self._session.post(
+            self._url, data=_json_dumps(payload), headers=self._HEADERS, timeout=self._timeout
+        )
+        if response.status_code >= 400:
+            raise xmlrpc.client.ProtocolError(
+                self._url, response.status_code, response.reason or "", dict(response.headers)
+            )
+        body = _json_loads(response.content)
+        error = body.get("error")
+        if error:
+            data = error.get("data") or {}
+            message = data.get("message") or error.get("message") or "Odoo JSON-RPC error"
+            raise xmlrpc.client.Fault(error.get("code", 1), f"{data.get('name', '')}: {message}".lstrip(": "))
+        return body.get("result")
+
+    def close(self) -> None:
+        self._session.close()
+
+
+class JsonOdooClient(OdooClient):
+    """OdooClient speaking JSON-RPC (``/jsonrpc``) instead of XML-RPC.
+
+    JSON is much cheaper than XML-RPC to encode and decode for large
+    ``search_read`` payloads (and uses ``orjson`` when installed); a pooled
+    ``requests.Session`` keeps the connection alive between calls.
+    """
+
+    def __init__(self, settings: OdooSettings):
+        self.settings = settings
+        base_url = settings.url.rstrip("/")
+        self._timeout = float(settings.timeout)
+        jsonrpc_url = f"{base_url}/jsonrpc"
+        session = requests.Session()
+        # One kept-alive connection per client is enough (a client serves one
+        # thread at a time). Only failed connects are retried: a POST that
+        # reached Odoo may have had side effects and must not be replayed.
+        session.mount(
+            base_url.split("://", 1)[0] + "://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=2,
+                max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2),
+            ),
+        )
+        self._common = _JsonRpcProxy(session, jsonrpc_url, "common", self._timeout)  # type: ignore[assignment]
+        self._models = _JsonRpcProxy(session, jsonrpc_url, "object", self._timeout)  # type: ignore[assignment]
+        self._execute_kw = self._models.execute_kw
+        self._object_url = jsonrpc_url
+        self._uid: Optional[int] = None
+
+    def multicall(self, calls: Sequence[OdooCall]) -> List[Any]:
+        """Odoo's ``/jsonrpc`` has no batch form, so fan calls out concurrently."""
+        if len(calls) > 1:
+            return self._execute_parallel(calls)
+        return super().multicall(calls)
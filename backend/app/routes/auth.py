@@ -1,14 +1,25 @@
 """Authentication routes for dashboard access control."""
 from __future__ import annotations
 
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
 from functools import wraps
+from typing import Callable
 
-from flask import Blueprint, Response, current_app, jsonify, make_response, request, session
+from flask import Blueprint, Response, current_app, g, jsonify, make_response, request, session
 
 from ..integrations import odoo_web_auth
-from ..integrations.odoo_client import OdooClient, OdooUnavailableError
+from ..integrations.odoo_client import OdooClient, OdooClientPool, OdooUnavailableError
+from ..services.auth_token_service import AuthTokenService
+from ..services.login_tracking_service import LoginTrackingService
 
 auth_bp = Blueprint("auth", __name__)
+logger = logging.getLogger(__name__)
 ACCESS_DENIED_MESSAGE = "Access restricted. Please contact the AI team for permissions."
 # Pending 2FA login parked between the password step and the code step.
 TOTP_PENDING_SESSION_KEY = "dashboard_totp_pending"
@@ -29,16 +40,23 @@ def require_sales_auth(f):
     return decorated
 
 
-def _get_email_whitelist() -> set[str]:
-    allowed_emails = current_app.config.get("DASHBOARD_ALLOWED_EMAILS")
+def _normalize_email_whitelist(allowed_emails: object) -> frozenset[str]:
     if not allowed_emails:
-        return set()
-    if isinstance(allowed_emails, set):
-        return allowed_emails
+        return frozenset()
     if isinstance(allowed_emails, str):
-        tokens = [token.strip().lower() for token in allowed_emails.split(",") if token.strip()]
-        return set(tokens)
-    return {str(email).strip().lower() for email in allowed_emails if str(email).strip()}
+        return frozenset(token.strip().lower() for token in allowed_emails.split(",") if token.strip())
+    return frozenset(str(email).strip().lower() for email in allowed_emails if str(email).strip())
+
+
+@auth_bp.record_once
+def _precompute_email_whitelist(state) -> None:
+    """Normalize DASHBOARD_ALLOWED_EMAILS once at startup rather than per request."""
+    config = state.app.config
+    config["DASHBOARD_ALLOWED_EMAILS_SET"] = _normalize_email_whitelist(config.get("DASHBOARD_ALLOWED_EMAILS"))
+
+
+def _get_email_whitelist() -> frozenset[str]:
+    return current_app.config.get("DASHBOARD_ALLOWED_EMAILS_SET", frozenset())
 
 
 def _is_email_whitelisted(email: str | None) -> bool:
@@ -50,14 +68,22 @@ def _is_email_whitelisted(email: str | None) -> bool:
     return email.strip().lower() in allowed_emails
 
 
+_DASHBOARD_SESSION_KEYS = (
+    "dashboard_authenticated",
+    "dashboard_user_email",
+    "dashboard_user_id",
+    "login_event_logged",
+    "dashboard_sales_eligible",
+    "dashboard_market_filter_visible",
+    TOTP_PENDING_SESSION_KEY,
+)
+
+
 def _clear_dashboard_session() -> None:
-    session.pop("dashboard_authenticated", None)
-    session.pop("dashboard_user_email", None)
-    session.pop("dashboard_user_id", None)
-    session.pop("login_event_logged", None)
-    session.pop("dashboard_sales_eligible", None)
-    session.pop("dashboard_market_filter_visible", None)
-    session.pop(TOTP_PENDING_SESSION_KEY, None)
+    # Only touch the session (and re-issue the cookie) if something is set.
+    for key in _DASHBOARD_SESSION_KEYS:
+        if key in session:
+            del session[key]
 
 
 def _market_filter_target_departments_lower() -> frozenset[str]:
@@ -105,9 +131,16 @@ def _hr_employee_department_as_user(
 
 
 def _compute_market_filter_visibility(
-    odoo_client: OdooClient, user_uid: int | None, user_password: str | None
+    odoo_client: OdooClient,
+    user_uid: int | None,
+    user_password: str | None,
+    password_loader: Callable[[], str | None] | None = None,
 ) -> bool:
-    """Fresh visibility: integration hr.employee read first, then user-context RPC if needed."""
+    """Fresh visibility: integration hr.employee read first, then user-context RPC if needed.
+
+    ``password_loader`` is only called when the user-context fallback is
+    actually needed, so callers can defer fetching the password.
+    """
     if not user_uid:
         return False
     targets = _market_filter_target_departments_lower()
@@ -130,6 +163,8 @@ def _compute_market_filter_visibility(
     if rows:
         return _department_matches_market_filter_target(rows[0].get("department_id"))
 
+    if not user_password and password_loader is not None:
+        user_password = password_loader()
     if user_password:
         dep = _hr_employee_department_as_user(odoo_client, uid_int, user_password)
         return _department_matches_market_filter_target(dep) if dep is not None else False
@@ -142,9 +177,7 @@ def _password_from_refresh_cookie_for_uid(expected_uid: int) -> str | None:
     if not refresh_token:
         return None
     try:
-        from ..services.auth_token_service import AuthTokenService
-
-        auth_token_service = AuthTokenService.from_env()
+        auth_token_service = _get_auth_token_service()
         result = auth_token_service.verify_refresh_token(refresh_token)
         if not result:
             return None
@@ -163,10 +196,14 @@ def _sync_session_market_filter_visibility(odoo_client: OdooClient) -> None:
     if not uid:
         session["dashboard_market_filter_visible"] = False
         return
-    password = _password_from_refresh_cookie_for_uid(int(uid))
     try:
+        # The refresh-token lookup costs a Supabase round-trip and is only
+        # needed when the integration read cannot see the employee row.
         session["dashboard_market_filter_visible"] = _compute_market_filter_visibility(
-            odoo_client, int(uid), password
+            odoo_client,
+            int(uid),
+            None,
+            password_loader=lambda: _password_from_refresh_cookie_for_uid(int(uid)),
         )
     except OdooUnavailableError:
         pass
@@ -177,20 +214,148 @@ def _revoke_nasma_refresh_token_cookie(response: Response) -> None:
     refresh_token = request.cookies.get("nasma_refresh_token")
     if refresh_token:
         try:
-            from ..services.auth_token_service import AuthTokenService
-
-            AuthTokenService.from_env().revoke_token(refresh_token)
+            _forget_verified_refresh_token(refresh_token)
+            _get_auth_token_service().revoke_token(refresh_token)
         except Exception as e:
             current_app.logger.debug("Failed to revoke refresh token: %s", e)
     response.set_cookie("nasma_refresh_token", "", expires=0)
 
 
+_SERVICES_LOCK = threading.Lock()
+_AUTH_TOKEN_SERVICE: AuthTokenService | None = None
+_LOGIN_TRACKING_SERVICE: LoginTrackingService | None = None
+
+
+def _get_auth_token_service() -> AuthTokenService:
+    """Process-wide AuthTokenService, built from the environment on first use."""
+    global _AUTH_TOKEN_SERVICE
+    if _AUTH_TOKEN_SERVICE is None:
+        with _SERVICES_LOCK:
+            if _AUTH_TOKEN_SERVICE is None:
+                _AUTH_TOKEN_SERVICE = AuthTokenService.from_env()
+    return _AUTH_TOKEN_SERVICE
+
+
+def _get_login_tracking_service() -> LoginTrackingService:
+    """Process-wide LoginTrackingService, built from the environment on first use."""
+    global _LOGIN_TRACKING_SERVICE
+    if _LOGIN_TRACKING_SERVICE is None:
+        with _SERVICES_LOCK:
+            if _LOGIN_TRACKING_SERVICE is None:
+                _LOGIN_TRACKING_SERVICE = LoginTrackingService.from_env()
+    return _LOGIN_TRACKING_SERVICE
+
+
+# Login audit rows are written by a background worker so the Supabase insert
+# never delays the login response. The queue is bounded; if the worker falls
+# that far behind, new events are dropped rather than blocking requests.
+_LOGIN_EVENTS: queue.Queue[tuple[int, str, str | None, str | None, datetime]] = queue.Queue(maxsize=10000)
+_LOGIN_WORKER: threading.Thread | None = None
+
+
+def _login_event_worker() -> None:
+    while True:
+        user_id, username, ip_address, user_agent, logged_at = _LOGIN_EVENTS.get()
+        try:
+            _get_login_tracking_service().log_login(
+                user_id=user_id,
+                username=username,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                login_timestamp=logged_at,
+            )
+        except Exception as e:
+            logger.debug("Failed to log login event: %s", e)
+
+
+def _client_request_meta() -> tuple[str | None, str | None]:
+    """(client IP, User-Agent) for the current request, parsed once and kept on ``g``."""
+    if "client_request_meta" not in g:
+        forwarded_for = request.environ.get("HTTP_X_FORWARDED_FOR")
+        # Behind a proxy chain the first hop is the client.
+        ip_address = forwarded_for.split(",", 1)[0].strip() if forwarded_for else request.remote_addr
+        g.client_request_meta = (ip_address, request.headers.get("User-Agent"))
+    return g.client_request_meta
+
+
+def _queue_login_event(
+    user_id: int, username: str, ip_address: str | None, user_agent: str | None
+) -> None:
+    """Hand a login event to the background writer (started on first use)."""
+    global _LOGIN_WORKER
+    if _LOGIN_WORKER is None or not _LOGIN_WORKER.is_alive():
+        with _SERVICES_LOCK:
+            if _LOGIN_WORKER is None or not _LOGIN_WORKER.is_alive():
+                _LOGIN_WORKER = threading.Thread(
+                    target=_login_event_worker, name="login-events", daemon=True
+                )
+                _LOGIN_WORKER.start()
+    try:
+        _LOGIN_EVENTS.put_nowait((user_id, username, ip_address, user_agent, datetime.utcnow()))
+    except queue.Full:
+        current_app.logger.warning("Login event queue full; dropping event for %s", username)
+
+
+# Refresh tokens verified against Odoo in the last minute. Pages and polling
+# call /api/check-dashboard-auth in bursts; within the TTL a cookie we just
+# verified skips re-checking the password against Odoo. The token row is
+# still read on every check, so a logout or revocation on any worker takes
+# effect immediately. Keyed by a hash so raw tokens are never held in memory.
+_VERIFIED_REFRESH_TOKENS: OrderedDict[str, tuple[int, str, bool | None, float]] = OrderedDict()
+_VERIFIED_REFRESH_TOKENS_LOCK = threading.Lock()
+_VERIFIED_REFRESH_TOKENS_TTL_SECONDS = 60.0
+_VERIFIED_REFRESH_TOKENS_MAX_ENTRIES = 1024
+
+
+def _refresh_token_cache_key(refresh_token: str) -> str:
+    return hashlib.blake2b(refresh_token.encode(), digest_size=16).hexdigest()
+
+
+def _recently_verified_refresh_token(refresh_token: str) -> tuple[int, str, bool | None] | None:
+    """(user_id, username, sales snapshot) if the token was verified within the TTL."""
+    key = _refresh_token_cache_key(refresh_token)
+    with _VERIFIED_REFRESH_TOKENS_LOCK:
+        entry = _VERIFIED_REFRESH_TOKENS.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[3] >= _VERIFIED_REFRESH_TOKENS_TTL_SECONDS:
+            del _VERIFIED_REFRESH_TOKENS[key]
+            return None
+        _VERIFIED_REFRESH_TOKENS.move_to_end(key)
+    return entry[0], entry[1], entry[2]
+
+
+def _remember_verified_refresh_token(
+    refresh_token: str, user_id: int, username: str, sales_snapshot: bool | None
+) -> None:
+    key = _refresh_token_cache_key(refresh_token)
+    with _VERIFIED_REFRESH_TOKENS_LOCK:
+        _VERIFIED_REFRESH_TOKENS[key] = (user_id, username, sales_snapshot, time.monotonic())
+        _VERIFIED_REFRESH_TOKENS.move_to_end(key)
+        while len(_VERIFIED_REFRESH_TOKENS) > _VERIFIED_REFRESH_TOKENS_MAX_ENTRIES:
+            _VERIFIED_REFRESH_TOKENS.popitem(last=False)
+
+
+def _forget_verified_refresh_token(refresh_token: str) -> None:
+    with _VERIFIED_REFRESH_TOKENS_LOCK:
+        _VERIFIED_REFRESH_TOKENS.pop(_refresh_token_cache_key(refresh_token), None)
+
+
 def _get_odoo_client_for_auth() -> OdooClient:
-    """Get Odoo client for authentication (uses env credentials for connection only)."""
-    settings = current_app.config["ODOO_SETTINGS"]
-    # Create a new client instance for auth verification
-    # This uses the env credentials only for connection, not for user verification
-    return OdooClient(settings)
+    """Get Odoo client for authentication (uses env credentials for connection only).
+
+    Checked out of the app-wide pool once per request, so logins reuse warm
+    connections instead of a fresh TCP/TLS handshake. The creatives teardown
+    hook returns ``g.odoo_client`` to the pool.
+    """
+    if "odoo_client" not in g:
+        g.odoo_client = OdooClientPool.for_app(current_app).acquire()
+    return g.odoo_client
+
+
+def _is_production_host(debug: bool, host: str) -> bool:
+    """Whether cookies for ``host`` should be Secure (not debug, not localhost)."""
+    return not debug and "localhost" not in host
 
 
 def _finalize_dashboard_login(
@@ -224,22 +389,8 @@ def _finalize_dashboard_login(
 
     # Log login event (non-blocking)
     try:
-        from ..services.login_tracking_service import LoginTrackingService
-        login_tracking = LoginTrackingService.from_env()
-
-        # Get IP address and user agent from request
-        ip_address = request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
-        if ip_address:
-            # Handle multiple IPs (take first)
-            ip_address = ip_address.split(',')[0].strip()
-        user_agent = request.headers.get('User-Agent')
-
-        login_tracking.log_login(
-            user_id=uid,
-            username=email,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
+        ip_address, user_agent = _client_request_meta()
+        _queue_login_event(uid, email, ip_address, user_agent)
     except Exception as e:
         # Log error but don't fail login
         current_app.logger.debug(f"Failed to log login event: {e}")
@@ -257,8 +408,7 @@ def _finalize_dashboard_login(
     # Create refresh token if remember_me is checked
     if remember_me:
         try:
-            from ..services.auth_token_service import AuthTokenService
-            auth_token_service = AuthTokenService.from_env()
+            auth_token_service = _get_auth_token_service()
 
             refresh_token = auth_token_service.create_refresh_token(
                 user_id=uid,
@@ -270,7 +420,7 @@ def _finalize_dashboard_login(
 
             # Set cookie with refresh token (1 year expiry)
             # Use secure=True only in production (when not localhost)
-            is_production = not current_app.debug and 'localhost' not in request.host
+            is_production = _is_production_host(current_app.debug, request.host)
             response.set_cookie(
                 'nasma_refresh_token',
                 refresh_token,
@@ -294,7 +444,7 @@ def verify_dashboard_password():
     complete the TOTP challenge in a second step; XML-RPC rejects passwords
     outright once 2FA is enabled on the account.
     """
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     email = data.get("email", "").strip()
     password = data.get("password", "")
     remember_me = data.get("remember_me", False)
@@ -440,8 +590,7 @@ def check_dashboard_auth():
             
             if refresh_token:
                 try:
-                    from ..services.auth_token_service import AuthTokenService
-                    auth_token_service = AuthTokenService.from_env()
+                    auth_token_service = _get_auth_token_service()
                     result = auth_token_service.verify_refresh_token(refresh_token)
                     if result:
                         user_id = result[0]
@@ -451,21 +600,8 @@ def check_dashboard_auth():
             # Log login event if we have user_id (non-blocking)
             if user_id:
                 try:
-                    from ..services.login_tracking_service import LoginTrackingService
-                    login_tracking = LoginTrackingService.from_env()
-                    
-                    # Get IP address and user agent from request
-                    ip_address = request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
-                    if ip_address:
-                        ip_address = ip_address.split(',')[0].strip()
-                    user_agent = request.headers.get('User-Agent')
-                    
-                    login_tracking.log_login(
-                        user_id=user_id,
-                        username=username,
-                        ip_address=ip_address,
-                        user_agent=user_agent
-                    )
+                    ip_address, user_agent = _client_request_meta()
+                    _queue_login_event(user_id, username, ip_address, user_agent)
                     # Mark as logged to prevent duplicate logs
                     session["login_event_logged"] = True
                 except Exception as e:
@@ -480,11 +616,23 @@ def check_dashboard_auth():
         refresh_token = request.cookies.get('nasma_refresh_token')
         if refresh_token:
             try:
-                from ..services.auth_token_service import AuthTokenService
-                auth_token_service = AuthTokenService.from_env()
-                
+                auth_token_service = _get_auth_token_service()
+
+                # Always read the token row: it carries revocation, which the
+                # per-process cache below cannot see across workers.
                 result = auth_token_service.verify_refresh_token_full(refresh_token)
-                if result:
+                is_valid = revoke_invalid_token = False
+                recent = _recently_verified_refresh_token(refresh_token) if result else None
+                if result is None:
+                    _forget_verified_refresh_token(refresh_token)
+                elif recent is not None and recent[1] == result["username"]:
+                    # Password verified against Odoo moments ago — skip only
+                    # the credential round-trip.
+                    user_id = recent[0]
+                    username = result["username"]
+                    restored_sales_snapshot = result["sales_eligible_at_issue"]
+                    is_valid = True
+                else:
                     user_id = result["user_id"]
                     username = result["username"]
                     password = result["password"]
@@ -498,8 +646,12 @@ def check_dashboard_auth():
                     # captured at TOTP time — that answers with a real uid
                     # without prompting for a code.
                     odoo_client = _get_odoo_client_for_auth()
-                    is_valid = odoo_client.verify_user_credentials(username, password)
+                    verified_uid = odoo_client.verify_user_credentials(username, password)
+                    is_valid = bool(verified_uid)
                     revoke_invalid_token = not is_valid
+                    if is_valid:
+                        # Same as the web path: trust the uid Odoo just verified.
+                        user_id = verified_uid
 
                     if not is_valid:
                         settings = current_app.config["ODOO_SETTINGS"]
@@ -522,34 +674,27 @@ def check_dashboard_auth():
                             revoke_invalid_token = False
 
                     if is_valid:
-                        session["dashboard_authenticated"] = True
-                        session["dashboard_user_email"] = username
-                        session["dashboard_user_id"] = user_id  # Store user_id for tracking
-                        session["login_event_logged"] = True  # Mark as logged
-                        is_authenticated = True
-
-                        # Log auto-login event (non-blocking)
-                        try:
-                            from ..services.login_tracking_service import LoginTrackingService
-                            login_tracking = LoginTrackingService.from_env()
-
-                            # Get IP address and user agent from request
-                            ip_address = request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
-                            if ip_address:
-                                ip_address = ip_address.split(',')[0].strip()
-                            user_agent = request.headers.get('User-Agent')
-
-                            login_tracking.log_login(
-                                user_id=user_id,
-                                username=username,
-                                ip_address=ip_address,
-                                user_agent=user_agent
-                            )
-                        except Exception as e:
-                            current_app.logger.debug(f"Failed to log auto-login event: {e}")
-                    elif revoke_invalid_token:
-                        # Credentials rejected outright (wrong password) — revoke token
-                        auth_token_service.revoke_token(refresh_token)
+                        _remember_verified_refresh_token(
+                            refresh_token, user_id, username, restored_sales_snapshot
+                        )
+
+                if is_valid:
+                    session["dashboard_authenticated"] = True
+                    session["dashboard_user_email"] = username
+                    session["dashboard_user_id"] = user_id  # Store user_id for tracking
+                    session["login_event_logged"] = True  # Mark as logged
+                    is_authenticated = True
+
+                    # Log auto-login event (non-blocking)
+                    try:
+                        ip_address, user_agent = _client_request_meta()
+                        _queue_login_event(user_id, username, ip_address, user_agent)
+                    except Exception as e:
+                        current_app.logger.debug(f"Failed to log auto-login event: {e}")
+                elif revoke_invalid_token:
+                    # Credentials rejected outright (wrong password) — revoke token
+                    _forget_verified_refresh_token(refresh_token)
+                    auth_token_service.revoke_token(refresh_token)
             except Exception as e:
                 current_app.logger.debug(f"Error checking refresh token: {e}")
 
@@ -586,10 +731,14 @@ def check_dashboard_auth():
         "market_filter_visible": bool(session.get("dashboard_market_filter_visible")),
     }
     response = make_response(jsonify(payload))
-    response.headers["Cache-Control"] = "private, no-store"
+    # Pages poll this endpoint and the answer rarely changes: let the browser
+    # keep a private copy but revalidate every time, so repeat polls get a
+    # bodiless 304 while session state is still re-checked above.
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.add_etag(weak=True)
     if revoke_refresh:
         _revoke_nasma_refresh_token_cookie(response)
-    return response
+    return response.make_conditional(request)
 
 
 @auth_bp.route("/api/logout", methods=["POST"])
@@ -599,8 +748,8 @@ def logout():
     refresh_token = request.cookies.get('nasma_refresh_token')
     if refresh_token:
         try:
-            from ..services.auth_token_service import AuthTokenService
-            auth_token_service = AuthTokenService.from_env()
+            _forget_verified_refresh_token(refresh_token)
+            auth_token_service = _get_auth_token_service()
             auth_token_service.revoke_token(refresh_token)
         except Exception as e:
             current_app.logger.debug(f"Error revoking refresh token: {e}")
@@ -1,50 +1,45 @@
 """Hour adjustments, Strategy& hours, and creative-group endpoints."""
 from __future__ import annotations
 
-import os
-import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
+from typing import Any, Dict, List, Set, Tuple
+from flask import current_app, jsonify, request
+from ...services.employee_service import invalidate_creatives_memo
 from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
 from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
 from .blueprint import creatives_bp
+from .deps import _get_supabase_cache_service
+from .enrichment import invalidate_period_hours
+from .pages import _clear_api_bundle_cache
+
+# Upper bound on creatives per group; rejects pathological payloads before
+# any per-id parsing.
+_MAX_GROUP_SIZE = 1000
+# Upper bound on groups per /api/creative-groups/bulk request.
+_MAX_BULK_GROUPS = 200
+
+
+def _parse_group_payload(data: Dict[str, Any]) -> Tuple[str, List[int]]:
+    """Validate a group payload into ``(name, creative_ids)``.
+
+    Raises ValueError with the client-facing message when invalid.
+    """
+    name = data.get("name", "")
+    name = name.strip() if isinstance(name, str) else ""
+    creative_ids = data.get("creative_ids", [])
+
+    if not name:
+        raise ValueError("Group name is required")
+
+    if not isinstance(creative_ids, list) or len(creative_ids) == 0:
+        raise ValueError("At least one creative ID is required")
+    if len(creative_ids) > _MAX_GROUP_SIZE:
+        raise ValueError(f"A group can have at most {_MAX_GROUP_SIZE} creatives")
+
+    # Validate creative IDs are integers
+    try:
+        return name, list(map(int, creative_ids))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid creative IDs") from None
 
 
 @creatives_bp.route("/api/creative-hour-adjustments", methods=["GET"])
@@ -62,6 +57,20 @@ def get_creative_hour_adjustments_api():
         return jsonify({"success": False, "error": "Failed to load adjustments", "adjustments": []}), 500
 
 
+@creatives_bp.route("/api/creatives/invalidate-cache", methods=["POST"])
+def invalidate_creatives_cache_api():
+    """Forget the memoized roster, period hours and API stats (e.g. right after an Odoo edit).
+
+    These caches are per process: only the worker that receives the POST is
+    cleared. Other gunicorn workers keep serving their copies until the
+    roster/hours TTLs (CREATIVES_ROSTER_TTL, DASHBOARD_HOURS_TTL) lapse.
+    """
+    invalidate_creatives_memo()
+    invalidate_period_hours()
+    _clear_api_bundle_cache()
+    return jsonify({"success": True})
+
+
 @creatives_bp.route("/api/creatives/<int:creative_id>/new-joiner-inclusion", methods=["POST"])
 def set_new_joiner_inclusion_api(creative_id: int):
     """Toggle whether a ramp-period new joiner's hours count toward utilization."""
@@ -216,7 +225,7 @@ def get_creative_groups_api():
     try:
         cache_service = None
         try:
-            cache_service = SupabaseCacheService.from_env()
+            cache_service = _get_supabase_cache_service()
         except RuntimeError as e:
             # Supabase not configured, log the actual error
             current_app.logger.warning(f"Supabase not configured: {e}")
@@ -237,24 +246,14 @@ def create_creative_group_api():
         if not data:
             return jsonify({"error": "No data provided"}), 400
         
-        name = data.get("name", "").strip()
-        creative_ids = data.get("creative_ids", [])
-        
-        if not name:
-            return jsonify({"error": "Group name is required"}), 400
-        
-        if not isinstance(creative_ids, list) or len(creative_ids) == 0:
-            return jsonify({"error": "At least one creative ID is required"}), 400
-        
-        # Validate creative IDs are integers
         try:
-            creative_ids = [int(id) for id in creative_ids]
-        except (ValueError, TypeError):
-            return jsonify({"error": "Invalid creative IDs"}), 400
+            name, creative_ids = _parse_group_payload(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
         cache_service = None
         try:
-            cache_service = SupabaseCacheService.from_env()
+            cache_service = _get_supabase_cache_service()
         except RuntimeError as e:
             error_msg = str(e)
             current_app.logger.error(f"Failed to initialize Supabase service: {error_msg}")
@@ -278,24 +277,14 @@ def update_creative_group_api(group_id: int):
         if not data:
             return jsonify({"error": "No data provided"}), 400
         
-        name = data.get("name", "").strip()
-        creative_ids = data.get("creative_ids", [])
-        
-        if not name:
-            return jsonify({"error": "Group name is required"}), 400
-        
-        if not isinstance(creative_ids, list) or len(creative_ids) == 0:
-            return jsonify({"error": "At least one creative ID is required"}), 400
-        
-        # Validate creative IDs are integers
         try:
-            creative_ids = [int(id) for id in creative_ids]
-        except (ValueError, TypeError):
-            return jsonify({"error": "Invalid creative IDs"}), 400
+            name, creative_ids = _parse_group_payload(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
         cache_service = None
         try:
-            cache_service = SupabaseCacheService.from_env()
+            cache_service = _get_supabase_cache_service()
         except RuntimeError as e:
             error_msg = str(e)
             current_app.logger.error(f"Failed to initialize Supabase service: {error_msg}")
@@ -311,13 +300,69 @@ def update_creative_group_api(group_id: int):
         return jsonify({"error": "Failed to update group"}), 500
 
 
+@creatives_bp.route("/api/creative-groups/bulk", methods=["POST"])
+def bulk_save_creative_groups_api():
+    """Create and/or update many creative groups in one request.
+
+    Body: ``{"groups": [{"name": ..., "creative_ids": [...], "id": optional}, ...]}``;
+    entries with an ``id`` update that group, the rest are created. Writes are
+    not atomic, so the response reports ``missing_ids`` (ids matching no
+    group) and ``failed`` (indices that could not be written) alongside the
+    saved groups; ``success`` is true only when every entry was written.
+    """
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        raw_groups = data.get("groups") if isinstance(data, dict) else None
+        if not isinstance(raw_groups, list) or len(raw_groups) == 0:
+            return jsonify({"error": "At least one group is required"}), 400
+        if len(raw_groups) > _MAX_BULK_GROUPS:
+            return jsonify({"error": f"At most {_MAX_BULK_GROUPS} groups per request"}), 400
+
+        groups: List[Dict[str, Any]] = []
+        for index, raw in enumerate(raw_groups):
+            if not isinstance(raw, dict):
+                return jsonify({"error": f"Group {index}: invalid payload"}), 400
+            try:
+                name, creative_ids = _parse_group_payload(raw)
+                group_id = int(raw["id"]) if raw.get("id") is not None else None
+            except (ValueError, TypeError) as e:
+                return jsonify({"error": f"Group {index}: {e}"}), 400
+            groups.append({"id": group_id, "name": name, "creative_ids": creative_ids})
+
+        cache_service = None
+        try:
+            cache_service = _get_supabase_cache_service()
+        except RuntimeError as e:
+            error_msg = str(e)
+            current_app.logger.error(f"Failed to initialize Supabase service: {error_msg}")
+            return jsonify({"error": "Supabase not configured", "details": error_msg}), 503
+
+        result = cache_service.save_creative_groups_bulk(groups)
+        if result["failed"] and not result["saved"]:
+            return jsonify({"error": "Failed to save groups", "failed": result["failed"]}), 500
+        return jsonify(
+            {
+                "success": not result["failed"] and not result["missing_ids"],
+                "groups": result["saved"],
+                "missing_ids": result["missing_ids"],
+                "failed": result["failed"],
+            }
+        )
+    except Exception:
+        current_app.logger.error("Error saving creative groups in bulk", exc_info=True)
+        return jsonify({"error": "Failed to save groups"}), 500
+
+
 @creatives_bp.route("/api/creative-groups/<int:group_id>", methods=["DELETE"])
 def delete_creative_group_api(group_id: int):
     """Delete a creative group."""
     try:
         cache_service = None
         try:
-            cache_service = SupabaseCacheService.from_env()
+            cache_service = _get_supabase_cache_service()
         except RuntimeError as e:
             error_msg = str(e)
             current_app.logger.error(f"Failed to initialize Supabase service: {error_msg}")
@@ -11,7 +11,7 @@ from ...integrations.odoo_client import OdooClient, OdooUnavailableError
 from ...services.daily_hours_service import DailyHoursService, run_pooled
 from ...services.employee_service import EmployeeService
 from .blueprint import creatives_bp
-from .deps import _get_employee_service
+from .deps import _get_all_creatives, _get_odoo_client
 from .view_period import _resolve_view_period
 
 # Target department ids depend only on config + Odoo schema; cache them so the
@@ -110,9 +110,8 @@ def creative_daily_hours_bulk():
             return jsonify(entry[1])
 
     try:
-        settings = current_app.config["ODOO_SETTINGS"]
-        employees = _get_employee_service().get_all_creatives(include_inactive=True)
-        service = DailyHoursService(OdooClient(settings))
+        employees = _get_all_creatives(include_inactive=True)
+        service = DailyHoursService(_get_odoo_client())
         per_creative = service.daily_breakdown_bulk(employees, view.period_start, view.period_end)
 
         payload = {
@@ -162,9 +161,8 @@ def creative_daily_hours(creative_id: int):
         ).result():
             return jsonify({"error": "not_found", "message": "Creative not found"}), 404
 
-        # This client only serves the rare absence top-up path; constructing
-        # it is free (no connection until first call).
-        service = DailyHoursService(OdooClient(settings))
+        # The request's pooled client only serves the rare absence top-up path.
+        service = DailyHoursService(_get_odoo_client())
         payload = service.daily_breakdown(creative, view.period_start, view.period_end)
         payload["selected_month"] = view.selected_month_key
 
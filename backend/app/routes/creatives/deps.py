@@ -2,81 +2,108 @@
 from __future__ import annotations
 
 import os
-import re
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, TypeVar
+from flask import current_app, g
+from ...integrations.odoo_client import OdooClient, OdooClientPool
+from ...services.availability_service import AvailabilityService
 from ...services.employee_service import EmployeeService
 from ...services.external_hours_service import ExternalHoursService
 from ...services.planning_service import PlanningService
 from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
+from ...services.utilization_service import UtilizationService
 from ...services.supabase_cache_service import SupabaseCacheService
 from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
 from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
 from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
 from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
 from .blueprint import creatives_bp
 
+if TYPE_CHECKING:
+    from ...config import OdooSettings
+    from ...services.overtime_service import OvertimeService
+    from ...services.sales_service import SalesService
+    from ...services.tasks_service import TasksService
+
+_T = TypeVar("_T")
+
+
+# Shared pool for the per-request dashboard fan-out (availability
+# enrichment, stats, aggregates, headcount, overtime, tasks, ...). Reusing it
+# avoids spawning and joining a fresh set of threads on every page load. Each
+# request's tasks job waits on that request's headcount future, which is
+# always submitted first, so the FIFO queue cannot deadlock.
+_DASHBOARD_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DASHBOARD_POOL_SIZE", "16")),
+    thread_name_prefix="creatives-dash",
+)
+_DASHBOARD_THREAD_STATE = threading.local()
+
+
+def _dashboard_thread_client(settings: OdooSettings) -> OdooClient:
+    """This dashboard worker thread's persistent Odoo client (warm connection)."""
+    client: Optional[OdooClient] = getattr(_DASHBOARD_THREAD_STATE, "client", None)
+    if client is None or client.settings != settings:
+        client = OdooClient(settings)
+        _DASHBOARD_THREAD_STATE.client = client
+    return client
+
+
+def _get_odoo_client_pool() -> OdooClientPool:
+    """Process-wide pool of reusable Odoo clients, created on first use."""
+    return OdooClientPool.for_app(current_app)
+
+
+def _request_memo(name: str, factory: Callable[[], _T]) -> _T:
+    """Return ``g.<name>``, building it with ``factory`` on first use in this request."""
+    value = g.get(name)
+    if value is None:
+        value = factory()
+        setattr(g, name, value)
+    return value
+
 
 def _get_odoo_client() -> OdooClient:
-    settings = current_app.config["ODOO_SETTINGS"]
-    if "odoo_client" not in g:
-        g.odoo_client = OdooClient(settings)
-    return g.odoo_client
+    return _request_memo("odoo_client", lambda: _get_odoo_client_pool().acquire())
 
 
 def _get_employee_service() -> EmployeeService:
-    if "employee_service" not in g:
-        g.employee_service = EmployeeService(_get_odoo_client())
-    return g.employee_service
+    return _request_memo("employee_service", lambda: EmployeeService(_get_odoo_client()))
+
+
+def _get_all_creatives(include_inactive: bool = True) -> List[Dict[str, Any]]:
+    """Request-scoped ``get_all_creatives``: one fetch (or memo copy) per request."""
+    include_inactive = bool(include_inactive)
+    return _request_memo(
+        f"all_creatives_{include_inactive}",
+        lambda: _get_employee_service().get_all_creatives(include_inactive=include_inactive),
+    )
 
 
 def _get_availability_service() -> AvailabilityService:
-    if "availability_service" not in g:
-        g.availability_service = AvailabilityService(_get_odoo_client())
-    return g.availability_service
+    return _request_memo("availability_service", lambda: AvailabilityService(_get_odoo_client()))
 
 
 def _get_planning_service() -> PlanningService:
-    if "planning_service" not in g:
-        g.planning_service = PlanningService(_get_odoo_client())
-    return g.planning_service
+    return _request_memo("planning_service", lambda: PlanningService(_get_odoo_client()))
 
 
 def _get_timesheet_service() -> TimesheetService:
-    if "timesheet_service" not in g:
-        g.timesheet_service = TimesheetService(_get_odoo_client())
-    return g.timesheet_service
+    return _request_memo("timesheet_service", lambda: TimesheetService(_get_odoo_client()))
+
+
+@lru_cache(maxsize=1)
+def _get_supabase_cache_service() -> SupabaseCacheService:
+    """Process-wide SupabaseCacheService, built on first successful use.
+
+    Raises the same RuntimeError as ``SupabaseCacheService.from_env`` while
+    Supabase is not configured (failures are not cached).
+    """
+    return SupabaseCacheService.from_env()
 
 
 def _get_external_hours_service() -> ExternalHoursService:
@@ -84,8 +111,7 @@ def _get_external_hours_service() -> ExternalHoursService:
         cache_service = None
         try:
             # Try to initialize Supabase cache service if credentials are available
-            cache_service = SupabaseCacheService.from_env()
-            current_app.logger.info("Supabase cache service initialized successfully")
+            cache_service = _get_supabase_cache_service()
         except RuntimeError as e:
             # If Supabase is not configured, continue without cache
             error_msg = str(e)
@@ -150,6 +176,77 @@ def _client_external_hours_markets_for_period(
         return [], []
 
 
+# Stale-while-revalidate memo for the viewed period's client external /
+# subscription hours (the slowest prefetch branch). Within the fresh window
+# the cached markets are served as-is; within the stale window they are
+# served immediately while one background refresh runs on the dashboard
+# pool; older entries are refetched inline. Closed periods rarely change, so
+# they stay fresh much longer.
+_CLIENT_EXTERNAL_CACHE: Dict[Tuple[str, str], Tuple[float, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]] = {}
+_CLIENT_EXTERNAL_CACHE_LOCK = threading.Lock()
+_CLIENT_EXTERNAL_REFRESHING: Set[Tuple[str, str]] = set()
+_CLIENT_EXTERNAL_FRESH_SECONDS = 300.0
+_CLIENT_EXTERNAL_CLOSED_FRESH_SECONDS = 6 * 3600.0
+_CLIENT_EXTERNAL_STALE_SECONDS = 3600.0
+_CLIENT_EXTERNAL_MAX_ENTRIES = 32
+
+
+def _store_client_external(
+    key: Tuple[str, str], markets: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+) -> None:
+    if not markets[0] and not markets[1]:
+        # ([], []) is what the fetch returns on failure; never cache it.
+        return
+    with _CLIENT_EXTERNAL_CACHE_LOCK:
+        _CLIENT_EXTERNAL_CACHE.pop(key, None)
+        _CLIENT_EXTERNAL_CACHE[key] = (time.monotonic(), markets)
+        while len(_CLIENT_EXTERNAL_CACHE) > _CLIENT_EXTERNAL_MAX_ENTRIES:
+            _CLIENT_EXTERNAL_CACHE.pop(next(iter(_CLIENT_EXTERNAL_CACHE)))
+
+
+def _client_external_hours_markets_cached(
+    month_start: date,
+    month_end: date,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """``_client_external_hours_markets_for_period`` behind a stale-while-revalidate memo."""
+    key = (month_start.isoformat(), month_end.isoformat())
+    fresh_for = (
+        _CLIENT_EXTERNAL_CLOSED_FRESH_SECONDS
+        if month_end < date.today()
+        else _CLIENT_EXTERNAL_FRESH_SECONDS
+    )
+    with _CLIENT_EXTERNAL_CACHE_LOCK:
+        entry = _CLIENT_EXTERNAL_CACHE.get(key)
+        age = time.monotonic() - entry[0] if entry is not None else None
+        if age is not None and age < fresh_for:
+            return entry[1]
+        serve_stale = age is not None and age < fresh_for + _CLIENT_EXTERNAL_STALE_SECONDS
+        start_refresh = serve_stale and key not in _CLIENT_EXTERNAL_REFRESHING
+        if start_refresh:
+            _CLIENT_EXTERNAL_REFRESHING.add(key)
+
+    if not serve_stale:
+        markets = _client_external_hours_markets_for_period(month_start, month_end)
+        _store_client_external(key, markets)
+        return markets
+
+    if start_refresh:
+        app = current_app._get_current_object()
+
+        def _refresh() -> None:
+            try:
+                with app.app_context():
+                    _store_client_external(
+                        key, _client_external_hours_markets_for_period(month_start, month_end)
+                    )
+            finally:
+                with _CLIENT_EXTERNAL_CACHE_LOCK:
+                    _CLIENT_EXTERNAL_REFRESHING.discard(key)
+
+        _DASHBOARD_POOL.submit(_refresh)
+    return entry[1]
+
+
 # Previous-period external hours power the "External Hours Used" trend badge.
 # Closed periods don't change, so memoize per period: only the first request
 # after a restart pays the extra Odoo round trips. The payload is a compact
@@ -257,7 +354,7 @@ def _start_request_prefetch(
         # returns ([], []) on failure, so this thread cannot die uncaught.
         def _run_current() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
             with app.app_context():
-                return _client_external_hours_markets_for_period(month_start, month_end)
+                return _client_external_hours_markets_cached(month_start, month_end)
 
         def _run_previous() -> Optional[Dict[str, Any]]:
             with app.app_context():
@@ -298,9 +395,7 @@ def _get_comparison_service() -> ComparisonService:
 
 
 def _get_headcount_service() -> HeadcountService:
-    if "headcount_service" not in g:
-        g.headcount_service = HeadcountService(_get_employee_service())
-    return g.headcount_service
+    return _request_memo("headcount_service", lambda: HeadcountService(_get_employee_service()))
 
 
 def _get_tasks_service() -> "TasksService":
@@ -366,17 +461,24 @@ def _inject_service_into_app_context() -> None:
         current_app.config["ODOO_SETTINGS"] = Config.odoo_settings()
 
 
-@creatives_bp.teardown_app_request
 def _cleanup_services(_: BaseException | None) -> None:
-    """Release shared Odoo client when the request finishes."""
+    """Return the context's Odoo client to the pool when its app context ends.
+
+    Registered as an app-wide ``teardown_appcontext`` hook, so it runs after
+    every request (releasing the client the auth routes check out under the
+    same ``g.odoo_client`` key) and also when the bare ``app.app_context()``
+    blocks of background jobs, prefetch threads and SWR refreshes exit.
+    """
     client = g.pop("odoo_client", None)
     if client is not None:
         try:
-            client.close()
+            _get_odoo_client_pool().release(client)
         except Exception:
-            current_app.logger.debug("Failed to close Odoo client cleanly", exc_info=True)
+            current_app.logger.debug("Failed to release Odoo client cleanly", exc_info=True)
 
     g.pop("employee_service", None)
+    g.pop("all_creatives_True", None)
+    g.pop("all_creatives_False", None)
     g.pop("availability_service", None)
     g.pop("planning_service", None)
     g.pop("timesheet_service", None)
@@ -384,3 +486,6 @@ def _cleanup_services(_: BaseException | None) -> None:
     g.pop("utilization_service", None)
     g.pop("sales_service", None)
     g.pop("sales_cache_service", None)
+
+
+creatives_bp.record_once(lambda state: state.app.teardown_appcontext(_cleanup_services))
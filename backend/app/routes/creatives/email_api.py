@@ -1,49 +1,12 @@
 """Email settings and alert-report endpoints."""
 from __future__ import annotations
 
-import os
 import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
+from flask import current_app, jsonify, request
 from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
 from ...services.email_service import EmailService
 from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
 from .blueprint import creatives_bp
 from .deps import (
     _get_availability_service,
@@ -55,6 +18,8 @@ from .deps import (
 )
 from .view_period import _month_bounds, _resolve_month
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 @creatives_bp.route("/api/email-settings", methods=["GET"])
 def get_email_settings_api():
@@ -168,10 +133,9 @@ def save_email_settings_api():
             return jsonify({"success": False, "error": "At least one recipient is required"}), 400
         
         # Validate email addresses
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         all_emails = recipients + cc_recipients
         for email in all_emails:
-            if not re.match(email_pattern, email):
+            if not _EMAIL_RE.match(email):
                 return jsonify({"success": False, "error": f"Invalid email address: {email}"}), 400
         
         # Parse date and time
@@ -240,10 +204,9 @@ def test_email_settings_api():
             return jsonify({"success": False, "error": "At least one recipient is required"}), 400
         
         # Validate email addresses
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         all_emails = recipients + cc_recipients
         for email in all_emails:
-            if not re.match(email_pattern, email):
+            if not _EMAIL_RE.match(email):
                 return jsonify({"success": False, "error": f"Invalid email address: {email}"}), 400
         
         # Parse test month or use current month
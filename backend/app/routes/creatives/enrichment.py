@@ -1,50 +1,25 @@
 """Creative enrichment with availability/planned/logged for the viewed period."""
 from __future__ import annotations
 
+import hashlib
 import os
-import re
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
+import time
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from flask import current_app
 from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
     resolve_business_unit_for_month,
-    split_assignment_field_tokens,
     use_business_unit_model,
 )
 from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
 from ...services.planning_service import PlanningService
 from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
+from ...services.creative_market import _get_creative_market_for_month
 from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
 from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
-from .deps import _get_employee_service
+from .deps import _DASHBOARD_POOL, _dashboard_thread_client, _get_employee_service
 from .stats import (
     _calculate_utilization,
     _format_hours_minutes,
@@ -54,6 +29,146 @@ from .stats import (
 from .view_period import DashboardViewPeriod, _employed_months_in_view
 
 
+# Odoo hours per period are reused briefly across requests: the dashboard
+# page, its API twin and exports for the same view recompute identical
+# availability/planned/logged dicts. The key carries a digest of the roster
+# fields those services read, so roster changes miss instead of going stale;
+# new timesheets/planning show up once the TTL lapses.
+_HOURS_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_HOURS_CACHE_LOCK = threading.Lock()
+_HOURS_TTL_SECONDS = float(os.getenv("DASHBOARD_HOURS_TTL", "60"))
+_HOURS_MAX_ENTRIES = 32
+_HOURS_ROSTER_FIELDS = ("id", "name", "resource_calendar_name", "company_id")
+
+
+def _roster_signature(creatives: List[Dict[str, object]]) -> str:
+    """Digest of the roster fields the availability/planning/timesheet services read."""
+    digest = hashlib.blake2b(digest_size=16)
+    for creative in creatives:
+        digest.update(repr(tuple(creative.get(field) for field in _HOURS_ROSTER_FIELDS)).encode())
+    return digest.hexdigest()
+
+
+def invalidate_period_hours() -> None:
+    """Drop every cached hours entry so the next request re-reads Odoo."""
+    with _HOURS_CACHE_LOCK:
+        _HOURS_CACHE.clear()
+
+
+def _period_hours_key(
+    view: DashboardViewPeriod, creatives: List[Dict[str, object]]
+) -> Tuple[Any, ...]:
+    return (
+        view.period_start,
+        view.period_end,
+        view.previous_period_start if view.has_previous_period else None,
+        view.previous_period_end if view.has_previous_period else None,
+        _roster_signature(creatives),
+    )
+
+
+def _period_hours_stamp(
+    view: DashboardViewPeriod, creatives: List[Dict[str, object]]
+) -> Optional[float]:
+    """When the live hours entry for this view was fetched, or None if it is missing/expired."""
+    now = time.monotonic()
+    with _HOURS_CACHE_LOCK:
+        entry = _HOURS_CACHE.get(_period_hours_key(view, creatives))
+    if entry is None or (now - entry[0]) >= _HOURS_TTL_SECONDS:
+        return None
+    return entry[0]
+
+
+def _period_hours_cached(
+    view: DashboardViewPeriod, creatives: List[Dict[str, object]]
+) -> Dict[str, Any]:
+    """Availability/planned/logged dicts for the viewed and previous period (TTL-cached)."""
+    key = _period_hours_key(view, creatives)
+    now = time.monotonic()
+    with _HOURS_CACHE_LOCK:
+        entry = _HOURS_CACHE.get(key)
+        if entry is not None and (now - entry[0]) < _HOURS_TTL_SECONDS:
+            return entry[1]
+
+    hours = _fetch_period_hours(view, creatives)
+    with _HOURS_CACHE_LOCK:
+        _HOURS_CACHE.pop(key, None)
+        _HOURS_CACHE[key] = (time.monotonic(), hours)
+        while len(_HOURS_CACHE) > _HOURS_MAX_ENTRIES:
+            _HOURS_CACHE.pop(next(iter(_HOURS_CACHE)))
+    return hours
+
+
+def _fetch_period_hours(
+    view: DashboardViewPeriod, creatives: List[Dict[str, object]]
+) -> Dict[str, Any]:
+    month_start = view.period_start
+    month_end = view.period_end
+    has_previous_period = view.has_previous_period
+    previous_period_start = view.previous_period_start
+    previous_period_end = view.previous_period_end
+
+    app = current_app._get_current_object()
+    settings = current_app.config["ODOO_SETTINGS"]
+
+    # Each task runs on the shared dashboard pool with that worker thread's
+    # persistent client, so no threads or connections are set up per request.
+    def _get_availability_on_pool_client(start: date, end: date):
+        with app.app_context():
+            service = AvailabilityService(_dashboard_thread_client(settings))
+            return service.calculate_monthly_availability(creatives, start, end)
+
+    def _get_planned_on_pool_client(start: date, end: date):
+        with app.app_context():
+            service = PlanningService(_dashboard_thread_client(settings))
+            return service.planned_hours_for_month(creatives, start, end)
+
+    def _get_logged_on_pool_client(periods: List[Tuple[date, date]]):
+        with app.app_context():
+            service = TimesheetService(_dashboard_thread_client(settings))
+            return service.logged_hours_for_periods(creatives, periods)
+
+    executor = _DASHBOARD_POOL
+    futures: Dict[str, Any] = {}
+    futures["summaries"] = executor.submit(_get_availability_on_pool_client, month_start, month_end)
+    futures["planned"] = executor.submit(_get_planned_on_pool_client, month_start, month_end)
+    # Timesheets for the viewed and previous period come from one query.
+    logged_periods = [(month_start, month_end)]
+    if has_previous_period:
+        logged_periods.append((previous_period_start, previous_period_end))
+    futures["logged"] = executor.submit(_get_logged_on_pool_client, logged_periods)
+
+    if has_previous_period:
+        futures["previous_summaries"] = executor.submit(
+            _get_availability_on_pool_client, previous_period_start, previous_period_end
+        )
+        futures["previous_planned"] = executor.submit(
+            _get_planned_on_pool_client, previous_period_start, previous_period_end
+        )
+
+    for key, future in futures.items():
+        futures[key] = future.result()
+
+    hours: Dict[str, Any] = {
+        "summaries": futures["summaries"],
+        "planned": futures["planned"],
+        "logged": futures["logged"][0],
+        "previous_summaries": {},
+        "previous_planned": {},
+        "previous_logged": {},
+    }
+    if has_previous_period:
+        hours["previous_summaries"] = futures.get("previous_summaries", {}) or {}
+        hours["previous_planned"] = futures.get("previous_planned", {}) or {}
+        hours["previous_logged"] = futures["logged"][1] or {}
+    return hours
+
+
+@lru_cache(maxsize=32)
+def _market_display(market_slug: str) -> str:
+    return market_slug.upper() if market_slug in {"ksa", "uae"} else market_slug.capitalize()
+
+
 def _creatives_with_availability(
     view: DashboardViewPeriod,
     creatives: Optional[List[Dict[str, object]]] = None,
@@ -89,61 +204,13 @@ def _creatives_with_availability(
         previous_period_end.year, previous_period_end.month, 1
     )
 
-    summaries: Dict[int, AvailabilitySummary] = {}
-    planned_hours: Dict[int, float] = {}
-    logged_hours: Dict[int, float] = {}
-    previous_summaries: Dict[int, AvailabilitySummary] = {}
-    previous_planned_hours: Dict[int, float] = {}
-    previous_logged_hours: Dict[int, float] = {}
-
-    app = current_app._get_current_object()
-    settings = current_app.config["ODOO_SETTINGS"]
-
-    def _get_availability_with_new_client(start: date, end: date):
-        with app.app_context():
-            new_client = OdooClient(settings)
-            service = AvailabilityService(new_client)
-            return service.calculate_monthly_availability(creatives, start, end)
-
-    def _get_planned_with_new_client(start: date, end: date):
-        with app.app_context():
-            new_client = OdooClient(settings)
-            service = PlanningService(new_client)
-            return service.planned_hours_for_month(creatives, start, end)
-
-    def _get_logged_with_new_client(start: date, end: date):
-        with app.app_context():
-            new_client = OdooClient(settings)
-            service = TimesheetService(new_client)
-            return service.logged_hours_for_month(creatives, start, end)
-
-    futures: Dict[str, Any] = {}
-    with ThreadPoolExecutor(max_workers=6 if has_previous_period else 3) as executor:
-        futures["summaries"] = executor.submit(_get_availability_with_new_client, month_start, month_end)
-        futures["planned"] = executor.submit(_get_planned_with_new_client, month_start, month_end)
-        futures["logged"] = executor.submit(_get_logged_with_new_client, month_start, month_end)
-
-        if has_previous_period:
-            futures["previous_summaries"] = executor.submit(
-                _get_availability_with_new_client, previous_period_start, previous_period_end
-            )
-            futures["previous_planned"] = executor.submit(
-                _get_planned_with_new_client, previous_period_start, previous_period_end
-            )
-            futures["previous_logged"] = executor.submit(
-                _get_logged_with_new_client, previous_period_start, previous_period_end
-            )
-
-        for key, future in futures.items():
-            futures[key] = future.result()
-
-    summaries = futures["summaries"]
-    planned_hours = futures["planned"]
-    logged_hours = futures["logged"]
-    if has_previous_period:
-        previous_summaries = futures.get("previous_summaries", {}) or {}
-        previous_planned_hours = futures.get("previous_planned", {}) or {}
-        previous_logged_hours = futures.get("previous_logged", {}) or {}
+    hours = _period_hours_cached(view, creatives)
+    summaries: Dict[int, AvailabilitySummary] = hours["summaries"]
+    planned_hours: Dict[int, float] = hours["planned"]
+    logged_hours: Dict[int, float] = hours["logged"]
+    previous_summaries: Dict[int, AvailabilitySummary] = hours["previous_summaries"]
+    previous_planned_hours: Dict[int, float] = hours["previous_planned"]
+    previous_logged_hours: Dict[int, float] = hours["previous_logged"]
 
     if hour_adjustments is None:
         try:
@@ -184,13 +251,16 @@ def _creatives_with_availability(
             if not market_slug:
                 continue
 
-            market_display = market_slug.upper() if market_slug in {"ksa", "uae"} else market_slug.capitalize()
+            market_display = _market_display(market_slug)
             current_business_unit = None
             current_sub_business_unit = None
             current_pod = None
 
         creative_id = creative.get("id")
-        summary: AvailabilitySummary | None = summaries.get(creative_id) if isinstance(creative_id, int) else None
+        # Non-int ids never match the hour dicts; None keeps every lookup below a plain .get().
+        if not isinstance(creative_id, int):
+            creative_id = None
+        summary: AvailabilitySummary | None = summaries.get(creative_id)
         base_hours = round(summary.base_hours, 2) if summary else 0.0
         time_off_hours = round(summary.time_off_hours, 2) if summary else 0.0
         public_holiday_hours = round(summary.public_holiday_hours, 2) if summary else 0.0
@@ -200,8 +270,8 @@ def _creatives_with_availability(
             if summary
             else round(max(base_hours - public_holiday_hours - time_off_hours, 0.0), 2)
         )
-        planned = round(planned_hours.get(creative_id, 0.0), 2) if isinstance(creative_id, int) else 0.0
-        logged = round(logged_hours.get(creative_id, 0.0), 2) if isinstance(creative_id, int) else 0.0
+        planned = round(planned_hours.get(creative_id, 0.0), 2)
+        logged = round(logged_hours.get(creative_id, 0.0), 2)
 
         joining = parse_joining_date(creative.get("x_studio_joining_date"))
         in_ramp_current = (
@@ -213,11 +283,11 @@ def _creatives_with_availability(
         # on the card pill (persisted in Supabase); default is excluded.
         new_joiner_included = bool(
             in_ramp_current
-            and isinstance(creative_id, int)
+            and creative_id is not None
             and creative_id in new_joiner_included_ids
         )
 
-        adj = hour_adjustments.get(creative_id) if isinstance(creative_id, int) else None
+        adj = hour_adjustments.get(creative_id)
 
         # Pre-zeroing hours for ramp joiners (no hour adjustment): lets the
         # frontend flip the inclusion toggle instantly without a server round
@@ -276,21 +346,11 @@ def _creatives_with_availability(
                 if previous_result:
                     previous_market_slug, previous_pool_name = previous_result
                     if previous_market_slug:
-                        previous_market_display = (
-                            previous_market_slug.upper()
-                            if previous_market_slug in {"ksa", "uae"}
-                            else previous_market_slug.capitalize()
-                        )
-            prev_summary: AvailabilitySummary | None = (
-                previous_summaries.get(creative_id) if isinstance(creative_id, int) else None
-            )
+                        previous_market_display = _market_display(previous_market_slug)
+            prev_summary: AvailabilitySummary | None = previous_summaries.get(creative_id)
             previous_available = round(prev_summary.available_hours, 2) if prev_summary else 0.0
-            previous_planned = (
-                round(previous_planned_hours.get(creative_id, 0.0), 2) if isinstance(creative_id, int) else 0.0
-            )
-            previous_logged = (
-                round(previous_logged_hours.get(creative_id, 0.0), 2) if isinstance(creative_id, int) else 0.0
-            )
+            previous_planned = round(previous_planned_hours.get(creative_id, 0.0), 2)
+            previous_logged = round(previous_logged_hours.get(creative_id, 0.0), 2)
 
         in_ramp_previous = (
             joining is not None
@@ -10,10 +10,10 @@ import re
 
 from flask import current_app, jsonify, request, send_file
 
-from ...services.timecard_export_service import build_timecards_workbook
 from .blueprint import creatives_bp
 
 _MAX_CREATIVES = 300
+_FILENAME_UNSAFE_RE = re.compile(r"[^0-9A-Za-z-]")
 
 
 @creatives_bp.route("/api/creatives/export-xlsx", methods=["POST"])
@@ -29,12 +29,16 @@ def export_creative_timecards():
         return jsonify({"success": False, "error": f"Too many creatives (max {_MAX_CREATIVES})"}), 400
 
     try:
+        # Imported on first export: openpyxl is the single heaviest import in
+        # the blueprint and only this endpoint needs it.
+        from ...services.timecard_export_service import build_timecards_workbook
+
         stream = build_timecards_workbook(payload)
     except Exception:
         current_app.logger.error("Failed to build time card export", exc_info=True)
         return jsonify({"success": False, "error": "Failed to build the export"}), 500
 
-    month_key = re.sub(r"[^0-9A-Za-z-]", "", str(payload.get("selected_month") or "export"))
+    month_key = _FILENAME_UNSAFE_RE.sub("", str(payload.get("selected_month") or "export"))
     return send_file(
         stream,
         mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
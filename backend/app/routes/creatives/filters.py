@@ -2,54 +2,19 @@
 from __future__ import annotations
 
 import os
-import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
+    bu_assignment_filter,
     split_assignment_field_tokens,
-    use_business_unit_model,
 )
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
 
 
 def _filter_creatives_by_market_and_pool(
     creatives: List[Dict[str, object]],
-    selected_markets: Optional[List[str]] = None,
-    selected_pools: Optional[List[str]] = None,
+    selected_markets: Optional[Iterable[str]] = None,
+    selected_pools: Optional[Iterable[str]] = None,
 ) -> List[Dict[str, object]]:
     """Filter creatives by market and/or pool.
     
@@ -63,27 +28,21 @@ def _filter_creatives_by_market_and_pool(
     """
     if not selected_markets and not selected_pools:
         return creatives
-    
-    filtered = []
-    for creative in creatives:
-        market_slug = creative.get("market_slug")
-        pool_name = creative.get("pool_name")
-
-        # Market filter: if markets selected, creative must match one
-        market_match = True
-        if selected_markets:
-            market_match = market_slug in selected_markets
-        
-        # Pool filter: if pools selected, creative must match one
-        pool_match = True
-        if selected_pools:
-            pool_match = pool_name in selected_pools if pool_name else False
-        
-        # Both filters must pass (AND logic)
-        if market_match and pool_match:
-            filtered.append(creative)
-    
-    return filtered
+    # Hash lookups per creative instead of list scans. Creatives without a
+    # pool never match a pool filter, so empty names are dropped up front.
+    markets = frozenset(selected_markets) if selected_markets else None
+    pools = frozenset(p for p in selected_pools if p) if selected_pools else None
+
+    # One dedicated comprehension per combination keeps the per-creative
+    # work to the lookups that actually apply (AND logic when both are set).
+    if markets is not None and pools is not None:
+        return [
+            c for c in creatives
+            if c.get("market_slug") in markets and c.get("pool_name") in pools
+        ]
+    if markets is not None:
+        return [c for c in creatives if c.get("market_slug") in markets]
+    return [c for c in creatives if c.get("pool_name") in pools]
 
 
 def _get_available_markets_and_pools(
@@ -95,7 +54,31 @@ def _get_available_markets_and_pools(
         Tuple of (available_markets, available_pools) where each is a list of dicts
         with 'value' and 'label' keys
     """
-    markets_set: set[str] = set()
+    _, available_markets, available_pools = _filter_and_index_markets_and_pools(creatives)
+    return available_markets, available_pools
+
+
+def _filter_and_index_markets_and_pools(
+    creatives: List[Dict[str, object]],
+    selected_markets: Optional[Iterable[str]] = None,
+    selected_pools: Optional[Iterable[str]] = None,
+) -> Tuple[List[Dict[str, object]], List[Dict[str, str]], List[Dict[str, str]]]:
+    """Filter by market/pool and collect the filter options in a single pass.
+
+    Same results as ``_filter_creatives_by_market_and_pool`` followed by
+    ``_get_available_markets_and_pools`` (options come from the unfiltered
+    list), but walks the roster once.
+
+    Returns:
+        Tuple of (filtered_creatives, available_markets, available_pools)
+    """
+    market_filter = frozenset(selected_markets) if selected_markets else None
+    pool_filter = frozenset(selected_pools) if selected_pools else None
+    filtering = market_filter is not None or pool_filter is not None
+
+    filtered: List[Dict[str, object]] = []
+    # First display label seen per market slug.
+    market_display_map: Dict[str, str] = {}
     pools_set: set[str] = set()
     
     for creative in creatives:
@@ -103,71 +86,50 @@ def _get_available_markets_and_pools(
         market_display = creative.get("market_display")
         pool_name = creative.get("pool_name")
         
-        if market_slug and market_display:
-            markets_set.add(market_slug)
+        if market_slug and market_display and market_slug not in market_display_map:
+            market_display_map[market_slug] = market_display
         
         if pool_name and pool_name != "No Pool":
             pools_set.add(pool_name)
+
+        # Both filters must pass (AND logic)
+        if (
+            filtering
+            and (market_filter is None or market_slug in market_filter)
+            and (pool_filter is None or (pool_name and pool_name in pool_filter))
+        ):
+            filtered.append(creative)
     
-    # Convert to sorted lists with display labels
-    available_markets = []
-    for market_slug in sorted(markets_set):
-        # Find display name from first creative with this market
-        display_name = None
-        for creative in creatives:
-            if creative.get("market_slug") == market_slug:
-                display_name = creative.get("market_display")
-                break
-        
-        available_markets.append({
-            "value": market_slug,
-            "label": display_name or market_slug.upper(),
-        })
-    
-    available_pools = []
-    for pool_name in sorted(pools_set):
-        available_pools.append({
-            "value": pool_name,
-            "label": pool_name,
-        })
+    available_markets = [
+        {"value": market_slug, "label": market_display_map[market_slug]}
+        for market_slug in sorted(market_display_map)
+    ]
+    available_pools = [{"value": pool_name, "label": pool_name} for pool_name in sorted(pools_set)]
     
-    return available_markets, available_pools
+    return (filtered if filtering else creatives), available_markets, available_pools
 
 
-def _parse_filter_params(request_args: Any) -> Tuple[List[str], List[str]]:
+def _parse_filter_params(request_args: Any) -> Tuple[frozenset[str], frozenset[str]]:
     """Parse market and pool filter parameters from request.
     
+    Each filter may be repeated (``?market=ksa&market=uae``) or comma-separated
+    (``?market=ksa,uae``).
+
     Args:
         request_args: Flask request.args object
         
     Returns:
-        Tuple of (selected_markets, selected_pools) as lists of strings
+        Tuple of (selected_markets, selected_pools) as frozensets of strings
     """
-    # Get market filter (can be multiple values)
-    market_param = request_args.get("market")
-    if market_param:
-        if isinstance(market_param, str):
-            selected_markets = [m.strip() for m in market_param.split(",") if m.strip()]
-        elif isinstance(market_param, list):
-            selected_markets = [m.strip() for m in market_param if isinstance(m, str) and m.strip()]
-        else:
-            selected_markets = []
-    else:
-        selected_markets = []
-    
-    # Get pool filter (can be multiple values)
-    pool_param = request_args.get("pool")
-    if pool_param:
-        if isinstance(pool_param, str):
-            selected_pools = [p.strip() for p in pool_param.split(",") if p.strip()]
-        elif isinstance(pool_param, list):
-            selected_pools = [p.strip() for p in pool_param if isinstance(p, str) and p.strip()]
-        else:
-            selected_pools = []
-    else:
-        selected_pools = []
-    
-    return selected_markets, selected_pools
+
+    def _split_param(key: str) -> frozenset[str]:
+        values: List[str] = []
+        for raw in request_args.getlist(key):
+            if isinstance(raw, str):
+                values.extend(raw.split(",") if "," in raw else (raw,))
+        return frozenset(v.strip() for v in values if v and v.strip())
+
+    return _split_param("market"), _split_param("pool")
 
 
 def _parse_bu_assignment_filter_params(request_args: Any) -> Tuple[List[str], List[str], List[str]]:
@@ -192,18 +154,12 @@ def _filter_creatives_by_bu_assignment(
     selected_sub_business_units: Optional[List[str]] = None,
     selected_pods: Optional[List[str]] = None,
 ) -> List[Dict[str, object]]:
-    if not selected_business_units and not selected_sub_business_units and not selected_pods:
+    matches = bu_assignment_filter(
+        selected_business_units, selected_sub_business_units, selected_pods
+    )
+    if matches is None:
         return creatives
-    return [
-        c
-        for c in creatives
-        if creative_matches_bu_assignment_filters(
-            c,
-            selected_business_units,
-            selected_sub_business_units,
-            selected_pods,
-        )
-    ]
+    return [c for c in creatives if matches(c)]
 
 
 def _get_available_bu_assignment_options(
@@ -224,15 +180,23 @@ def _get_available_bu_assignment_options(
     return _to_options(bu_tokens), _to_options(sbu_tokens), _to_options(pod_tokens)
 
 
+# Read once at import; changing it requires a restart like any other setting.
+_SERIES_WINDOW_OVERRIDE = os.getenv("CLIENT_SERIES_MONTH_WINDOW")
+
+
 def _series_window(selected_month: date) -> int:
     """Determine how many trailing months of used-hours series to request."""
+    return _series_window_for_month(selected_month.month)
+
+
+@lru_cache(maxsize=12)
+def _series_window_for_month(month: int) -> int:
     # By default, include every month from January through the selected month.
-    default_window = max(1, min(12, selected_month.month))
-    override = os.getenv("CLIENT_SERIES_MONTH_WINDOW")
-    if override is None:
+    default_window = max(1, min(12, month))
+    if _SERIES_WINDOW_OVERRIDE is None:
         return default_window
     try:
-        configured = int(override)
+        configured = int(_SERIES_WINDOW_OVERRIDE)
     except ValueError:
         return default_window
     return max(1, min(default_window, configured))
@@ -1,60 +1,32 @@
 """The dashboard page (/) and /api/creatives endpoints."""
 from __future__ import annotations
 
+import hashlib
 import os
-import re
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from flask import Response, current_app, jsonify, render_template, request, session
+from ...integrations.odoo_client import OdooUnavailableError
+from ...services.assignment_service import use_business_unit_model
 from .blueprint import creatives_bp
 from .deps import (
-    _get_employee_service,
+    _DASHBOARD_POOL,
+    _get_all_creatives,
+    _get_headcount_service,
+    _get_overtime_service,
     _get_tasks_service,
     _get_utilization_service,
     _start_request_prefetch,
 )
-from .enrichment import _creatives_with_availability
+from .enrichment import (
+    _HOURS_TTL_SECONDS,
+    _creatives_with_availability,
+    _period_hours_stamp,
+)
 from .filters import (
     _filter_creatives_by_bu_assignment,
-    _filter_creatives_by_market_and_pool,
+    _filter_and_index_markets_and_pools,
     _get_available_bu_assignment_options,
     _get_available_markets_and_pools,
     _parse_bu_assignment_filter_params,
@@ -67,7 +39,127 @@ from .stats import (
     _empty_dashboard_context,
     _pool_stats,
 )
-from .view_period import _month_part_options, _resolve_view_period, _year_options
+from .view_period import (
+    DashboardViewPeriod,
+    _month_part_options,
+    _resolve_view_period,
+    _year_options,
+)
+
+
+def _compute_dashboard_bundle(
+    view: Any,
+    all_creatives_from_odoo: List[Dict[str, Any]],
+    all_creatives: List[Dict[str, Any]],
+    creatives: List[Dict[str, Any]],
+    *,
+    use_bu_assignment_filters: bool = False,
+    selected_markets: Optional[Iterable[str]] = None,
+    selected_pools: Optional[Iterable[str]] = None,
+    selected_business_units: Optional[List[str]] = None,
+    selected_sub_business_units: Optional[List[str]] = None,
+    selected_pods: Optional[List[str]] = None,
+    hour_adjustments: Optional[Dict[Any, Any]] = None,
+    include_utilization_series: bool = False,
+) -> Dict[str, Any]:
+    """Run the dashboard's independent computations in parallel on the shared pool.
+
+    Shared by the page and /api/creatives. Tasks statistics need the
+    headcount total, so that job waits on the headcount future.
+    """
+    # Capture app context before threading
+    app = current_app._get_current_object()
+    month_start, month_end = view.period_start, view.period_end
+    if use_bu_assignment_filters:
+        filter_kwargs: Dict[str, Any] = {
+            "use_bu_assignment_filters": True,
+            "selected_business_units": selected_business_units or None,
+            "selected_sub_business_units": selected_sub_business_units or None,
+            "selected_pods": selected_pods or None,
+        }
+    else:
+        filter_kwargs = {
+            "selected_markets": selected_markets or None,
+            "selected_pools": selected_pools or None,
+        }
+    # Build the request-scoped services here, on the request thread, and let
+    # the jobs close over them: worker threads get their own empty ``g``, so
+    # looking them up there would rebuild services (and check out Odoo
+    # clients) per job. Each service is used by exactly one job, and with
+    # their services in hand those jobs need no app context of their own.
+    headcount_service = _get_headcount_service()
+    overtime_service = _get_overtime_service()
+    tasks_service = _get_tasks_service()
+
+    def _compute_aggregates():
+        # Needs a context: the comparison fallback resolves g-cached services.
+        with app.app_context():
+            return _creatives_aggregates(all_creatives, view, include_comparison=True, **filter_kwargs)
+
+    def _compute_headcount():
+        return headcount_service.calculate_headcount(
+            view.period_start,
+            all_creatives_from_odoo,
+            all_creatives,
+            period_end_inclusive=month_end,
+            **filter_kwargs,
+        )
+
+    def _compute_overtime_stats():
+        return overtime_service.calculate_overtime_statistics(
+            month_start,
+            month_end,
+            creatives=all_creatives,
+        )
+
+    def _compute_utilization_series():
+        with app.app_context():
+            utilization_service = _get_utilization_service()
+            utilization_cache_service = None
+            try:
+                from ...services.utilization_cache_service import UtilizationCacheService
+                utilization_cache_service = UtilizationCacheService.from_env()
+            except Exception as e:
+                current_app.logger.debug(f"Utilization cache not available: {e}")
+
+            return utilization_service.calculate_monthly_utilization_series(
+                view.series_anchor_month,
+                cache_service=utilization_cache_service,
+                hour_adjustments=hour_adjustments,
+            )
+
+    # (client external hours already run on the prefetch thread)
+    executor = _DASHBOARD_POOL
+    futures = {
+        "headcount": executor.submit(_compute_headcount),
+        "aggregates": executor.submit(_compute_aggregates),
+        "overtime_stats": executor.submit(_compute_overtime_stats),
+    }
+    if include_utilization_series:
+        futures["monthly_utilization_series"] = executor.submit(_compute_utilization_series)
+
+    # Start tasks calculation as soon as headcount is ready
+    def _compute_tasks_after_headcount():
+        hc = futures["headcount"].result()
+        return tasks_service.calculate_tasks_statistics(
+            all_creatives,
+            month_start,
+            month_end,
+            hc.get("total", 0),
+        )
+
+    futures["tasks_stats"] = executor.submit(_compute_tasks_after_headcount)
+
+    # The creative counts and per-market stats are a quick in-memory pass;
+    # run them here while the Odoo-bound jobs are in flight.
+    bundle: Dict[str, Any] = {
+        "stats": _creatives_stats(
+            creatives, all_creatives_from_odoo, view.market_anchor_month, all_creatives
+        ),
+        "pool_stats": _pool_stats(creatives, view.market_anchor_month),
+    }
+    bundle.update((key, future.result()) for key, future in futures.items())
+    return bundle
 
 
 @creatives_bp.route("/")
@@ -90,8 +182,7 @@ def dashboard():
 
         # Get all creatives from Odoo FIRST (before any filtering) for total creatives count
         # Use get_all_creatives() to include inactive creatives in the total count
-        employee_service = _get_employee_service()
-        all_creatives_from_odoo = employee_service.get_all_creatives(include_inactive=True)
+        all_creatives_from_odoo = _get_all_creatives(include_inactive=True)
 
         # Supabase hour overrides, fetched once for the whole request; both the
         # availability enrichment and the utilization series consume this map.
@@ -114,7 +205,7 @@ def dashboard():
         )
         selected_markets, selected_pools = _parse_filter_params(request.args)
         if not session.get("dashboard_market_filter_visible"):
-            selected_markets = []
+            selected_markets = frozenset()
 
         if use_bu_assignment_filters:
             creatives = _filter_creatives_by_bu_assignment(
@@ -128,139 +219,36 @@ def dashboard():
             )
             available_markets, available_pools = [], []
         else:
-            creatives = _filter_creatives_by_market_and_pool(
+            creatives, available_markets, available_pools = _filter_and_index_markets_and_pools(
                 all_creatives,
                 selected_markets if selected_markets else None,
                 selected_pools if selected_pools else None,
             )
-            available_markets, available_pools = _get_available_markets_and_pools(all_creatives)
             available_business_units = []
             available_sub_business_units = []
             available_pods_opts = []
         
-        # Parallelize independent operations to reduce load time
-        # Capture app context and settings before threading
-        app = current_app._get_current_object()
-        settings = current_app.config["ODOO_SETTINGS"]
-        agreement_type = request.args.get("agreement_type")
-        account_type = request.args.get("account_type")
-        
-        def _compute_stats_with_context():
-            with app.app_context():
-                return _creatives_stats(creatives, all_creatives_from_odoo, view.market_anchor_month)
-        
-        def _compute_aggregates_with_context():
-            with app.app_context():
-                if use_bu_assignment_filters:
-                    return _creatives_aggregates(
-                        all_creatives,
-                        view,
-                        include_comparison=True,
-                        use_bu_assignment_filters=True,
-                        selected_business_units=selected_business_units if selected_business_units else None,
-                        selected_sub_business_units=(
-                            selected_sub_business_units if selected_sub_business_units else None
-                        ),
-                        selected_pods=selected_pods if selected_pods else None,
-                    )
-                return _creatives_aggregates(
-                    all_creatives,
-                    view,
-                    include_comparison=True,
-                    selected_markets=selected_markets if selected_markets else None,
-                    selected_pools=selected_pools if selected_pools else None,
-                )
-        
-        def _compute_pool_stats_with_context():
-            with app.app_context():
-                return _pool_stats(creatives, view.market_anchor_month)
-        
-        def _compute_headcount_with_context():
-            with app.app_context():
-                headcount_service = HeadcountService(_get_employee_service())
-                if use_bu_assignment_filters:
-                    return headcount_service.calculate_headcount(
-                        view.period_start,
-                        all_creatives_from_odoo,
-                        all_creatives,
-                        use_bu_assignment_filters=True,
-                        selected_business_units=(
-                            selected_business_units if selected_business_units else None
-                        ),
-                        selected_sub_business_units=(
-                            selected_sub_business_units if selected_sub_business_units else None
-                        ),
-                        selected_pods=selected_pods if selected_pods else None,
-                        period_end_inclusive=month_end,
-                    )
-                return headcount_service.calculate_headcount(
-                    view.period_start,
-                    all_creatives_from_odoo,
-                    all_creatives,
-                    selected_markets=selected_markets if selected_markets else None,
-                    selected_pools=selected_pools if selected_pools else None,
-                    period_end_inclusive=month_end,
-                )
-        
-        def _compute_overtime_stats_with_context():
-            with app.app_context():
-                from ...services.overtime_service import OvertimeService
-                overtime_service = OvertimeService.from_settings(settings)
-                return overtime_service.calculate_overtime_statistics(
-                    month_start, 
-                    month_end,
-                    creatives=all_creatives,
-                )
-        
-        def _compute_utilization_series_with_context():
-            with app.app_context():
-                utilization_service = _get_utilization_service()
-                utilization_cache_service = None
-                try:
-                    from ...services.utilization_cache_service import UtilizationCacheService
-                    utilization_cache_service = UtilizationCacheService.from_env()
-                except Exception as e:
-                    current_app.logger.debug(f"Utilization cache not available: {e}")
-                
-                return utilization_service.calculate_monthly_utilization_series(
-                    view.series_anchor_month,
-                    cache_service=utilization_cache_service,
-                    hour_adjustments=hour_adjustments,
-                )
-        
-        # Execute all computations in parallel with smart dependency handling
-        # (client external hours already run on the prefetch thread).
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_stats = executor.submit(_compute_stats_with_context)
-            future_aggregates = executor.submit(_compute_aggregates_with_context)
-            future_pool_stats = executor.submit(_compute_pool_stats_with_context)
-            future_headcount = executor.submit(_compute_headcount_with_context)
-            future_overtime_stats = executor.submit(_compute_overtime_stats_with_context)
-            future_utilization_series = executor.submit(_compute_utilization_series_with_context)
-            
-            # Start tasks calculation as soon as headcount is ready
-            def _compute_tasks_after_headcount():
-                with app.app_context():
-                    # Wait for headcount to complete
-                    hc = future_headcount.result()
-                    tasks_service = _get_tasks_service()
-                    return tasks_service.calculate_tasks_statistics(
-                        all_creatives,
-                        month_start,
-                        month_end,
-                        hc.get("total", 0),
-                    )
-            
-            future_tasks = executor.submit(_compute_tasks_after_headcount)
-            
-            # Wait for all results
-            stats = future_stats.result()
-            aggregates = future_aggregates.result()
-            pool_stats = future_pool_stats.result()
-            headcount = future_headcount.result()
-            overtime_stats = future_overtime_stats.result()
-            tasks_stats = future_tasks.result()
-            monthly_utilization_series = future_utilization_series.result()
+        bundle = _compute_dashboard_bundle(
+            view,
+            all_creatives_from_odoo,
+            all_creatives,
+            creatives,
+            use_bu_assignment_filters=use_bu_assignment_filters,
+            selected_markets=selected_markets,
+            selected_pools=selected_pools,
+            selected_business_units=selected_business_units,
+            selected_sub_business_units=selected_sub_business_units,
+            selected_pods=selected_pods,
+            hour_adjustments=hour_adjustments,
+            include_utilization_series=True,
+        )
+        stats = bundle["stats"]
+        aggregates = bundle["aggregates"]
+        pool_stats = bundle["pool_stats"]
+        headcount = bundle["headcount"]
+        overtime_stats = bundle["overtime_stats"]
+        tasks_stats = bundle["tasks_stats"]
+        monthly_utilization_series = bundle["monthly_utilization_series"]
 
         from ...services.overtime_service import attach_overtime_to_creatives
         attach_overtime_to_creatives(all_creatives, overtime_stats)
@@ -335,6 +323,101 @@ def dashboard():
         return render_template("creatives/dashboard.html", **context), 503
 
 
+def _ndjson_response(payload: Dict[str, Any], rows_key: str) -> Response:
+    """Stream ``payload`` as NDJSON: a header object, then one line per row.
+
+    The header carries every key except ``rows_key`` plus ``<rows_key>_count``,
+    so clients can lay out the page before the rows arrive and the server
+    never holds the whole serialized body in memory.
+    """
+    dumps = current_app.json.dumps
+    rows = payload.get(rows_key) or []
+    header = {key: value for key, value in payload.items() if key != rows_key}
+    header[f"{rows_key}_count"] = len(rows)
+
+    def _generate() -> Iterable[str]:
+        yield dumps(header, separators=(",", ":")) + "\n"
+        for row in rows:
+            yield dumps(row, separators=(",", ":")) + "\n"
+
+    return Response(_generate(), mimetype="application/x-ndjson")
+
+
+# /api/creatives stats bundles (headcount, aggregates, overtime, tasks, ...),
+# reused while their inputs are unchanged, for at most the hours TTL. The ETag
+# is the inputs digest plus the time the bundle was computed, so a tag names
+# exactly one payload: an evicted or expired bundle is recomputed under a new
+# tag, never re-served under an old one.
+_API_BUNDLE_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_API_BUNDLE_CACHE_LOCK = threading.Lock()
+_API_BUNDLE_MAX_ENTRIES = 32
+
+
+def _creatives_api_inputs_digest(
+    view: DashboardViewPeriod,
+    roster: List[Dict[str, object]],
+    hours_stamp: float,
+    hour_adjustments: Dict[Any, Any],
+    nj_included: Iterable[Any],
+    client_external: Any,
+) -> str:
+    """Digest of everything the /api/creatives payload is computed from.
+
+    Every roster field is hashed, since rows reach the payload through
+    ``**creative``; ``hours_stamp`` is when the cached Odoo hours for the view
+    were fetched; the Supabase inputs are hashed directly.
+    """
+    dumps = current_app.json.dumps
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr(
+            (os.getpid(), view.selected_month_key, view.is_quarter, view.quarter, hours_stamp)
+        ).encode()
+    )
+    digest.update(dumps(
+        {
+            "roster": roster,
+            "adjustments": {str(k): v for k, v in (hour_adjustments or {}).items()},
+            "nj_included": sorted(str(i) for i in nj_included or ()),
+            "client_external": client_external,
+        },
+        sort_keys=True,
+        default=str,
+    ).encode())
+    return digest.hexdigest()
+
+
+def _cached_api_bundle(inputs_digest: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """The live ``(computed_at, bundle)`` entry for ``inputs_digest``, if any."""
+    now = time.monotonic()
+    with _API_BUNDLE_CACHE_LOCK:
+        entry = _API_BUNDLE_CACHE.get(inputs_digest)
+    if entry is None or (now - entry[0]) >= _HOURS_TTL_SECONDS:
+        return None
+    return entry
+
+
+def _store_api_bundle(inputs_digest: str, bundle: Dict[str, Any]) -> float:
+    computed_at = time.monotonic()
+    with _API_BUNDLE_CACHE_LOCK:
+        _API_BUNDLE_CACHE.pop(inputs_digest, None)
+        _API_BUNDLE_CACHE[inputs_digest] = (computed_at, bundle)
+        while len(_API_BUNDLE_CACHE) > _API_BUNDLE_MAX_ENTRIES:
+            _API_BUNDLE_CACHE.pop(next(iter(_API_BUNDLE_CACHE)))
+    return computed_at
+
+
+def _clear_api_bundle_cache() -> None:
+    with _API_BUNDLE_CACHE_LOCK:
+        _API_BUNDLE_CACHE.clear()
+
+
+def _creatives_api_etag(inputs_digest: str, computed_at: float) -> str:
+    return hashlib.blake2b(
+        f"{inputs_digest}:{computed_at!r}".encode(), digest_size=16
+    ).hexdigest()
+
+
 @creatives_bp.route("/api/creatives")
 def creatives_api():
     view = _resolve_view_period()
@@ -355,14 +438,42 @@ def creatives_api():
 
         # Get all creatives from Odoo FIRST (before any filtering) for total creatives count
         # Use get_all_creatives() to include inactive creatives in the total count
-        employee_service = _get_employee_service()
-        all_creatives_from_odoo = employee_service.get_all_creatives(include_inactive=True)
+        all_creatives_from_odoo = _get_all_creatives(include_inactive=True)
 
         # Supabase hour overrides, fetched once for the whole request.
         adjustments_thread.join()
         hour_adjustments = prefetch.get("adjustments", {})
         nj_included = prefetch.get("nj_included", set())
 
+        external_thread.join()
+        client_external_inputs = (
+            prefetch.get("client_external"),
+            prefetch.get("client_external_previous"),
+        )
+
+        # Conditional request: while the view's Odoo hours and its stats
+        # bundle are both cached, the payload is fully determined by inputs
+        # known at this point, so a matching If-None-Match is answered before
+        # enrichment and the stats bundle run.
+        wants_ndjson = request.args.get("format") == "ndjson"
+        hours_stamp = _period_hours_stamp(view, all_creatives_from_odoo)
+        if hours_stamp is not None and not wants_ndjson and request.if_none_match:
+            inputs_digest = _creatives_api_inputs_digest(
+                view,
+                all_creatives_from_odoo,
+                hours_stamp,
+                hour_adjustments,
+                nj_included,
+                client_external_inputs,
+            )
+            cached = _cached_api_bundle(inputs_digest)
+            if cached is not None:
+                etag = _creatives_api_etag(inputs_digest, cached[0])
+                if request.if_none_match.contains_weak(etag):
+                    response = Response(status=304)
+                    response.set_etag(etag, weak=True)
+                    return response
+
         # Now get creatives with availability (this filters to only those with market/pool)
         # Pass the same list to avoid double-fetching
         all_creatives = _creatives_with_availability(
@@ -392,90 +503,41 @@ def creatives_api():
             available_pods_opts = []
         
         
-        # Parallelize computations for faster API response
-        app = current_app._get_current_object()
-        settings = current_app.config["ODOO_SETTINGS"]
-        agreement_type = request.args.get("agreement_type")
-        account_type = request.args.get("account_type")
-        
-        def _compute_stats_api():
-            with app.app_context():
-                return _creatives_stats(creatives, all_creatives_from_odoo, view.market_anchor_month)
-        
-        def _compute_aggregates_api():
-            with app.app_context():
-                # No market/pool filtering for aggregates since we return all creatives
-                return _creatives_aggregates(
-                    all_creatives,
-                    view,
-                    include_comparison=True,
-                    selected_markets=None,
-                    selected_pools=None,
-                )
-        
-        def _compute_pool_stats_api():
-            with app.app_context():
-                return _pool_stats(creatives, view.market_anchor_month)
-        
-        def _compute_headcount_api():
-            with app.app_context():
-                headcount_service = HeadcountService(_get_employee_service())
-                # No market/pool filtering for headcount since we return all creatives
-                return headcount_service.calculate_headcount(
-                    view.period_start,
-                    all_creatives_from_odoo, 
-                    all_creatives,
-                    selected_markets=None,
-                    selected_pools=None,
-                    period_end_inclusive=month_end,
-                )
-        
-        def _compute_overtime_api():
-            with app.app_context():
-                from ...services.overtime_service import OvertimeService
-                overtime_service = OvertimeService.from_settings(settings)
-                # Return overtime for all creatives - filtering happens client-side
-                return overtime_service.calculate_overtime_statistics(
-                    month_start, 
-                    month_end,
-                    creatives=all_creatives,
+        # Assignment filters are applied client-side: stats cover every creative.
+        # Re-read the stamp after enrichment: it names the hours entry the rows
+        # were built from (fetched just now on a cold cache).
+        etag = None
+        hours_stamp = _period_hours_stamp(view, all_creatives_from_odoo)
+        if hours_stamp is None:
+            bundle = _compute_dashboard_bundle(view, all_creatives_from_odoo, all_creatives, creatives)
+        else:
+            inputs_digest = _creatives_api_inputs_digest(
+                view,
+                all_creatives_from_odoo,
+                hours_stamp,
+                hour_adjustments,
+                nj_included,
+                client_external_inputs,
+            )
+            cached = _cached_api_bundle(inputs_digest)
+            if cached is not None:
+                computed_at, bundle = cached
+            else:
+                bundle = _compute_dashboard_bundle(
+                    view, all_creatives_from_odoo, all_creatives, creatives
                 )
-
-        # (client external hours already run on the prefetch thread)
-        with ThreadPoolExecutor(max_workers=7) as executor:
-            future_stats = executor.submit(_compute_stats_api)
-            future_aggregates = executor.submit(_compute_aggregates_api)
-            future_pool_stats = executor.submit(_compute_pool_stats_api)
-            future_headcount = executor.submit(_compute_headcount_api)
-            future_overtime = executor.submit(_compute_overtime_api)
-            
-            # Tasks depends on headcount
-            def _compute_tasks_api():
-                with app.app_context():
-                    hc = future_headcount.result()
-                    tasks_service = _get_tasks_service()
-                    # Return tasks for all creatives - filtering happens client-side
-                    return tasks_service.calculate_tasks_statistics(
-                        all_creatives,
-                        month_start,
-                        month_end,
-                        hc.get("total", 0),
-                    )
-            
-            future_tasks = executor.submit(_compute_tasks_api)
-            
-            # Collect results
-            stats = future_stats.result()
-            aggregates = future_aggregates.result()
-            pool_stats = future_pool_stats.result()
-            headcount = future_headcount.result()
-            overtime_stats = future_overtime.result()
-            tasks_stats = future_tasks.result()
+                computed_at = _store_api_bundle(inputs_digest, bundle)
+            etag = _creatives_api_etag(inputs_digest, computed_at)
+        stats = bundle["stats"]
+        aggregates = bundle["aggregates"]
+        pool_stats = bundle["pool_stats"]
+        headcount = bundle["headcount"]
+        overtime_stats = bundle["overtime_stats"]
+        tasks_stats = bundle["tasks_stats"]
 
         from ...services.overtime_service import attach_overtime_to_creatives
         attach_overtime_to_creatives(all_creatives, overtime_stats)
 
-        external_thread.join()
         client_external_hours_all, client_subscription_hours_all = prefetch.get(
             "client_external", ([], [])
         )
@@ -506,7 +568,15 @@ def creatives_api():
             "has_previous_month": has_previous_period,
             "odoo_unavailable": False,
         }
-        return jsonify(response_payload)
+        # ?format=ndjson streams the creatives row by row (see _ndjson_response).
+        if wants_ndjson:
+            return _ndjson_response(response_payload, "creatives")
+        # Input-derived ETag (see _API_BUNDLE_CACHE): weak, so the gzip
+        # hook's weakened tag still validates on the next poll.
+        response = jsonify(response_payload)
+        if etag is not None:
+            response.set_etag(etag, weak=True)
+        return response.make_conditional(request)
     except OdooUnavailableError as exc:
         current_app.logger.warning("Odoo unavailable while serving creatives API", exc_info=True)
         error_message = str(exc) if str(exc) else "Unable to connect to Odoo. Please try again later."
@@ -1,48 +1,10 @@
 """Sales endpoints: /api/sales, refresh-invoiced, refresh-sales-orders."""
 from __future__ import annotations
 
-import os
-import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
+from typing import Tuple
+from flask import current_app, jsonify
+from ...integrations.odoo_client import OdooUnavailableError
 from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
 from ..auth import require_sales_auth
 from .blueprint import creatives_bp
 from .deps import _get_sales_cache_service, _get_sales_service, _new_sales_service
@@ -130,6 +92,11 @@ def sales_api():
                 "ext_sales_orders": executor.submit(
                     svc_call, "_get_sales_order_details_for_external_hours", period_start, period_end
                 ),
+                # Comparison month for subscription_stats; independent of the
+                # current-period fetches, so it overlaps them.
+                "prev_subscription_stat_orders": executor.submit(
+                    svc_call, "_previous_subscription_stat_orders", period_start
+                ),
             }
             if previous_period:
                 futures["prev_subscriptions"] = executor.submit(
@@ -149,8 +116,11 @@ def sales_api():
                 ext_orders = futures["ext_sales_orders"].result()
                 prev_subs = futures["prev_subscriptions"].result() if previous_period else None
                 prev_ext_orders = futures["prev_ext_sales_orders"].result() if previous_period else None
+                prev_stat_orders = futures["prev_subscription_stat_orders"].result()
                 svc = _new_sales_service(odoo_settings)
-                stats = svc.get_subscription_statistics(period_start, period_end, subscriptions=subs)
+                stats = svc.get_subscription_statistics(
+                    period_start, period_end, subscriptions=subs, previous_orders=prev_stat_orders
+                )
                 totals = svc.get_external_hours_totals(
                     period_start,
                     period_end,
@@ -1,49 +1,16 @@
 """Stats/aggregates/pool-stats computation, hour formatters, empty-state builders."""
 from __future__ import annotations
 
-import os
-import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
-from dataclasses import dataclass
-from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from flask import current_app, session
 from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
+    bu_assignment_filter,
     resolve_business_unit_for_month,
-    split_assignment_field_tokens,
     use_business_unit_model,
 )
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
+from ...services.creative_market import _get_creative_market_for_month
 from .deps import _get_comparison_service
 from .view_period import DashboardViewPeriod, _month_part_options, _year_options
 
@@ -52,6 +19,7 @@ def _creatives_stats(
     creatives: List[Dict[str, object]],
     all_creatives_from_odoo: List[Dict[str, object]],
     market_anchor_month: date,
+    enriched_creatives: Optional[List[Dict[str, object]]] = None,
 ) -> Dict[str, int]:
     """Calculate creative statistics.
 
@@ -59,6 +27,10 @@ def _creatives_stats(
         creatives: Filtered list of creatives (with market/pool for selected month)
         all_creatives_from_odoo: All creatives from Odoo (configured creative departments, e.g. Creative and Creative Strategy)
         market_anchor_month: Month used for market/pool assignment (end of period for quarters).
+        enriched_creatives: ``_creatives_with_availability`` output for
+            ``all_creatives_from_odoo`` at the same anchor, when the caller has
+            it; the assignments it already resolved are counted instead of
+            resolving every creative again.
 
     Returns:
         Dictionary with total, available, and active counts
@@ -71,7 +43,17 @@ def _creatives_stats(
     # Pre-cutover this means market + pool; post-cutover (2026-04-01+) it means
     # a Business Unit slot whose dates contain the month.
     available = 0
-    if all_creatives_from_odoo:
+    if enriched_creatives is not None:
+        # Enrichment keeps exactly the creatives with a BU label (post-cutover)
+        # or a market (pre-cutover); only the pool still needs checking.
+        if use_business_unit_model(market_anchor_month):
+            available = len(enriched_creatives)
+        else:
+            available = sum(
+                1 for creative in enriched_creatives
+                if creative.get("market_slug") and creative.get("pool_name")
+            )
+    elif all_creatives_from_odoo:
         if use_business_unit_model(market_anchor_month):
             for creative in all_creatives_from_odoo:
                 bu = resolve_business_unit_for_month(creative, market_anchor_month)
@@ -92,13 +74,34 @@ def _creatives_stats(
     active = 0
     if creatives:
         for creative in creatives:
-            logged_hours = float(creative.get("logged_hours", 0) or 0)
-            if logged_hours > 0:
+            if (creative.get("logged_hours") or 0.0) > 0:
                 active += 1
 
     return {"total": total, "available": available, "active": active}
 
 
+def _market_pool_predicate(
+    selected_markets: Optional[List[str]],
+    selected_pools: Optional[List[str]],
+) -> Optional[Callable[[object, object], bool]]:
+    """Match ``(market_slug, pool_name)`` against the selection; None when nothing is selected."""
+    market_filter = frozenset(m.lower() for m in selected_markets or [])
+    pool_filter = frozenset(selected_pools or [])
+    if not market_filter and not pool_filter:
+        return None
+
+    def _matches(market_slug: object, pool_name: object) -> bool:
+        if market_filter and not (
+            isinstance(market_slug, str) and market_slug and market_slug.lower() in market_filter
+        ):
+            return False
+        if pool_filter and (not pool_name or pool_name not in pool_filter):
+            return False
+        return True
+
+    return _matches
+
+
 def _creatives_aggregates(
     creatives: List[Dict[str, object]],
     view: Optional[DashboardViewPeriod] = None,
@@ -113,36 +116,34 @@ def _creatives_aggregates(
 ) -> Dict[str, Any]:
     """Calculate aggregates with optional comparison to the previous month or quarter."""
 
-    market_filter = {m.lower() for m in selected_markets or []} or None
-    pool_filter = set(selected_pools or []) or None
-
-    def _matches_filters(creative: Dict[str, object]) -> bool:
-        if use_bu_assignment_filters:
-            return creative_matches_bu_assignment_filters(
-                creative,
-                selected_business_units,
-                selected_sub_business_units,
-                selected_pods,
-            )
-        market_slug = creative.get("market_slug")
-        pool_name = creative.get("pool_name")
-        normalized_market = market_slug.lower() if isinstance(market_slug, str) else None
-        if market_filter and (not normalized_market or normalized_market not in market_filter):
-            return False
-        if pool_filter:
-            if not pool_name:
-                return False
-            if pool_name not in pool_filter:
-                return False
-        return True
-
-    filtered_creatives = [c for c in creatives if _matches_filters(c)]
+    if use_bu_assignment_filters:
+        matches_bu = bu_assignment_filter(
+            selected_business_units, selected_sub_business_units, selected_pods
+        )
+        matches_market_pool = None
+    else:
+        matches_bu = None
+        matches_market_pool = _market_pool_predicate(selected_markets, selected_pools)
+
+    # The dashboard filters client-side, so the usual call has no filters at
+    # all and every creative is counted without a per-row predicate.
+    if matches_bu is not None:
+        filtered_creatives = [c for c in creatives if matches_bu(c)]
+    elif matches_market_pool is not None:
+        filtered_creatives = [
+            c for c in creatives if matches_market_pool(c.get("market_slug"), c.get("pool_name"))
+        ]
+    else:
+        filtered_creatives = creatives
 
-    totals = {"planned": 0.0, "logged": 0.0, "available": 0.0}
+    # Enrichment stores hours as rounded floats (previous_* may be None), so
+    # the hot loops below only default missing values instead of coercing.
+    planned_total = logged_total = available_total = 0.0
     for creative in filtered_creatives:
-        totals["planned"] += float(creative.get("planned_hours", 0.0) or 0.0)
-        totals["logged"] += float(creative.get("logged_hours", 0.0) or 0.0)
-        totals["available"] += float(creative.get("available_hours", 0.0) or 0.0)
+        planned_total += creative.get("planned_hours") or 0.0
+        logged_total += creative.get("logged_hours") or 0.0
+        available_total += creative.get("available_hours") or 0.0
+    totals = {"planned": planned_total, "logged": logged_total, "available": available_total}
     max_value = max(totals.values()) if totals else 0.0
     display = {key: _format_hours_minutes(value) for key, value in totals.items()}
 
@@ -152,25 +153,16 @@ def _creatives_aggregates(
         previous_totals = {"planned": 0.0, "logged": 0.0, "available": 0.0}
         has_data = False
         for creative in creatives:
-            if use_bu_assignment_filters:
+            if matches_bu is not None:
                 prev_proxy: Dict[str, object] = {
                     "business_unit": creative.get("previous_business_unit"),
                     "sub_business_unit": creative.get("previous_sub_business_unit"),
                     "pod": creative.get("previous_pod"),
                 }
-                if not creative_matches_bu_assignment_filters(
-                    prev_proxy,
-                    selected_business_units,
-                    selected_sub_business_units,
-                    selected_pods,
-                ):
+                if not matches_bu(prev_proxy):
                     continue
-            elif not _matches_filters(
-                {
-                    "business_unit": None,
-                    "market_slug": creative.get("previous_market_slug"),
-                    "pool_name": creative.get("previous_pool_name"),
-                }
+            elif matches_market_pool is not None and not matches_market_pool(
+                creative.get("previous_market_slug"), creative.get("previous_pool_name")
             ):
                 continue
             prev_available = creative.get("previous_available_hours")
@@ -179,9 +171,9 @@ def _creatives_aggregates(
             if prev_available is None and prev_planned is None and prev_logged is None:
                 continue
             has_data = True
-            previous_totals["available"] += float(prev_available or 0.0)
-            previous_totals["planned"] += float(prev_planned or 0.0)
-            previous_totals["logged"] += float(prev_logged or 0.0)
+            previous_totals["available"] += prev_available or 0.0
+            previous_totals["planned"] += prev_planned or 0.0
+            previous_totals["logged"] += prev_logged or 0.0
         return previous_totals if has_data else None
 
     def _calculate_comparison_from_totals(
@@ -273,6 +265,10 @@ def _creatives_aggregates(
     return result
 
 
+# Only market-based pools (KSA, UAE) get pool cards, as (name, slug).
+_MARKET_POOLS = (("KSA", "ksa"), ("UAE", "uae"))
+
+
 def _pool_stats(creatives: List[Dict[str, object]], selected_month: date) -> List[Dict[str, Any]]:
     """Calculate market statistics based on market assignments for the selected month.
     
@@ -287,34 +283,35 @@ def _pool_stats(creatives: List[Dict[str, object]], selected_month: date) -> Lis
     Returns:
         List of market statistics dictionaries
     """
-    # Only include market-based pools (KSA, UAE)
-    market_pools = [
-        {"name": "KSA", "slug": "ksa"},
-        {"name": "UAE", "slug": "uae"},
-    ]
+    # One pass over the creatives accumulates every market's counters (the
+    # roster is a few hundred dicts; re-scanning it per metric and per
+    # market dominated this function).
+    # Per market: [total, available, active, available_h, planned_h, logged_h]
+    counters: Dict[str, List[float]] = {slug: [0, 0, 0, 0.0, 0.0, 0.0] for _, slug in _MARKET_POOLS}
+    for creative in creatives:
+        bucket = counters.get(creative.get("market_slug"))
+        if bucket is None:
+            continue
+        available_hours = creative.get("available_hours") or 0.0
+        logged_hours = creative.get("logged_hours") or 0.0
+        bucket[0] += 1
+        if available_hours > 0:
+            bucket[1] += 1
+        if logged_hours > 0:
+            bucket[2] += 1
+        bucket[3] += available_hours
+        bucket[4] += creative.get("planned_hours") or 0.0
+        bucket[5] += logged_hours
 
     results: List[Dict[str, Any]] = []
-    
-    # Process market-based pools using market_slug from creatives
-    for pool in market_pools:
-        pool_slug = pool["slug"]
-        members = [
-            creative
-            for creative in creatives
-            if creative.get("market_slug") == pool_slug
-        ]
-        
-        total = len(members)
-        available = sum(1 for creative in members if float(creative.get("available_hours", 0) or 0) > 0)
-        active = sum(1 for creative in members if float(creative.get("logged_hours", 0) or 0) > 0)
-        total_available_hours = sum(float(creative.get("available_hours", 0) or 0) for creative in members)
-        total_planned_hours = sum(float(creative.get("planned_hours", 0) or 0) for creative in members)
-        total_logged_hours = sum(float(creative.get("logged_hours", 0) or 0) for creative in members)
-        
+    for name, slug in _MARKET_POOLS:
+        total, available, active, total_available_hours, total_planned_hours, total_logged_hours = (
+            counters[slug]
+        )
         results.append(
             {
-                "name": pool["name"],
-                "slug": pool["slug"],
+                "name": name,
+                "slug": slug,
                 "total_creatives": total,
                 "available_creatives": available,
                 "active_creatives": active,
@@ -330,6 +327,8 @@ def _pool_stats(creatives: List[Dict[str, object]], selected_month: date) -> Lis
     return results
 
 
+# Hour/percent values repeat heavily across a roster (0h, full months, 100%).
+@lru_cache(maxsize=1024)
 def _format_hours_minutes(value: float) -> str:
     total_minutes = int(round(value * 60))
     hours, minutes = divmod(total_minutes, 60)
@@ -344,6 +343,7 @@ def _calculate_utilization(numerator: float, denominator: float) -> float:
     return round((numerator / denominator) * 100, 1)
 
 
+@lru_cache(maxsize=1024)
 def _format_percentage(value: float) -> str:
     rounded = round(value, 1)
     if float(rounded).is_integer():
@@ -359,6 +359,7 @@ def _utilization_status(planned_percent: float, logged_percent: float) -> str:
     return "healthy"
 
 
+@lru_cache(maxsize=1024)
 def _format_hours_display(value: float) -> str:
     if not value or abs(value) < 1e-6:
         return "0h"
@@ -1,51 +1,17 @@
 """Dashboard view-period resolution, date math, and shared constants."""
 from __future__ import annotations
 
-import os
 import re
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from copy import deepcopy
 from dataclasses import dataclass
 from calendar import month_name, monthrange
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
-from flask import Blueprint, current_app, g, jsonify, render_template, request, session
-from ...integrations.odoo_client import OdooClient, OdooUnavailableError
-from ...services.assignment_service import (
-    BusinessUnitAssignment,
-    creative_matches_bu_assignment_filters,
-    resolve_business_unit_for_month,
-    split_assignment_field_tokens,
-    use_business_unit_model,
-)
-from ...services.availability_service import AvailabilityService, AvailabilitySummary
-from ...services.employee_service import EmployeeService
-from ...services.external_hours_service import ExternalHoursService
-from ...services.planning_service import PlanningService
-from ...services.timesheet_service import TimesheetService
-from ...services.utilization_service import (
-    MONTHLY_UTILIZATION_CACHE_MIN,
-    UtilizationService,
-    _inclusive_month_tuple_sequence,
-)
-from ...services.supabase_cache_service import SupabaseCacheService
-from ...services.sales_cache_service import SalesCacheService
-from ...services.creative_market import (
-    _get_creative_market_for_month,
-    _normalize_market_name,
-)
-from ...services.comparison_service import ComparisonService
-from ...services.email_settings_service import EmailSettingsService
-from ...services.creative_hour_adjustments_service import CreativeHourAdjustmentsService
-from ...services.strategy_and_external_hours_service import StrategyAndExternalHoursService
-from ...services.email_service import EmailService
-from ...services.alert_service import AlertService
-from ...services.headcount_service import HeadcountService
-from ...services.new_joiner_period import parse_joining_date, period_overlaps_new_joiner_ramp
-from ..auth import require_sales_auth
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from flask import request
 
 
+@lru_cache(maxsize=64)
 def _month_bounds(month_start: date) -> Tuple[date, date]:
     last_day = monthrange(month_start.year, month_start.month)[1]
     month_end = month_start.replace(day=last_day)
@@ -54,6 +20,8 @@ def _month_bounds(month_start: date) -> Tuple[date, date]:
 
 MIN_MONTH = date(2025, 1, 1)
 
+_MONTH_RE = re.compile(r"^(\d{4})-(\d{1,2})$")
+
 
 POOL_DEFINITIONS = [
     {"slug": "ksa", "label": "KSA", "tag": "ksa"},
@@ -102,7 +70,13 @@ def _previous_quarter_bounds(year: int, quarter: int) -> Tuple[date, date]:
 
 
 def _month_period_from_anchor(anchor: date) -> DashboardViewPeriod:
-    anchor = max(anchor.replace(day=1), MIN_MONTH)
+    return _month_period(max(anchor.replace(day=1), MIN_MONTH))
+
+
+# Periods are frozen and depend only on their month/quarter, so each is built
+# (bounds, strftime labels) once per process and shared by every request.
+@lru_cache(maxsize=64)
+def _month_period(anchor: date) -> DashboardViewPeriod:
     period_start, period_end = _month_bounds(anchor)
     has_previous_period = anchor > MIN_MONTH
     if has_previous_period:
@@ -125,6 +99,27 @@ def _month_period_from_anchor(anchor: date) -> DashboardViewPeriod:
     )
 
 
+@lru_cache(maxsize=32)
+def _quarter_period(year: int, q: int) -> DashboardViewPeriod:
+    period_start, period_end = _quarter_bounds(year, q)
+    prev_start, prev_end = _previous_quarter_bounds(year, q)
+    has_previous_period = prev_start >= MIN_MONTH
+    anchor = date(period_end.year, period_end.month, 1)
+    return DashboardViewPeriod(
+        period_start=period_start,
+        period_end=period_end,
+        previous_period_start=prev_start,
+        previous_period_end=prev_end,
+        is_quarter=True,
+        quarter=q,
+        market_anchor_month=anchor,
+        series_anchor_month=anchor,
+        display_label=f"Q{q} {year}",
+        has_previous_period=has_previous_period,
+        selected_month_key=f"{year}-Q{q}",
+    )
+
+
 def _resolve_view_period() -> DashboardViewPeriod:
     """Parse dashboard period from query string (month, quarter, legacy YYYY-MM)."""
     today = date.today()
@@ -140,25 +135,7 @@ def _resolve_view_period() -> DashboardViewPeriod:
         mu = month_str.upper()
         if len(mu) == 2 and mu[1] in "1234":
             try:
-                year = int(year_str)
-                q = int(mu[1])
-                period_start, period_end = _quarter_bounds(year, q)
-                prev_start, prev_end = _previous_quarter_bounds(year, q)
-                has_previous_period = prev_start >= MIN_MONTH
-                anchor = date(period_end.year, period_end.month, 1)
-                return DashboardViewPeriod(
-                    period_start=period_start,
-                    period_end=period_end,
-                    previous_period_start=prev_start,
-                    previous_period_end=prev_end,
-                    is_quarter=True,
-                    quarter=q,
-                    market_anchor_month=anchor,
-                    series_anchor_month=anchor,
-                    display_label=f"Q{q} {year}",
-                    has_previous_period=has_previous_period,
-                    selected_month_key=f"{year}-Q{q}",
-                )
+                return _quarter_period(int(year_str), int(mu[1]))
             except (ValueError, OverflowError):
                 pass
 
@@ -175,12 +152,13 @@ def _resolve_view_period() -> DashboardViewPeriod:
 
     # Legacy: month=YYYY-MM
     if month_str and "-" in month_str and "Q" not in month_str.upper():
-        try:
-            parsed = datetime.strptime(month_str, "%Y-%m")
-            anchor = parsed.date().replace(day=1)
-            return _month_period_from_anchor(max(anchor, MIN_MONTH))
-        except ValueError:
-            pass
+        match = _MONTH_RE.match(month_str)
+        if match:
+            try:
+                anchor = date(int(match.group(1)), int(match.group(2)), 1)
+                return _month_period_from_anchor(max(anchor, MIN_MONTH))
+            except ValueError:
+                pass
 
     return _month_period_from_anchor(default_anchor)
 
@@ -190,11 +168,17 @@ def _resolve_month() -> date:
     return _resolve_view_period().period_start
 
 
-def _month_part_options() -> List[Dict[str, str]]:
+# Static, so built once and shared by every request; read-only so no caller
+# can alter what later requests render.
+_MONTH_PART_OPTIONS: Tuple[Mapping[str, str], ...] = (
+    *(MappingProxyType({"value": f"Q{i}", "label": f"Q{i}"}) for i in range(1, 5)),
+    *(MappingProxyType({"value": f"{m:02d}", "label": month_name[m]}) for m in range(1, 13)),
+)
+
+
+def _month_part_options() -> Tuple[Mapping[str, str], ...]:
     """Quarters plus January–December."""
-    quarters = [{"value": f"Q{i}", "label": f"Q{i}"} for i in range(1, 5)]
-    months = [{"value": f"{m:02d}", "label": month_name[m]} for m in range(1, 13)]
-    return quarters + months
+    return _MONTH_PART_OPTIONS
 
 
 def _year_options(center_month: date) -> List[Dict[str, str]]:
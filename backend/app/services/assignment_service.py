@@ -23,10 +23,12 @@ rows without dates are excluded unless a **previous** slot has a valid window).
 """
 from __future__ import annotations
 
+import sys
 from calendar import monthrange
 from dataclasses import dataclass
 from datetime import date
-from typing import Any, Iterable, Mapping, Optional, Set
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Iterable, Mapping, Optional
 
 
 CUTOVER_DATE = date(2026, 4, 1)
@@ -46,11 +48,72 @@ def use_business_unit_model(target_month: date) -> bool:
     return target_month >= CUTOVER_DATE
 
 
-def split_assignment_field_tokens(value: Any) -> Set[str]:
+def split_assignment_field_tokens(value: Any) -> FrozenSet[str]:
     """Split a comma-separated BU / SBU / Pod display string into trimmed tokens."""
     if not value or not isinstance(value, str):
-        return set()
-    return {part.strip() for part in value.split(",") if part.strip()}
+        return frozenset()
+    return _split_assignment_tokens(value)
+
+
+def lowered_assignment_field_tokens(value: Any) -> FrozenSet[str]:
+    """Case-folded ``split_assignment_field_tokens`` for case-insensitive matching."""
+    if not value or not isinstance(value, str):
+        return frozenset()
+    return _lowered_assignment_tokens(value)
+
+
+# The roster carries only a few distinct assignment strings, and filtering,
+# option collection and the department filter all split the same ones; tokens
+# are interned so the shared sets compare by identity.
+@lru_cache(maxsize=1024)
+def _split_assignment_tokens(value: str) -> FrozenSet[str]:
+    return frozenset(sys.intern(part.strip()) for part in value.split(",") if part.strip())
+
+
+@lru_cache(maxsize=1024)
+def _lowered_assignment_tokens(value: str) -> FrozenSet[str]:
+    return frozenset(sys.intern(token.lower()) for token in _split_assignment_tokens(value))
+
+
+def _selected_tokens(values: Optional[Iterable[str]]) -> FrozenSet[str]:
+    return frozenset(
+        str(x).strip() for x in (values or ()) if x is not None and str(x).strip()
+    )
+
+
+def bu_assignment_filter(
+    selected_business_units: Optional[Iterable[str]] = None,
+    selected_sub_business_units: Optional[Iterable[str]] = None,
+    selected_pods: Optional[Iterable[str]] = None,
+) -> Optional[Callable[[Mapping[str, Any]], bool]]:
+    """Build the BU / SBU / Pod predicate once; None when nothing is selected.
+
+    Same semantics as ``creative_matches_bu_assignment_filters``, with the
+    selections normalized up front instead of on every creative.
+    """
+    bu_sel = _selected_tokens(selected_business_units)
+    sbu_sel = _selected_tokens(selected_sub_business_units)
+    pod_sel = _selected_tokens(selected_pods)
+    if not bu_sel and not sbu_sel and not pod_sel:
+        return None
+
+    checks = tuple(
+        (field, selected)
+        for field, selected in (
+            ("business_unit", bu_sel),
+            ("sub_business_unit", sbu_sel),
+            ("pod", pod_sel),
+        )
+        if selected
+    )
+
+    def _matches(creative: Mapping[str, Any]) -> bool:
+        for field, selected in checks:
+            if selected.isdisjoint(split_assignment_field_tokens(creative.get(field))):
+                return False
+        return True
+
+    return _matches
 
 
 def creative_matches_bu_assignment_filters(
@@ -63,24 +126,12 @@ def creative_matches_bu_assignment_filters(
 
     Selected values match if they appear as comma-separated tokens on the corresponding
     field (same storage shape as enriched ``business_unit`` / ``sub_business_unit`` / ``pod``).
+    Filtering many creatives? Build the predicate once with ``bu_assignment_filter``.
     """
-    bu_sel = [str(x).strip() for x in (selected_business_units or ()) if x is not None and str(x).strip()]
-    sbu_sel = [str(x).strip() for x in (selected_sub_business_units or ()) if x is not None and str(x).strip()]
-    pod_sel = [str(x).strip() for x in (selected_pods or ()) if x is not None and str(x).strip()]
-    if not bu_sel and not sbu_sel and not pod_sel:
-        return True
-
-    bu_tokens = split_assignment_field_tokens(creative.get("business_unit"))
-    sbu_tokens = split_assignment_field_tokens(creative.get("sub_business_unit"))
-    pod_tokens = split_assignment_field_tokens(creative.get("pod"))
-
-    if bu_sel and not bu_tokens.intersection(bu_sel):
-        return False
-    if sbu_sel and not sbu_tokens.intersection(sbu_sel):
-        return False
-    if pod_sel and not pod_tokens.intersection(pod_sel):
-        return False
-    return True
+    matches = bu_assignment_filter(
+        selected_business_units, selected_sub_business_units, selected_pods
+    )
+    return matches is None or matches(creative)
 
 
 def resolve_business_unit_for_month(
@@ -201,14 +252,15 @@ def _clean_assignment_label(value: Any) -> Optional[str]:
         if not value:
             return None
         if all(isinstance(item, (list, tuple)) and len(item) >= 2 for item in value):
-            names: list[str] = []
+            # Ordered de-duplication: dict keys keep first-seen order.
+            names: dict[str, None] = {}
             for item in value:
                 label = item[1]
                 if label is None or label is False:
                     continue
                 t = str(label).strip()
-                if t and t not in names:
-                    names.append(t)
+                if t:
+                    names[t] = None
             return ", ".join(names) if names else None
         if len(value) == 2 and isinstance(value[0], int) and isinstance(value[1], str):
             t = value[1].strip()
@@ -1,7 +1,6 @@
 """Business logic for retrieving creative employees from Odoo."""
 from __future__ import annotations
 
-import copy
 import threading
 import time
 from datetime import date, datetime
@@ -25,7 +24,22 @@ _FIELD_SCHEMA_TTL_SECONDS = 600.0
 # collapses those into one Odoo download while staying fresh across requests.
 _CREATIVES_MEMO: Dict[Tuple[str, str, bool, str, str], Tuple[float, List[Dict[str, object]]]] = {}
 _CREATIVES_MEMO_LOCK = threading.Lock()
-_CREATIVES_MEMO_TTL_SECONDS = 60.0
+_CREATIVES_MEMO_TTL_SECONDS = Config.CREATIVES_ROSTER_TTL_SECONDS
+
+
+def invalidate_creatives_memo() -> None:
+    """Drop every memoized roster so the next request re-reads Odoo."""
+    with _CREATIVES_MEMO_LOCK:
+        _CREATIVES_MEMO.clear()
+
+
+def _clone_creatives(creatives: List[Dict[str, object]]) -> List[Dict[str, object]]:
+    """Copy memoized creative records for a caller.
+
+    Records are flat apart from ``tags``, so a per-record dict copy (plus a
+    fresh tags list) isolates callers without the cost of ``deepcopy``.
+    """
+    return [{**creative, "tags": list(creative.get("tags") or ())} for creative in creatives]
 
 
 class EmployeeService:
@@ -58,15 +72,15 @@ class EmployeeService:
         with _CREATIVES_MEMO_LOCK:
             entry = _CREATIVES_MEMO.get(memo_key)
             if entry is not None and (now - entry[0]) < _CREATIVES_MEMO_TTL_SECONDS:
-                # Deep copy: callers enrich these dicts in place, so cached
-                # records must never be handed out by reference.
-                return copy.deepcopy(entry[1])
+                # Callers enrich these dicts in place, so cached records
+                # must never be handed out by reference.
+                return _clone_creatives(entry[1])
 
         creatives = self._fetch_all_creatives(include_inactive)
 
         with _CREATIVES_MEMO_LOCK:
             _CREATIVES_MEMO[memo_key] = (time.monotonic(), creatives)
-        return copy.deepcopy(creatives)
+        return _clone_creatives(creatives)
 
     def _fetch_all_creatives(self, include_inactive: bool = True) -> List[Dict[str, object]]:
         """Download and normalize creative employees from Odoo (uncached)."""
@@ -376,7 +390,7 @@ class EmployeeService:
             return creatives
         # Local import: assignment_service has no dependency back on this
         # module, but keep the coupling out of import time regardless.
-        from .assignment_service import split_assignment_field_tokens
+        from .assignment_service import lowered_assignment_field_tokens
 
         sbu_keys = (
             "current_sub_business_unit",
@@ -391,12 +405,10 @@ class EmployeeService:
             if allowed is None:
                 kept.append(creative)
                 continue
-            tokens: set[str] = set()
-            for key in sbu_keys:
-                tokens.update(
-                    token.lower() for token in split_assignment_field_tokens(creative.get(key))
-                )
-            if tokens & allowed:
+            if any(
+                not allowed.isdisjoint(lowered_assignment_field_tokens(creative.get(key)))
+                for key in sbu_keys
+            ):
                 kept.append(creative)
         return kept
 
@@ -614,14 +626,15 @@ class EmployeeService:
         if isinstance(pool_field, (list, tuple)) and pool_field:
             # Many2many: list of (id, name) records from search_read
             if all(isinstance(item, (list, tuple)) and len(item) >= 2 for item in pool_field):
-                names: List[str] = []
+                # Ordered de-duplication: dict keys keep first-seen order.
+                names: Dict[str, None] = {}
                 for item in pool_field:
                     label = item[1]
                     if label is None or label is False:
                         continue
                     t = str(label).strip()
-                    if t and t not in names:
-                        names.append(t)
+                    if t:
+                        names[t] = None
                 return ", ".join(names) if names else None
             # Many2many / x2m ID list only — cannot display without a separate read
             if all(isinstance(x, int) for x in pool_field):
@@ -886,7 +899,7 @@ class EmployeeService:
             key = name.lower()
             # ilike on the full configured string finds the row without assuming a "creative" substring.
             # Filter to exact name so e.g. "Creative" does not pick "Creative Strategy".
-            rows = self.client.search_read_all(
+            rows = self.client.search_read_iter(
                 "hr.department",
                 domain=[("name", "ilike", name)],
                 fields=["name", "id"],
@@ -1,11 +1,12 @@
 """External hours aggregation from sales orders."""
 from __future__ import annotations
 
-from collections import defaultdict
-from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from calendar import monthrange
+import heapq
 import time
 import os
 import socket
@@ -17,6 +18,43 @@ from .supabase_cache_service import SupabaseCacheService
 _EXTERNAL_USED_HOURS_SERIES_CACHE: Dict[Tuple[int, Optional[int], Optional[int]], Dict[str, Any]] = {}
 _EXTERNAL_USED_HOURS_SERIES_TTL_SECONDS = 60 * 10  # Cache for 10 minutes to avoid repeated Odoo calls.
 
+
+# Every subscription/invoice row carries display strings; monthly hours and
+# invoice amounts repeat heavily, so the formatted labels are memoized.
+@lru_cache(maxsize=2048)
+def _hours_label(value: float) -> str:
+    return f"{value:,.1f}h" if value % 1 else f"{int(value)}h"
+
+
+@lru_cache(maxsize=2048)
+def _currency_label(value: float) -> str:
+    # -0.0 and 0.0 share a cache slot; normalize so both render "0.00 AED".
+    return f"{value + 0.0:,.2f} AED"
+
+
+@dataclass(slots=True)
+class _SalesMarketState:
+    """Running totals for one market while aggregating sales orders."""
+
+    projects: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    total_external_hours: float = 0.0
+    total_aed: float = 0.0
+    total_invoices: int = 0
+
+
+@dataclass(slots=True)
+class _SubscriptionMarketState:
+    """Running totals for one market while aggregating subscriptions."""
+
+    subscriptions: List[Dict[str, Any]] = field(default_factory=list)
+    total_monthly_hours: float = 0.0
+    total_aed: float = 0.0
+    total_subscription_used_hours: float = 0.0
+    # Orders already counted, so multi-invoice orders add their hours once.
+    counted_orders: set[int] = field(default_factory=set)
+    counted_used_orders: set[int] = field(default_factory=set)
+
+
 class ExternalHoursService:
     """Retrieve sales orders and aggregate external hours by market and project."""
 
@@ -56,17 +94,22 @@ class ExternalHoursService:
         if not orders:
             return {"markets": [], "summary": self._empty_summary()}
 
-        orders = [
-            order
-            for order in orders
-            if self._is_sales_order(order) and self._is_confirmed_sale(order)
-        ]
+        # Filter and collect the ids to prefetch in the same pass.
+        sale_orders: List[Dict[str, Any]] = []
+        project_ids: set[int] = set()
+        line_ids: set[int] = set()
+        for order in orders:
+            if not (self._is_sales_order(order) and self._is_confirmed_sale(order)):
+                continue
+            sale_orders.append(order)
+            if order.get("project_id"):
+                project_ids.add(order["project_id"][0])
+            line_ids.update(order.get("order_line", []))
+        orders = sale_orders
         if not orders:
             return {"markets": [], "summary": self._empty_summary()}
 
-        project_ids = {order["project_id"][0] for order in orders if order.get("project_id")}
         projects = self._fetch_projects(project_ids) if project_ids else {}
-        line_ids = {line_id for order in orders for line_id in order.get("order_line", [])}
         lines = self._fetch_order_lines(line_ids) if line_ids else {}
 
         order_hours: Dict[int, float] = {}
@@ -87,7 +130,7 @@ class ExternalHoursService:
         if not order_hours:
             return {"markets": [], "summary": self._empty_summary()}
 
-        market_groups: MutableMapping[str, MutableMapping[str, Dict[str, Any]]] = defaultdict(dict)
+        market_groups: Dict[str, _SalesMarketState] = {}
 
         for order in orders:
             order_id = order["id"]
@@ -109,21 +152,14 @@ class ExternalHoursService:
             tags = self._project_tags(project_meta)
             business_unit, sub_business_unit = self._project_bu_labels(project_meta)
 
-            market_state = market_groups.setdefault(
-                market,
-                {
-                    "market": market,
-                    "projects": {},
-                    "total_external_hours": 0.0,
-                    "total_aed": 0.0,
-                    "total_invoices": 0,
-                },
-            )
+            market_state = market_groups.get(market)
+            if market_state is None:
+                market_state = market_groups[market] = _SalesMarketState()
 
             project_key = project_name
-            project_state = market_state["projects"].setdefault(
-                project_key,
-                {
+            project_state = market_state.projects.get(project_key)
+            if project_state is None:
+                project_state = market_state.projects[project_key] = {
                     "project_id": project_id if isinstance(project_id, int) else None,
                     "project_name": project_name,
                     "agreement_type": agreement_type,
@@ -133,10 +169,9 @@ class ExternalHoursService:
                     "sales_orders": [],
                     "total_external_hours": 0.0,
                     "total_aed": 0.0,
-                },
-            )
+                }
 
-            market_state["total_external_hours"] += hours
+            market_state.total_external_hours += hours
             project_state["total_external_hours"] += hours
             aed_total_value = self._safe_currency_float(order.get("x_studio_aed_total"))
             project_state["total_aed"] += aed_total_value
@@ -152,13 +187,13 @@ class ExternalHoursService:
                     "aed_total_display": self._format_currency(aed_total_value),
                 }
             )
-            market_state["total_aed"] += aed_total_value
-            market_state["total_invoices"] += 1
+            market_state.total_aed += aed_total_value
+            market_state.total_invoices += 1
 
         markets: List[Dict[str, Any]] = []
         for market, state in market_groups.items():
             projects = sorted(
-                state["projects"].values(),
+                state.projects.values(),
                 key=lambda item: item["project_name"].lower(),
             )
             for project in projects:
@@ -170,11 +205,11 @@ class ExternalHoursService:
                 {
                     "market": market,
                     "projects": projects,
-                    "total_external_hours": state["total_external_hours"],
-                    "total_external_hours_display": self._format_hours(state["total_external_hours"]),
-                    "total_aed": state.get("total_aed", 0.0),
-                    "total_aed_display": self._format_currency(state.get("total_aed", 0.0)),
-                    "total_invoices": state.get("total_invoices", 0),
+                    "total_external_hours": state.total_external_hours,
+                    "total_external_hours_display": self._format_hours(state.total_external_hours),
+                    "total_aed": state.total_aed,
+                    "total_aed_display": self._format_currency(state.total_aed),
+                    "total_invoices": state.total_invoices,
                 }
             )
 
@@ -186,9 +221,9 @@ class ExternalHoursService:
         total_invoices = 0
         total_orders = 0
         for state in market_groups.values():
-            total_external_hours += state["total_external_hours"]
-            total_invoices += state.get("total_invoices", 0)
-            for project in state["projects"].values():
+            total_external_hours += state.total_external_hours
+            total_invoices += state.total_invoices
+            for project in state.projects.values():
                 total_projects += 1
                 total_revenue += project.get("total_aed", 0.0)
                 total_orders += len(project.get("sales_orders", []))
@@ -288,10 +323,10 @@ class ExternalHoursService:
             else {}
         )
 
-        market_groups: MutableMapping[str, Dict[str, Any]] = {}
-        counted_order_ids_global: set[int] = set()
+        market_groups: Dict[str, _SubscriptionMarketState] = {}
         total_revenue = 0.0
-        top_client_candidates: Dict[str, Dict[str, Any]] = {}
+        # Keyed by project id, or (market, client) in lowercase for rows without one.
+        top_client_candidates: Dict[Union[int, Tuple[str, str]], Dict[str, Any]] = {}
 
         def update_top_client(
             project_id: Optional[int],
@@ -302,21 +337,20 @@ class ExternalHoursService:
         ) -> None:
             safe_name = self._safe_str(client_name, default="Unassigned Project")
             safe_market = self._safe_str(market_name, default="Unassigned Market")
-            key = (
-                str(project_id)
-                if isinstance(project_id, int)
-                else f"name::{safe_market.lower()}::{safe_name.lower()}"
-            )
-            entry = top_client_candidates.setdefault(
-                key,
-                {
-                    "project_id": project_id if isinstance(project_id, int) else None,
+            has_id = isinstance(project_id, int)
+            name_key = safe_name.lower()
+            key = project_id if has_id else (safe_market.lower(), name_key)
+            entry = top_client_candidates.get(key)
+            if entry is None:
+                entry = top_client_candidates[key] = {
+                    "project_id": project_id if has_id else None,
                     "client_name": safe_name,
                     "market": safe_market,
                     "total_revenue_aed": 0.0,
                     "request_count": 0,
-                },
-            )
+                    # Lowercased once for the ranking tie-break below.
+                    "_name_key": name_key,
+                }
             entry["total_revenue_aed"] += float(revenue_delta or 0.0)
             if not entry.get("market"):
                 entry["market"] = safe_market
@@ -352,18 +386,9 @@ class ExternalHoursService:
             business_unit, sub_business_unit = self._project_bu_labels(project_meta)
             monthly_hours_value = self._safe_float(order.get("x_studio_external_billable_hours_monthly"))
             monthly_hours_display = self._format_hours(monthly_hours_value)
-            market_state = market_groups.setdefault(
-                market,
-                {
-                    "market": market,
-                    "subscriptions": [],
-                    "total_monthly_hours": 0.0,
-                    "total_aed": 0.0,
-                    "total_subscription_used_hours": 0.0,
-                    "_counted_orders": set(),
-                    "_counted_used_orders": set(),
-                },
-            )
+            market_state = market_groups.get(market)
+            if market_state is None:
+                market_state = market_groups[market] = _SubscriptionMarketState()
             project_task_summary = project_task_summaries.get(project_id, {})
             subscription_used_hours = float(project_task_summary.get("total_external_hours", 0.0) or 0.0)
             subscription_used_hours_display = project_task_summary.get(
@@ -403,8 +428,8 @@ class ExternalHoursService:
                         "subscription_used_hours_display": subscription_used_hours_display,
                         "subscription_parent_tasks": subscription_parent_tasks,
                     }
-                    market_state["subscriptions"].append(entry)
-                    market_state["total_aed"] += amount_total
+                    market_state.subscriptions.append(entry)
+                    market_state.total_aed += amount_total
                     update_top_client(
                         project_id if isinstance(project_id, int) else None,
                         project_name,
@@ -437,7 +462,7 @@ class ExternalHoursService:
                     "subscription_used_hours_display": subscription_used_hours_display,
                     "subscription_parent_tasks": subscription_parent_tasks,
                 }
-                market_state["subscriptions"].append(entry)
+                market_state.subscriptions.append(entry)
                 update_top_client(
                     project_id if isinstance(project_id, int) else None,
                     project_name,
@@ -446,22 +471,31 @@ class ExternalHoursService:
                     request_count_value,
                 )
 
-            counted_orders: set[int] = market_state["_counted_orders"]
+            counted_orders = market_state.counted_orders
             if monthly_hours_value > 0 and order_id not in counted_orders:
-                market_state["total_monthly_hours"] += monthly_hours_value
+                market_state.total_monthly_hours += monthly_hours_value
                 counted_orders.add(order_id)
-                counted_order_ids_global.add(order_id)
-            counted_used_orders: set[int] = market_state["_counted_used_orders"]
+            counted_used_orders = market_state.counted_used_orders
             if subscription_used_hours > 0 and order_id not in counted_used_orders:
-                market_state["total_subscription_used_hours"] += subscription_used_hours
+                market_state.total_subscription_used_hours += subscription_used_hours
                 counted_used_orders.add(order_id)
 
         if not market_groups:
             return {"markets": [], "summary": self._empty_subscription_summary(), "top_clients": []}
 
+        # Grand totals accumulate in the same pass that builds the market rows.
         markets: List[Dict[str, Any]] = []
+        total_monthly_hours = 0.0
+        total_subscription_used_hours = 0.0
+        total_parent_tasks = 0
         for market, state in market_groups.items():
-            subscriptions = state["subscriptions"]
+            subscriptions = state.subscriptions
+            total_monthly_hours += state.total_monthly_hours
+            total_subscription_used_hours += state.total_subscription_used_hours
+            for subscription in subscriptions:
+                parent_tasks = subscription.get("subscription_parent_tasks", [])
+                if isinstance(parent_tasks, list):
+                    total_parent_tasks += len(parent_tasks)
             subscriptions.sort(
                 key=lambda item: (
                     item["order_reference"].lower(),
@@ -472,52 +506,39 @@ class ExternalHoursService:
                 {
                     "market": market,
                     "subscriptions": subscriptions,
-                    "total_monthly_hours": state["total_monthly_hours"],
-                    "total_monthly_hours_display": self._format_hours(state["total_monthly_hours"]),
-                    "total_aed": state["total_aed"],
-                    "total_aed_display": self._format_currency(state["total_aed"]),
-                    "total_subscription_used_hours": state["total_subscription_used_hours"],
+                    "total_monthly_hours": state.total_monthly_hours,
+                    "total_monthly_hours_display": self._format_hours(state.total_monthly_hours),
+                    "total_aed": state.total_aed,
+                    "total_aed_display": self._format_currency(state.total_aed),
+                    "total_subscription_used_hours": state.total_subscription_used_hours,
                     "total_subscription_used_hours_display": self._format_hours(
-                        state["total_subscription_used_hours"]
+                        state.total_subscription_used_hours
                     ),
                 }
             )
 
         markets.sort(key=lambda item: item["market"].lower())
 
-        total_monthly_hours = sum(item["total_monthly_hours"] for item in markets)
-        total_subscription_used_hours = sum(item["total_subscription_used_hours"] for item in markets)
-        
-        # Count total parent tasks across all subscriptions
-        total_parent_tasks = 0
-        for market_state in market_groups.values():
-            for subscription in market_state.get("subscriptions", []):
-                parent_tasks = subscription.get("subscription_parent_tasks", [])
-                if isinstance(parent_tasks, list):
-                    total_parent_tasks += len(parent_tasks)
-
-        top_client_entries: List[Dict[str, Any]] = []
-        for candidate in top_client_candidates.values():
-            total_value = float(candidate.get("total_revenue_aed", 0.0) or 0.0)
-            client_name = self._safe_str(candidate.get("client_name"), default="Unassigned Project")
-            market_name = self._safe_str(candidate.get("market"), default="Unassigned Market")
-            request_total = int(candidate.get("request_count", 0) or 0)
-            top_client_entries.append(
+        # Candidates are aggregated while walking the orders; only the five
+        # winners need display formatting.
+        top_clients: List[Dict[str, Any]] = []
+        for candidate in heapq.nsmallest(
+            5,
+            top_client_candidates.values(),
+            key=lambda item: (-item["total_revenue_aed"], item["_name_key"]),
+        ):
+            total_value = candidate["total_revenue_aed"]
+            top_clients.append(
                 {
-                    "project_id": candidate.get("project_id"),
-                    "client_name": client_name,
-                    "market": market_name,
+                    "project_id": candidate["project_id"],
+                    "client_name": candidate["client_name"],
+                    "market": candidate["market"],
                     "total_revenue_aed": total_value,
                     "total_revenue_aed_display": self._format_currency(total_value),
-                    "request_count": request_total,
+                    "request_count": candidate["request_count"],
                 }
             )
 
-        top_clients = sorted(
-            top_client_entries,
-            key=lambda item: (-item["total_revenue_aed"], item["client_name"].lower()),
-        )[:5]
-
         summary = {
             "total_subscriptions": len(active_order_ids),
             "total_monthly_hours": total_monthly_hours,
@@ -552,21 +573,27 @@ class ExternalHoursService:
             max_months: Optional limit on number of trailing months
             force_refresh: If True, refresh all months from Odoo (ignoring cache)
         """
+        # Fallback to in-memory cache only if Supabase is not available. Rows
+        # are flat dicts of scalars, so a per-row dict() copy isolates callers
+        # as fully as deepcopy did.
+        cache_key = (year, upto_month, max_months)
+        if not self._cache_service and not force_refresh:
+            cache_entry = _EXTERNAL_USED_HOURS_SERIES_CACHE.get(cache_key)
+            if cache_entry and time.time() - cache_entry["timestamp"] < _EXTERNAL_USED_HOURS_SERIES_TTL_SECONDS:
+                return [dict(row) for row in cache_entry["data"]]
+
         # Use Supabase cache if available (it handles caching internally)
         # Pass force_refresh to control whether to use cache or refresh from Odoo
         series = self._build_external_used_hours_series(
             year, upto_month=upto_month, max_months=max_months, force_refresh=force_refresh
         )
-        
-        # Fallback to in-memory cache only if Supabase is not available
+
         if not self._cache_service:
-            cache_key = (year, upto_month, max_months)
-            cache_entry = _EXTERNAL_USED_HOURS_SERIES_CACHE.get(cache_key)
-            now = time.time()
-            if cache_entry and now - cache_entry["timestamp"] < _EXTERNAL_USED_HOURS_SERIES_TTL_SECONDS and not force_refresh:
-                return deepcopy(cache_entry["data"])
-            _EXTERNAL_USED_HOURS_SERIES_CACHE[cache_key] = {"timestamp": now, "data": series}
-        
+            _EXTERNAL_USED_HOURS_SERIES_CACHE[cache_key] = {
+                "timestamp": time.time(),
+                "data": [dict(row) for row in series],
+            }
+
         return series
 
     def _build_external_used_hours_series(
@@ -1064,7 +1091,7 @@ class ExternalHoursService:
         return str(value).strip() or default
 
     def _format_hours(self, value: float) -> str:
-        return f"{value:,.1f}h" if value % 1 else f"{int(value)}h"
+        return _hours_label(value)
 
     def _format_agreement_type(self, project: Mapping[str, Any] | None) -> str:
         if not project:
@@ -1088,7 +1115,7 @@ class ExternalHoursService:
         return "Unknown"
 
     def _format_currency(self, value: float) -> str:
-        return f"{value:,.2f} AED"
+        return _currency_label(value)
 
     def _safe_currency_float(self, value: Any) -> float:
         if value is None:
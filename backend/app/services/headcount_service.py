@@ -3,12 +3,57 @@ from __future__ import annotations
 
 from calendar import monthrange
 from datetime import date, datetime
+from functools import partial
 from typing import Any, Dict, List, Optional
 
-from .assignment_service import creative_matches_bu_assignment_filters
+from .assignment_service import bu_assignment_filter
 from .employee_service import EmployeeService
 
 
+def _matches_everything(creative: Dict[str, Any]) -> bool:
+    return True
+
+
+def _matches_market_pool(
+    market_filter: frozenset[str],
+    pool_filter: frozenset[str],
+    creative: Dict[str, Any],
+) -> bool:
+    """Check a creative against lowercased market slugs and pool names (empty = no filter)."""
+    # Get market_slug and pool_name from processed_creatives if available
+    # Otherwise try to get from raw creative data
+    market_slug = creative.get("market_slug")
+    pool_name = creative.get("pool_name")
+
+    # If not in processed_creatives, try to get from raw fields
+    if not market_slug:
+        # Try to get market from current_market or other fields
+        current_market = creative.get("current_market")
+        if current_market:
+            # Convert market name to slug (basic conversion)
+            market_slug = current_market.lower().replace(" ", "-")
+
+    if not pool_name:
+        pool_name = creative.get("current_pool")
+
+    # Market filter: if markets selected, creative must match one
+    if market_filter:
+        if not market_slug:
+            return False
+        # Normalize market slug for comparison
+        normalized_market = market_slug.lower() if isinstance(market_slug, str) else None
+        if normalized_market not in market_filter:
+            return False
+
+    # Pool filter: if pools selected, creative must match one
+    if pool_filter:
+        if not pool_name:
+            return False
+        return pool_name in pool_filter
+
+    return True
+
+
 class HeadcountService:
     """Encapsulates headcount calculation logic for the dashboard."""
 
@@ -75,53 +120,24 @@ class HeadcountService:
             not use_bu_assignment_filters and (selected_markets or selected_pools)
         )
 
-        # Helper function to check if a creative matches the filters
-        def _matches_filters(creative: Dict[str, Any]) -> bool:
-            """Check if creative matches market/pool or BU assignment filters."""
-            if use_bu_assignment_filters:
-                return creative_matches_bu_assignment_filters(
-                    creative,
-                    selected_business_units,
-                    selected_sub_business_units,
-                    selected_pods,
-                )
-            if not selected_markets and not selected_pools:
-                return True
-
-            # Get market_slug and pool_name from processed_creatives if available
-            # Otherwise try to get from raw creative data
-            market_slug = creative.get("market_slug")
-            pool_name = creative.get("pool_name")
-
-            # If not in processed_creatives, try to get from raw fields
-            if not market_slug:
-                # Try to get market from current_market or other fields
-                current_market = creative.get("current_market")
-                if current_market:
-                    # Convert market name to slug (basic conversion)
-                    market_slug = current_market.lower().replace(" ", "-")
-
-            if not pool_name:
-                pool_name = creative.get("current_pool")
-
-            # Market filter: if markets selected, creative must match one
-            market_match = True
-            if selected_markets:
-                if not market_slug:
-                    return False
-                # Normalize market slug for comparison
-                normalized_market = market_slug.lower() if isinstance(market_slug, str) else None
-                market_match = normalized_market in [m.lower() for m in selected_markets]
+        # Normalized once, not per creative.
+        market_filter = frozenset(m.lower() for m in selected_markets or ())
+        pool_filter = frozenset(selected_pools or ())
+        matches_bu = (
+            bu_assignment_filter(selected_business_units, selected_sub_business_units, selected_pods)
+            if use_bu_assignment_filters
+            else None
+        )
 
-            # Pool filter: if pools selected, creative must match one
-            pool_match = True
-            if selected_pools:
-                if not pool_name:
-                    return False
-                pool_match = pool_name in selected_pools
+        # Pick the filter predicate once; the per-creative checks are
+        # module-level functions instead of a closure rebuilt per call.
+        if use_bu_assignment_filters:
+            _matches_filters = matches_bu if matches_bu is not None else _matches_everything
+        elif market_filter or pool_filter:
+            _matches_filters = partial(_matches_market_pool, market_filter, pool_filter)
+        else:
+            _matches_filters = _matches_everything
 
-            return market_match and pool_match
-        
         # Available creatives: those with market/pool assigned AND available_hours > planned_hours
         # Use processed_creatives if provided (has market_display/pool_display), otherwise check raw data
         if processed_creatives:
@@ -185,19 +201,15 @@ class HeadcountService:
         # AND match the filters (must be/were in the filtered market/pool)
         offboarded = []
         
-        # Create a lookup map from processed_creatives by ID for market/pool info
-        processed_lookup = {}
+        # Lookup of processed creatives by ID for market/pool info. Only the
+        # few offboarded creatives read it, so it references the records
+        # instead of copying their assignment fields up front.
+        processed_lookup: Dict[int, Dict[str, Any]] = {}
         if processed_creatives:
             for pc in processed_creatives:
                 pc_id = pc.get("id")
                 if isinstance(pc_id, int):
-                    processed_lookup[pc_id] = {
-                        "market_slug": pc.get("market_slug"),
-                        "pool_name": pc.get("pool_name"),
-                        "business_unit": pc.get("business_unit"),
-                        "sub_business_unit": pc.get("sub_business_unit"),
-                        "pod": pc.get("pod"),
-                    }
+                    processed_lookup[pc_id] = pc
         
         # Check all creatives (including inactive) for offboarded
         for creative in all_creatives:
@@ -211,8 +223,8 @@ class HeadcountService:
                     market_pool_info = processed_lookup[creative_id]
                     creative_with_market = {
                         **creative,
-                        "market_slug": market_pool_info["market_slug"],
-                        "pool_name": market_pool_info["pool_name"],
+                        "market_slug": market_pool_info.get("market_slug"),
+                        "pool_name": market_pool_info.get("pool_name"),
                         "business_unit": market_pool_info.get("business_unit"),
                         "sub_business_unit": market_pool_info.get("sub_business_unit"),
                         "pod": market_pool_info.get("pod"),
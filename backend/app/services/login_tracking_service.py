@@ -80,7 +80,8 @@ class LoginTrackingService:
         user_id: int,
         username: str,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        login_timestamp: Optional[datetime] = None,
     ) -> bool:
         """Log a user login event.
         
@@ -89,6 +90,7 @@ class LoginTrackingService:
             username: Odoo username (email)
             ip_address: Optional IP address of the user
             user_agent: Optional user agent string
+            login_timestamp: When the login happened (UTC); defaults to now
             
         Returns:
             True if logged successfully, False otherwise
@@ -97,7 +99,7 @@ class LoginTrackingService:
             login_data = {
                 "user_id": user_id,
                 "username": username,
-                "login_timestamp": datetime.utcnow().isoformat(),
+                "login_timestamp": (login_timestamp or datetime.utcnow()).isoformat(),
             }
             
             # Add optional fields if provided
@@ -8,6 +8,9 @@ import re
 from ...integrations.odoo_client import OdooClient
 
 
+# Separators between agreement labels in a single value, e.g. "Retainer / Framework".
+_AGREEMENT_SPLIT_RE = re.compile(r"[,/&|]+")
+
 # sale.order.line — Order Date SOL v1; used only for external-hours sales-order scope.
 EXTERNAL_HOURS_SOL_LINE_DATETIME_FIELD = "x_studio_related_field_642_1j455dnkh"
 
@@ -69,18 +72,17 @@ class CommonMixin:
 
     @staticmethod
     def _infer_account_type(tags: Iterable[Any]) -> str:
-        """Infer account type from tag labels."""
-        normalized_tags = []
+        """Infer account type from tag labels (any non-key tag wins over a key-account tag)."""
+        is_key = False
         for tag in tags or []:
-            if isinstance(tag, str):
-                normalized_tags.append(tag.strip().lower())
-        for tag in normalized_tags:
+            if not isinstance(tag, str):
+                continue
+            tag = tag.lower()
             if "non-key" in tag or "non key" in tag:
                 return "non-key"
-        for tag in normalized_tags:
             if "key account" in tag:
-                return "key"
-        return "non-key"
+                is_key = True
+        return "key" if is_key else "non-key"
 
     @staticmethod
     def _canonical_agreement_label(raw: Optional[str]) -> str:
@@ -200,7 +202,7 @@ class CommonMixin:
             stripped = raw.strip()
             if not stripped:
                 return []
-            parts = re.split(r"[,/&|]+", stripped)
+            parts = _AGREEMENT_SPLIT_RE.split(stripped)
             return [part.strip() for part in parts if part.strip()]
         if isinstance(raw, (list, tuple, set)):
             tokens: List[str] = []
@@ -208,17 +208,63 @@ class SubscriptionsMixin:
         
         return subscriptions
 
+    def _subscription_stat_orders(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """Raw sale.order rows behind the subscription statistics for ``start``..``end``.
+
+        Errors are logged and yield an empty list (all-zero statistics).
+        """
+        domain = [
+            "&", "&",
+            ("state", "=", "sale"),
+            ("first_contract_date", "<=", end.isoformat()),
+            "|",
+            ("end_date", "=", False),
+            ("end_date", ">=", start.isoformat()),
+        ]
+        fields = [
+            "id",
+            "name",
+            "start_date",
+            "end_date",
+            "recurring_monthly",
+        ]
+
+        try:
+            return self.odoo_client.search_read_all(
+                model="sale.order",
+                domain=domain,
+                fields=fields,
+            )
+        except Exception as e:
+            print(f"Error fetching subscription statistics: {e}")
+            return []
+
+    def _previous_subscription_stat_orders(self, month_start: date) -> Optional[List[Dict[str, Any]]]:
+        """Prefetch the comparison month's rows for ``get_subscription_statistics``.
+
+        Lets callers start the Odoo query alongside their other lookups
+        instead of after the current-period subscriptions arrive.
+        """
+        previous_bounds = self._previous_month_bounds(month_start)
+        if not previous_bounds:
+            return None
+        return self._subscription_stat_orders(*previous_bounds)
+
     def get_subscription_statistics(
         self,
         month_start: date,
         month_end: date,
         subscriptions: Optional[List[Dict[str, Any]]] = None,
+        *,
+        previous_orders: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Calculate subscription statistics for the selected month.
         
         Args:
             month_start: First day of the month
             month_end: Last day of the month
+            previous_orders: Prefetched comparison-month rows
+                (see ``_previous_subscription_stat_orders``)
             
         Returns:
             Dictionary with:
@@ -227,47 +273,8 @@ class SubscriptionsMixin:
             - new_renew_count: Number of subscriptions where start_date is in the month
             - mrr: Total monthly recurring revenue (sum of recurring_monthly for active subscriptions only)
         """
-        def _default_subscription_stats() -> Dict[str, Any]:
-            return {
-                "active_count": 0,
-                "churned_count": 0,
-                "new_renew_count": 0,
-                "mrr": 0.0,
-                "mrr_display": "AED 0.00",
-                "active_order_names": [],
-                "total_subscriptions": 0,
-                "subscription_comparison": None,
-            }
-
         def _compute_subscription_stats(start: date, end: date, prefetch: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
-            if prefetch is None:
-                domain = [
-                    "&", "&",
-                    ("state", "=", "sale"),
-                    ("first_contract_date", "<=", end.isoformat()),
-                    "|",
-                    ("end_date", "=", False),
-                    ("end_date", ">=", start.isoformat()),
-                ]
-                fields = [
-                    "id",
-                    "name",
-                    "start_date",
-                    "end_date",
-                    "recurring_monthly",
-                ]
-
-                try:
-                    orders = self.odoo_client.search_read_all(
-                        model="sale.order",
-                        domain=domain,
-                        fields=fields,
-                    )
-                except Exception as e:
-                    print(f"Error fetching subscription statistics: {e}")
-                    return _default_subscription_stats()
-            else:
-                orders = prefetch
+            orders = prefetch if prefetch is not None else self._subscription_stat_orders(start, end)
 
             active_count = 0
             churned_count = 0
@@ -320,7 +327,7 @@ class SubscriptionsMixin:
         previous_bounds = self._previous_month_bounds(month_start)
         if previous_bounds:
             prev_start, prev_end = previous_bounds
-            previous_stats = _compute_subscription_stats(prev_start, prev_end)
+            previous_stats = _compute_subscription_stats(prev_start, prev_end, previous_orders)
             current_total = current_stats.get("total_subscriptions", 0)
             previous_total = previous_stats.get("total_subscriptions", 0)
             current_stats["subscription_comparison"] = self._calculate_comparison(current_total, previous_total)
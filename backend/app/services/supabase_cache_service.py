@@ -456,6 +456,68 @@ class SupabaseCacheService:
             print(f"Error saving creative group to Supabase: {e}")
             return None
 
+    def save_creative_groups_bulk(self, groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create and update many creative groups, reporting per-group outcomes.
+
+        Groups with an ``id`` are updated by id exactly like
+        ``save_creative_group`` (an id that matches no row is reported, never
+        created); the rest are created with a single insert. Not atomic: each
+        update is its own request and the insert runs last, so a failure
+        leaves the writes that already succeeded in place.
+
+        Args:
+            groups: Dicts with ``name``, ``creative_ids`` and optional ``id``
+
+        Returns:
+            Dict with ``saved`` (written rows, in request order), ``missing_ids``
+            (update ids that matched no group) and ``failed`` (request indices
+            whose write raised)
+        """
+        def _table():
+            if POSTGREST_AVAILABLE:
+                return self.client.from_("creative_groups")
+            return self.client.table("creative_groups")
+
+        saved: Dict[int, Dict[str, Any]] = {}
+        missing_ids: List[int] = []
+        failed: List[int] = []
+        insert_indices: List[int] = []
+        for index, group in enumerate(groups):
+            group_id = group.get("id")
+            if not group_id:
+                insert_indices.append(index)
+                continue
+            data = {"name": group["name"], "creative_ids": group["creative_ids"]}
+            try:
+                response = _table().update(data).eq("id", group_id).execute()
+            except Exception as e:
+                print(f"Error updating creative group {group_id} in Supabase: {e}")
+                failed.append(index)
+                continue
+            if response.data:
+                saved[index] = response.data[0]
+            else:
+                missing_ids.append(group_id)
+
+        if insert_indices:
+            # PostgREST bulk inserts need every row to share the same keys.
+            rows = [
+                {"name": groups[i]["name"], "creative_ids": groups[i]["creative_ids"]}
+                for i in insert_indices
+            ]
+            try:
+                response = _table().insert(rows).execute()
+                saved.update(zip(insert_indices, response.data or []))
+            except Exception as e:
+                print(f"Error bulk inserting creative groups to Supabase: {e}")
+                failed.extend(insert_indices)
+
+        return {
+            "saved": [saved[i] for i in sorted(saved)],
+            "missing_ids": missing_ids,
+            "failed": failed,
+        }
+
     def delete_creative_group(self, group_id: int) -> bool:
         """Delete a creative group.
         
@@ -5,11 +5,51 @@ from calendar import monthrange
 from concurrent.futures import ThreadPoolExecutor
 import re
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
 
+from ..integrations.odoo_client import OdooClientPool
 from .comparison_service import ComparisonService
 from .planning_service import PlanningService
 
+# Separators between agreement labels in a single value, e.g. "Retainer / Framework".
+_AGREEMENT_SPLIT_RE = re.compile(r"[,/&|]+")
+
+
+def _coerce_str_list(raw: Any) -> list[str]:
+    """Flatten an agreement label or (nested) list of labels to its strings."""
+    if type(raw) is str:
+        return [raw]
+    if isinstance(raw, (list, tuple, set)):
+        labels: list[str] = []
+        for item in raw:
+            labels.extend(_coerce_str_list(item))
+        return labels
+    return []
+
+
+@lru_cache(maxsize=1024)
+def _agreement_category(labels: Tuple[str, ...]) -> str:
+    # Projects share a handful of agreement/tag combinations, so the split and
+    # keyword scan runs once per combination rather than once per task.
+    normalized = [
+        token
+        for label in labels
+        for token in (part.strip().lower() for part in _AGREEMENT_SPLIT_RE.split(label))
+        if token
+    ]
+    for token in normalized:
+        if any(key in token for key in ("retainer", "subscription", "subscr")):
+            return "retainer"
+    for token in normalized:
+        if "framework" in token:
+            return "framework"
+    for token in normalized:
+        if "ad-hoc" in token or "adhoc" in token or "ad hoc" in token:
+            return "ad-hoc"
+
+    return "other"
+
 
 class TasksService:
     """Calculate task statistics from planning slots."""
@@ -23,41 +63,12 @@ class TasksService:
         """Create a TasksService instance from a ComparisonService."""
         return cls(comparison_service)
 
-    def _extract_agreement_tokens(self, raw: Any) -> list[str]:
-        if raw is None:
-            return []
-        if isinstance(raw, str):
-            stripped = raw.strip()
-            if not stripped:
-                return []
-            parts = re.split(r"[,/&|]+", stripped)
-            return [part.strip() for part in parts if part.strip()]
-        if isinstance(raw, (list, tuple, set)):
-            tokens: list[str] = []
-            for item in raw:
-                tokens.extend(self._extract_agreement_tokens(item))
-            return tokens
-        return []
-
     def _categorize_agreement(self, agreement_type: Any, tags: Any = None) -> str:
         """Categorize into ad-hoc, framework, or retainer using labels and tags."""
-        tokens = self._extract_agreement_tokens(agreement_type)
+        labels = _coerce_str_list(agreement_type)
         if isinstance(tags, (list, tuple, set)):
-            for tag in tags:
-                tokens.extend(self._extract_agreement_tokens(tag))
-
-        normalized = [token.lower() for token in tokens if token]
-        for token in normalized:
-            if any(key in token for key in ("retainer", "subscription", "subscr")):
-                return "retainer"
-        for token in normalized:
-            if "framework" in token:
-                return "framework"
-        for token in normalized:
-            if "ad-hoc" in token or "adhoc" in token or "ad hoc" in token:
-                return "ad-hoc"
-
-        return "other"
+            labels.extend(_coerce_str_list(tags))
+        return _agreement_category(tuple(labels))
 
     def calculate_tasks_statistics(
         self,
@@ -70,19 +81,17 @@ class TasksService:
         previous_bounds = self._previous_comparison_bounds(month_start, month_end)
 
         if previous_bounds and self.planning_service:
-            # Fetch both periods side by side. The previous period gets its own
-            # service + client because an XML-RPC connection must not be shared
-            # across threads.
+            # Fetch both periods side by side. The previous period checks out
+            # its own pooled client because an XML-RPC connection must not be
+            # shared across threads.
             prev_start, prev_end = previous_bounds
-            previous_planning_service = PlanningService.from_settings(
-                self.planning_service.client.settings
-            )
-            with ThreadPoolExecutor(max_workers=2) as executor:
+            client_pool = OdooClientPool.for_settings(self.planning_service.client.settings)
+            with client_pool.checkout() as previous_client, ThreadPoolExecutor(max_workers=2) as executor:
                 current_future = executor.submit(
                     self._tasks_for_month, creatives, month_start, month_end
                 )
                 previous_future = executor.submit(
-                    previous_planning_service.tasks_for_month, creatives, prev_start, prev_end
+                    PlanningService(previous_client).tasks_for_month, creatives, prev_start, prev_end
                 )
                 current_tasks = current_future.result()
                 prev_tasks = previous_future.result()
@@ -122,11 +131,13 @@ class TasksService:
         market_counts: Dict[str, int] = {}
         project_ids: set[int] = set()
         all_parent_tasks: set[str] = set()
-        
-        # Sets to track unique parent tasks per category
-        adhoc_parent_tasks: set[str] = set()
-        framework_parent_tasks: set[str] = set()
-        retainer_parent_tasks: set[str] = set()
+
+        # Unique parent tasks per category
+        category_parent_tasks: Dict[str, set[str]] = {
+            "ad-hoc": set(),
+            "framework": set(),
+            "retainer": set(),
+        }
 
         for task in tasks:
             project_id = task.get("project_id")
@@ -135,23 +146,19 @@ class TasksService:
             
             # Aggregate parent tasks
             parent_tasks = task.get("parent_tasks")
-            current_project_parent_tasks: set[str] = set()
-            if isinstance(parent_tasks, list):
-                for pt in parent_tasks:
-                    if pt:
-                        all_parent_tasks.add(pt)
-                        current_project_parent_tasks.add(pt)
+            task_parent_names = [pt for pt in parent_tasks if pt] if isinstance(parent_tasks, list) else []
+            all_parent_tasks.update(task_parent_names)
 
             category = self._categorize_agreement(task.get("agreement_type"), task.get("tags"))
             if category == "ad-hoc":
                 adhoc += 1
-                adhoc_parent_tasks.update(current_project_parent_tasks)
             elif category == "framework":
                 framework += 1
-                framework_parent_tasks.update(current_project_parent_tasks)
             elif category == "retainer":
                 retainer += 1
-                retainer_parent_tasks.update(current_project_parent_tasks)
+            category_bucket = category_parent_tasks.get(category)
+            if category_bucket is not None and task_parent_names:
+                category_bucket.update(task_parent_names)
 
             market_label = str(task.get("market") or "").strip()
             if market_label:
@@ -168,9 +175,9 @@ class TasksService:
             "adhoc": adhoc,
             "framework": framework,
             "retainer": retainer,
-            "adhoc_tasks": len(adhoc_parent_tasks),
-            "framework_tasks": len(framework_parent_tasks),
-            "retainer_tasks": len(retainer_parent_tasks),
+            "adhoc_tasks": len(category_parent_tasks["ad-hoc"]),
+            "framework_tasks": len(category_parent_tasks["framework"]),
+            "retainer_tasks": len(category_parent_tasks["retainer"]),
             "average_per_creator": average_per_creator,
             "average_tasks_per_creator": average_tasks_per_creator,
             "by_market": market_counts,
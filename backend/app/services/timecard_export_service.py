@@ -494,7 +494,11 @@ def _write_overview_sheet(ws, creatives: List[Mapping[str, Any]], sheet_names: L
         "", last_col,
     )
 
-    totals = {key: sum(_num(c.get(key)) for c in creatives) for _, key, _, _ in HOURS_CATEGORIES}
+    keys = [key for _, key, _, _ in HOURS_CATEGORIES]
+    totals = dict.fromkeys(keys, 0.0)
+    for c in creatives:
+        for key in keys:
+            totals[key] += _num(c.get(key))
     available = totals["available_hours"]
     team_logged_pct = (totals["logged_hours"] / available * 100.0) if available > 0 else 0.0
     team_booked_pct = (totals["planned_hours"] / available * 100.0) if available > 0 else 0.0
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 from ..config import OdooSettings
 from ..integrations.odoo_client import OdooClient
@@ -24,43 +24,63 @@ class TimesheetService:
         month_start: date,
         month_end: date,
     ) -> Dict[int, float]:
+        return self.logged_hours_for_periods(employees, [(month_start, month_end)])[0]
+
+    def logged_hours_for_periods(
+        self,
+        employees: Sequence[Mapping[str, Any]],
+        periods: Sequence[Tuple[date, date]],
+    ) -> List[Dict[int, float]]:
+        """Logged hours per employee for each ``(start, end)`` period, in order.
+
+        One query covers the span of all periods and rows are bucketed by
+        date, so adjacent periods (e.g. the viewed and previous month) cost a
+        single round-trip.
+        """
         employee_ids = self._extract_employee_ids(employees)
-        if not employee_ids:
-            return {}
+        if not employee_ids or not periods:
+            return [{} for _ in periods]
 
+        # ISO date strings compare in date order, matching Odoo's date values.
+        bounds = [(start.isoformat(), end.isoformat()) for start, end in periods]
         domain = [
             ("employee_id", "in", list(employee_ids)),
-            ("date", ">=", month_start.isoformat()),
-            ("date", "<=", month_end.isoformat()),
+            ("date", ">=", min(start for start, _ in bounds)),
+            ("date", "<=", max(end for _, end in bounds)),
         ]
-        fields = ["employee_id", "task_id", "unit_amount"]
+        fields = ["employee_id", "task_id", "unit_amount", "date"]
 
-        totals: MutableMapping[int, float] = {emp_id: 0.0 for emp_id in employee_ids}
+        totals: List[MutableMapping[int, float]] = [{} for _ in periods]
         # Large chunk: a month of timesheets spans thousands of rows and the
         # cost per round-trip is dominated by latency, not payload.
-        for batch in self.client.search_read_chunked(
+        columns = self.client.search_read_columns(
             "account.analytic.line",
             domain=domain,
             fields=fields,
             order="date asc, id asc",
             chunk_size=2000,
+        )
+        for employee_value, task_value, hours_value, date_value in zip(
+            columns["employee_id"], columns["task_id"], columns["unit_amount"], columns["date"]
         ):
-            for record in batch:
-                employee_id = self._parse_employee_id(record.get("employee_id"))
-                if employee_id is None or employee_id not in employee_ids:
-                    continue
+            employee_id = self._parse_employee_id(employee_value)
+            if employee_id is None or employee_id not in employee_ids:
+                continue
 
-                task_name = self._parse_task_name(record.get("task_id"))
-                if task_name and task_name.strip().lower() == "time off":
-                    continue
+            task_name = self._parse_task_name(task_value)
+            if task_name and task_name.strip().lower() == "time off":
+                continue
 
-                hours = self._parse_hours(record.get("unit_amount"))
-                if hours <= 0:
-                    continue
+            hours = self._parse_hours(hours_value)
+            if hours <= 0:
+                continue
 
-                totals[employee_id] = totals.get(employee_id, 0.0) + hours
+            day = str(date_value or "")[:10]
+            for period_totals, (start, end) in zip(totals, bounds):
+                if start <= day <= end:
+                    period_totals[employee_id] = period_totals.get(employee_id, 0.0) + hours
 
-        return {emp_id: totals.get(emp_id, 0.0) for emp_id in employee_ids if totals.get(emp_id, 0.0) > 0}
+        return [dict(period_totals) for period_totals in totals]
 
     def _extract_employee_ids(self, employees: Iterable[Mapping[str, Any]]) -> set[int]:
         ids: set[int] = set()
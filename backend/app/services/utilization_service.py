@@ -5,6 +5,7 @@ import threading
 from calendar import monthrange
 from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 # Earliest month we store in Supabase for utilization (matches creatives.MIN_MONTH).
@@ -42,6 +43,7 @@ def _inclusive_month_tuple_sequence(month_lo: date, month_hi: date) -> List[Tupl
             m += 1
     return out
 
+from ..integrations.odoo_client import OdooClientPool
 from .assignment_service import resolve_business_unit_for_month, use_business_unit_model
 from .availability_service import AvailabilityService
 from .employee_service import EmployeeService
@@ -157,6 +159,32 @@ POOL_DEFINITIONS = [
     {"slug": "ksa", "label": "KSA"},
     {"slug": "uae", "label": "UAE"},
 ]
+# Tag-matched (legacy) pools as (slug, label, tag); market pools have no tag.
+_TAGGED_POOLS = tuple(
+    (pool["slug"], pool["label"], pool["tag"]) for pool in POOL_DEFINITIONS if pool.get("tag")
+)
+# Market names (lowercased) recognised as pool slugs.
+_POOL_MARKET_MAPPING = {
+    "ksa": "ksa",
+    "uae": "uae",
+    "shared": "shared",  # Add shared as a valid market,
+}
+
+
+def _normalized_tags(tags: Sequence[Any]) -> Tuple[str, ...]:
+    return tuple(tag.strip().lower() for tag in tags if isinstance(tag, str) and tag.strip())
+
+
+@lru_cache(maxsize=4096)
+def _pool_for_tags(tags: Tuple[str, ...]) -> Optional[Tuple[str, str]]:
+    """First tag-matched pool ``(slug, label)`` for normalized tags (substring match).
+
+    Creatives share a handful of tag combinations, so results are memoized.
+    """
+    for slug, label, pool_tag in _TAGGED_POOLS:
+        if any(pool_tag in tag for tag in tags):
+            return slug, label
+    return None
 
 
 class UtilizationService:
@@ -422,16 +450,10 @@ class UtilizationService:
         
         normalized = str(market_name).strip().lower()
         
-        market_mapping = {
-            "ksa": "ksa",
-            "uae": "uae",
-            "shared": "shared",  # Add shared as a valid market,
-        }
-        
-        if normalized in market_mapping:
-            return market_mapping[normalized]
+        if normalized in _POOL_MARKET_MAPPING:
+            return _POOL_MARKET_MAPPING[normalized]
         
-        for key, value in market_mapping.items():
+        for key, value in _POOL_MARKET_MAPPING.items():
             if key in normalized or normalized in key:
                 return value
         
@@ -453,27 +475,8 @@ class UtilizationService:
         if not tags:
             return None
         
-        normalized = [
-            str(tag).strip().lower()
-            for tag in tags
-            if isinstance(tag, str) and tag.strip()
-        ]
-        if not normalized:
-            return None
-        
-        for pool in POOL_DEFINITIONS:
-            tag = pool.get("tag")
-            if tag and self._match_pool(normalized, tag):
-                return pool["slug"]
-        
-        return None
-
-    def _match_pool(self, tags: List[str] | None, target: str) -> bool:
-        """Check if creative tags match the target pool tag."""
-        if not tags:
-            return False
-        normalized = [str(tag).lower() for tag in tags if isinstance(tag, str)]
-        return any(target in tag for tag in normalized)
+        match = _pool_for_tags(_normalized_tags(tags))
+        return match[0] if match else None
 
     def _format_hours(self, value: float) -> str:
         """Format hours as 'XXXh' or 'XXXh YYm'."""
@@ -632,21 +635,20 @@ class UtilizationService:
                         }
                     )
             else:
-                # Calculate from scratch. Each month builds its own services and
+                # Calculate from scratch. Each month checks out its own pooled
                 # Odoo client because concurrent months must not share one
-                # XML-RPC connection (same isolation the routes layer uses).
-                availability_service = AvailabilityService.from_settings(odoo_settings)
-                planning_service = PlanningService.from_settings(odoo_settings)
-                timesheet_service = TimesheetService.from_settings(odoo_settings)
-                summaries = availability_service.calculate_monthly_availability(
-                    creatives, month_start, month_end
-                )
-                planned_hours = planning_service.planned_hours_for_month(
-                    creatives, month_start, month_end
-                )
-                logged_hours = timesheet_service.logged_hours_for_month(
-                    creatives, month_start, month_end
-                )
+                # XML-RPC connection; returning it keeps the login and warm
+                # connection for the next month/request.
+                with OdooClientPool.for_settings(odoo_settings).checkout() as month_client:
+                    summaries = AvailabilityService(month_client).calculate_monthly_availability(
+                        creatives, month_start, month_end
+                    )
+                    planned_hours = PlanningService(month_client).planned_hours_for_month(
+                        creatives, month_start, month_end
+                    )
+                    logged_hours = TimesheetService(month_client).logged_hours_for_month(
+                        creatives, month_start, month_end
+                    )
                 
                 creative_breakdown = []
                 cache_payload_rows: List[Dict[str, Any]] = []
@@ -705,16 +707,9 @@ class UtilizationService:
                         if not pool_name:
                             tags = creative.get("tags", [])
                             if tags:
-                                normalized_tags = [
-                                    str(tag).strip().lower()
-                                    for tag in tags
-                                    if isinstance(tag, str)
-                                ]
-                                for pool_def in POOL_DEFINITIONS:
-                                    pool_tag = pool_def.get("tag")
-                                    if pool_tag and any(pool_tag in tag for tag in normalized_tags):
-                                        pool_name = pool_def.get("label")
-                                        break
+                                match = _pool_for_tags(_normalized_tags(tags))
+                                if match:
+                                    pool_name = match[1]
 
                     utilization_percent = round((logged / available) * 100.0, 2)
 
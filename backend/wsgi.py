@@ -1,10 +1,11 @@
 """WSGI entry-point for running the Flask app."""
 import os
-from dotenv import load_dotenv
+
+from backend.app import create_app, load_environment
 
 # Load environment variables BEFORE creating the app
 # This is critical for Railway/gunicorn deployments
-load_dotenv()
+load_environment()
 
 # Log Supabase configuration status (without exposing credentials)
 supabase_url = os.getenv("SUPABASE_URL")
@@ -19,8 +20,6 @@ else:
         missing.append("SUPABASE_KEY")
     print(f"⚠ Warning: Missing Supabase environment variables: {', '.join(missing)}")
 
-from backend.app import create_app
-
 app = create_app()
 
 